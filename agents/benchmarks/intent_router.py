@@ -0,0 +1,95 @@
+"""
+Orchestrator intent router evaluation and latency benchmark
+
+Scores the local IntentRouter on the held-out evaluation set: how many
+inputs it routes itself (coverage), how many of those go to the right
+agent (and SME), and how long a routing decision takes on CPU. Inputs it
+defers go to the LLM router, which costs a full model round-trip.
+
+Usage (from the repository root):
+    python -m agents.benchmarks.intent_router
+    python -m agents.benchmarks.intent_router --threshold 0.8 --iterations 20000 --verbose
+"""
+import argparse
+import time
+from typing import List
+
+from agents.orchestrator.intent_examples import EVALUATION_EXAMPLES
+from agents.orchestrator.intent_router import IntentRouter
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def evaluate(router: IntentRouter, verbose: bool = False) -> dict:
+    """Coverage and accuracy on the evaluation set"""
+    routed = correct = top1_correct = 0
+    for text, intent, sme_id in EVALUATION_EXAMPLES:
+        top_intent, confidence, top_sme = router.classify(text)
+        top1_correct += top_intent == intent and (intent != "sme" or top_sme == sme_id)
+        
+        decision = router.route(text)
+        if decision is None:
+            if verbose:
+                print(f"  llm      {confidence:.2f}  {text}")
+            continue
+        
+        routed += 1
+        ok = decision.intent == intent and (intent != "sme" or decision.sme_id == sme_id)
+        correct += ok
+        if verbose and not ok:
+            print(f"  WRONG    {decision.intent} {decision.sme_id or ''} (expected {intent} {sme_id or ''})  {text}")
+    
+    total = len(EVALUATION_EXAMPLES)
+    return {
+        "examples": total,
+        "top1_accuracy": round(top1_correct / total, 3),
+        "coverage": round(routed / total, 3),
+        "routed_accuracy": round(correct / routed, 3) if routed else 0.0,
+        "llm_fallbacks": total - routed,
+    }
+
+
+def measure_latency(router: IntentRouter, iterations: int) -> dict:
+    """Per-decision latency over repeated passes of the evaluation set"""
+    texts = [text for text, _, _ in EVALUATION_EXAMPLES]
+    latencies: List[float] = []
+    for i in range(iterations):
+        text = texts[i % len(texts)]
+        t0 = time.perf_counter()
+        router.route(text)
+        latencies.append(time.perf_counter() - t0)
+    
+    return {
+        "route_p50_us": round(_percentile(latencies, 50) * 1e6, 1),
+        "route_p99_us": round(_percentile(latencies, 99) * 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Intent router evaluation and benchmark")
+    parser.add_argument("--threshold", type=float, default=0.9, help="Confidence needed to skip the LLM")
+    parser.add_argument("--min-known", type=float, default=0.7, help="Share of known words needed to skip the LLM")
+    parser.add_argument("--iterations", type=int, default=10000, help="Routing decisions to time")
+    parser.add_argument("--verbose", action="store_true", help="Print deferred and misrouted inputs")
+    args = parser.parse_args()
+    
+    t0 = time.perf_counter()
+    router = IntentRouter(threshold=args.threshold, min_known=args.min_known)
+    report = {"train_ms": round((time.perf_counter() - t0) * 1000, 2)}
+    report.update(evaluate(router, args.verbose))
+    report.update(measure_latency(router, args.iterations))
+    
+    width = max(len(k) for k in report)
+    for key, value in report.items():
+        print(f"{key:<{width}}  {value}")
+
+
+if __name__ == "__main__":
+    main()
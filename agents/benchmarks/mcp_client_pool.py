@@ -0,0 +1,121 @@
+"""
+MCP client connection pooling micro-benchmark
+
+Starts a stub JSON-RPC server in-process and measures per-call latency of
+MCPClient.call_tool with its pooled keep-alive client against the previous
+behaviour of opening a fresh httpx.AsyncClient for every call.
+
+Usage (from the repository root):
+    python -m agents.benchmarks.mcp_client_pool --calls 500
+    python -m agents.benchmarks.mcp_client_pool --calls 2000 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+
+from agents.shared.mcp_client import MCPClient
+
+stub = FastAPI()
+
+
+@stub.post("/rpc")
+async def rpc(request: Request):
+    """Echo a JSON-RPC result"""
+    body = await request.json()
+    return {"jsonrpc": "2.0", "id": body.get("id"), "result": {"method": body.get("method")}}
+
+
+async def _unpooled_call(url: str):
+    """Previous MCPClient.call_tool behaviour: a new client (and connection) per call"""
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        response = await client.post(
+            f"{url}/rpc",
+            json={"jsonrpc": "2.0", "method": "bench/echo", "params": {}, "id": 1},
+        )
+        response.raise_for_status()
+        return response.json().get("result", {})
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def _measure(call: Callable[[], Awaitable], calls: int, concurrency: int) -> dict:
+    """Run `calls` calls with bounded concurrency and summarise latency"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    
+    async def _one():
+        async with semaphore:
+            t0 = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - t0)
+    
+    start = time.perf_counter()
+    await asyncio.gather(*[_one() for _ in range(calls)])
+    elapsed = time.perf_counter() - start
+    
+    return {
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 3),
+        "calls_per_s": round(calls / elapsed, 1),
+    }
+
+
+async def run(args) -> dict:
+    """Run both modes against the stub server and return the report"""
+    config = uvicorn.Config(stub, host="127.0.0.1", port=0, log_level="warning")
+    server = uvicorn.Server(config)
+    server_task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+    url = f"http://127.0.0.1:{server.servers[0].sockets[0].getsockname()[1]}"
+    
+    pooled = MCPClient(url, max_connections=max(args.concurrency, 1), max_keepalive_connections=max(args.concurrency, 1))
+    
+    # Warm up both paths (imports, first connection)
+    await _unpooled_call(url)
+    await pooled.call_tool("bench", "echo", {})
+    
+    report = {}
+    for name, call in (
+        ("unpooled", lambda: _unpooled_call(url)),
+        ("pooled", lambda: pooled.call_tool("bench", "echo", {})),
+    ):
+        for key, value in (await _measure(call, args.calls, args.concurrency)).items():
+            report[f"{name}_{key}"] = value
+    
+    if report["pooled_p50_ms"]:
+        report["p50_speedup"] = round(report["unpooled_p50_ms"] / report["pooled_p50_ms"], 2)
+    
+    await pooled.aclose()
+    server.should_exit = True
+    await server_task
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP client pooling benchmark")
+    parser.add_argument("--calls", type=int, default=500, help="Tool calls per mode")
+    parser.add_argument("--concurrency", type=int, default=1, help="Calls in flight at once")
+    args = parser.parse_args()
+    
+    report = asyncio.run(run(args))
+    
+    width = max(len(k) for k in report)
+    for key, value in report.items():
+        print(f"{key:<{width}}  {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,15 @@ Chat Agent - Conversational AI Assistant
 Using ADK v1.19.0 patterns from auto-insurance-agent example
 """
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from google import genai
 from google.genai.types import Tool, FunctionDeclaration, Schema, Type
 
 from agents.shared.config import get_config
-from agents.shared.mcp_client import MCPClient
+from agents.shared.session_manager import SessionManager
+from agents.shared.clients import get_genai_client, get_mcp_client
+from agents.shared.tool_dispatch import ToolDispatcher
 from agents.interaction.prompts import CHAT_SYSTEM_INSTRUCTION
 
 logger = logging.getLogger(__name__)
@@ -24,21 +26,37 @@ class ChatAgent:
     def __init__(self):
         self.config = get_config()
         
-        # Initialize Gemini client with Vertex AI
-        self.client = genai.Client(
-            vertexai=True,
-            project=self.config.project_id,
-            location=self.config.location,
-        )
+        # Shared MCP connection pool
+        self.mcp_client = get_mcp_client()
+        
+        # Function calls from the model, run concurrently per turn
+        self.tools = ToolDispatcher({
+            "analyze_sme": lambda args: self.analyze_sme(args.get("sme_id")),
+            "run_scenario": lambda args: self.run_scenario(args.get("description")),
+            "get_portfolio_metrics": lambda args: self.get_portfolio_metrics(),
+            "get_news_intelligence": lambda args: self.get_news_intelligence(args.get("sme_id")),
+        }, max_concurrency=self.config.tool_concurrency)
         
-        # Initialize MCP client
-        self.mcp_client = MCPClient(self.config.mcp_server_url)
+        # ADK agent is built on first use
+        self._agent: Optional[genai.Agent] = None
         
-        # Create agent with tools
-        self.agent = self._create_agent()
+        # Conversation sessions reused per session_id
+        self.sessions = SessionManager.from_config(lambda: self.agent, self.config)
         
         logger.info("Chat Agent initialized")
     
+    @property
+    def agent(self) -> genai.Agent:
+        """ADK agent (created on first use)"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
+    
+    @property
+    def is_warm(self) -> bool:
+        """Whether the ADK agent has been built"""
+        return self._agent is not None
+    
     def _create_agent(self) -> genai.Agent:
         """Create agent with tools following ADK v1.19.0 pattern"""
         
@@ -101,7 +119,7 @@ class ChatAgent:
         ]
         
         # Create and return agent
-        agent = self.client.adk.agents.create(
+        agent = get_genai_client().adk.agents.create(
             model=self.config.model_name,
             system_instruction=CHAT_SYSTEM_INSTRUCTION,
             tools=tools,
@@ -120,45 +138,25 @@ class ChatAgent:
         
         logger.info(f"Analyzing SME: {sme_id}")
         
-        # Gather data from multiple MCP sources
-        results = {}
-        
-        # LinkedIn data
-        linkedin_data = await self.mcp_client.call_tool(
-            "linkedin_server",
-            "get_employee_count",
-            {"sme_id": sme_id.replace("#", "")}
-        )
-        results["linkedin"] = linkedin_data
-        
-        # Recent departures
-        departures = await self.mcp_client.call_tool(
-            "linkedin_server",
-            "get_recent_departures",
-            {"sme_id": sme_id.replace("#", ""), "days": 30}
-        )
-        results["recent_departures"] = departures
-        
-        # Companies House data
-        company_info = await self.mcp_client.call_tool(
-            "companies_house_server",
-            "get_company_info",
-            {"sme_id": sme_id.replace("#", "")}
-        )
-        results["companies_house"] = company_info
-        
-        # BigQuery - SME metrics
-        sme_data = await self.mcp_client.call_tool(
-            "bigquery_server",
-            "get_sme_data",
-            {"sme_id": sme_id.replace("#", "")}
-        )
-        results["sme_data"] = sme_data
+        # Gather data from multiple MCP sources concurrently; a slow or failing
+        # source is reported as unavailable instead of failing the analysis
+        raw_id = sme_id.replace("#", "")
+        results, unavailable = await self.mcp_client.fan_out({
+            # LinkedIn data
+            "linkedin": ("linkedin_server", "get_employee_count", {"sme_id": raw_id}),
+            # Recent departures
+            "recent_departures": ("linkedin_server", "get_recent_departures", {"sme_id": raw_id, "days": 30}),
+            # Companies House data
+            "companies_house": ("companies_house_server", "get_company_info", {"sme_id": raw_id}),
+            # BigQuery - SME metrics
+            "sme_data": ("bigquery_server", "get_sme_data", {"sme_id": raw_id}),
+        })
         
         return {
             "sme_id": sme_id,
             "analysis": results,
-            "summary": self._summarize_sme_analysis(results)
+            "unavailable_sources": unavailable,
+            "summary": self._summarize_sme_analysis(results, unavailable)
         }
     
     async def run_scenario(self, description: str) -> Dict[str, Any]:
@@ -212,12 +210,12 @@ class ChatAgent:
         
         return news
     
-    def _summarize_sme_analysis(self, results: Dict[str, Any]) -> str:
+    def _summarize_sme_analysis(self, results: Dict[str, Any], unavailable: List[str]) -> str:
         """Summarize SME analysis results"""
         summary_parts = []
         
         # LinkedIn summary
-        if "linkedin" in results and not results["linkedin"].get("error"):
+        if "linkedin" in results and "linkedin" not in unavailable:
             linkedin = results["linkedin"]
             summary_parts.append(
                 f"Employee count: {linkedin.get('employee_count', 'N/A')}, "
@@ -225,7 +223,7 @@ class ChatAgent:
             )
         
         # Departures
-        if "recent_departures" in results and not results["recent_departures"].get("error"):
+        if "recent_departures" in results and "recent_departures" not in unavailable:
             departures = results["recent_departures"]
             if isinstance(departures, list) and len(departures) > 0:
                 summary_parts.append(
@@ -233,13 +231,17 @@ class ChatAgent:
                 )
         
         # SME data
-        if "sme_data" in results and not results["sme_data"].get("error"):
+        if "sme_data" in results and "sme_data" not in unavailable:
             sme = results["sme_data"]
             summary_parts.append(
                 f"Risk Score: {sme.get('risk_score', 'N/A')}, "
                 f"Category: {sme.get('risk_category', 'N/A')}"
             )
         
+        # Partial results: say what is missing rather than failing
+        if unavailable:
+            summary_parts.append(f"Unavailable: {', '.join(unavailable)}")
+        
         return " | ".join(summary_parts) if summary_parts else "No data available"
     
     async def process_query(self, user_query: str, session_id: str = "default") -> str:
@@ -256,41 +258,23 @@ class ChatAgent:
         logger.info(f"Processing query: {user_query}")
         
         try:
-            # Start agent session
-            session = self.agent.start_session(session_id=session_id)
-            
-            # Send user query
-            response = session.send_message(user_query)
-            
-            # Process any function calls
-            while response.function_calls:
-                function_responses = []
+            # Reuse (or start) the agent session for this conversation
+            async with self.sessions.session(session_id) as session:
+                # Send user query
+                response = await session.send_message(user_query)
                 
-                for fc in response.function_calls:
-                    logger.info(f"Agent calling function: {fc.name}")
+                # Process any function calls
+                while response.function_calls:
+                    logger.info(f"Agent calling functions: {[fc.name for fc in response.function_calls]}")
                     
-                    # Execute the function
-                    if fc.name == "analyze_sme":
-                        result = await self.analyze_sme(fc.args.get("sme_id"))
-                    elif fc.name == "run_scenario":
-                        result = await self.run_scenario(fc.args.get("description"))
-                    elif fc.name == "get_portfolio_metrics":
-                        result = await self.get_portfolio_metrics()
-                    elif fc.name == "get_news_intelligence":
-                        result = await self.get_news_intelligence(fc.args.get("sme_id"))
-                    else:
-                        result = {"error": f"Unknown function: {fc.name}"}
+                    # Execute the functions
+                    function_responses = await self.tools.dispatch(response.function_calls)
                     
-                    function_responses.append({
-                        "id": fc.id,
-                        "result": result
-                    })
+                    # Send function results back to agent
+                    response = await session.send_message(function_responses)
                 
-                # Send function results back to agent
-                response = session.send_message(function_responses)
-            
-            # Return final text response
-            return response.text
+                # Return final text response
+                return response.text
             
         except Exception as e:
             logger.error(f"Error processing query: {e}")
@@ -7,6 +7,7 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
 from agents.interaction.chat_agent import ChatAgent
+from agents.shared import clients, llm
 from agents.shared.config import get_config
 
 # Setup logging
@@ -24,7 +25,7 @@ chat_agent = ChatAgent()
 class ChatRequest(BaseModel):
     """Chat request model"""
     message: str
-    session_id: str = "default"
+    session_id: str
 
 
 class ChatResponse(BaseModel):
@@ -33,6 +34,13 @@ class ChatResponse(BaseModel):
     session_id: str
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled MCP connections and the LLM thread pool"""
+    await clients.aclose()
+    llm.shutdown()
+
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     """Process chat message"""
@@ -51,12 +59,34 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/tool-stats")
+async def tool_stats():
+    """Per-tool call counts and timings"""
+    return chat_agent.tools.get_stats()
+
+
+@app.get("/sessions")
+async def session_stats():
+    """Agent session counts, eviction metrics and per-session tokens and memory"""
+    return chat_agent.sessions.get_stats()
+
+
 @app.get("/health")
 async def health():
     """Health check"""
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def ready():
+    """Readiness check with warm state (cold parts are built on first request)"""
+    return {
+        "status": "ready",
+        "clients": clients.status(),
+        "agents": {"chat": chat_agent.is_warm},
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8080)
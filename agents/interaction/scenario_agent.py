@@ -4,13 +4,15 @@ Uses ADK v1.19.0 for portfolio-wide what-if analysis
 """
 import logging
 import asyncio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from google import genai
 from google.genai.types import Tool, FunctionDeclaration, Schema, Type
 
+from agents.shared import llm
 from agents.shared.config import get_config
-from agents.shared.mcp_client import MCPClient
+from agents.shared.clients import get_genai_client, get_mcp_client
+from agents.shared.tool_dispatch import ToolDispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -24,21 +26,38 @@ class ScenarioAgent:
     def __init__(self):
         self.config = get_config()
         
-        # Initialize Gemini client
-        self.client = genai.Client(
-            vertexai=True,
-            project=self.config.project_id,
-            location=self.config.location,
-        )
+        # Shared MCP connection pool
+        self.mcp_client = get_mcp_client()
         
-        # Initialize MCP client
-        self.mcp_client = MCPClient(self.config.mcp_server_url)
+        # Function calls from the model, run concurrently per turn
+        self.tools = ToolDispatcher({
+            "evaluate_scenario": lambda args: self.evaluate_scenario(
+                args.get("scenario_type"),
+                args.get("parameters", {})
+            ),
+            "calculate_sme_impact": lambda args: self.calculate_sme_impact(
+                args.get("sme_id"),
+                args.get("scenario_parameters", {})
+            ),
+        }, max_concurrency=self.config.tool_concurrency)
         
-        # Create agent
-        self.agent = self._create_agent()
+        # ADK agent is built on first use
+        self._agent: Optional[genai.Agent] = None
         
         logger.info("Scenario Agent initialized")
     
+    @property
+    def agent(self) -> genai.Agent:
+        """ADK agent (created on first use)"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
+    
+    @property
+    def is_warm(self) -> bool:
+        """Whether the ADK agent has been built"""
+        return self._agent is not None
+    
     def _create_agent(self) -> genai.Agent:
         """Create agent with scenario analysis tools"""
         
@@ -46,8 +65,8 @@ class ScenarioAgent:
             Tool(
                 function_declarations=[
                     FunctionDeclaration(
-                        name="identify_affected_smes",
-                        description="Identify SMEs affected by a scenario based on parameters",
+                        name="evaluate_scenario",
+                        description="Run a scenario across the whole portfolio: finds affected SMEs, scores them all and returns the portfolio impact and top impacted SMEs",
                         parameters=Schema(
                             type=Type.OBJECT,
                             properties={
@@ -65,7 +84,7 @@ class ScenarioAgent:
                     ),
                     FunctionDeclaration(
                         name="calculate_sme_impact",
-                        description="Calculate impact of scenario on specific SME",
+                        description="Calculate impact of scenario on one specific SME (only for single-SME follow-ups)",
                         parameters=Schema(
                             type=Type.OBJECT,
                             properties={
@@ -81,20 +100,6 @@ class ScenarioAgent:
                             required=["sme_id", "scenario_parameters"]
                         )
                     ),
-                    FunctionDeclaration(
-                        name="aggregate_portfolio_impact",
-                        description="Aggregate individual SME impacts to portfolio level",
-                        parameters=Schema(
-                            type=Type.OBJECT,
-                            properties={
-                                "sme_impacts": Schema(
-                                    type=Type.ARRAY,
-                                    description="List of individual SME impact results"
-                                ),
-                            },
-                            required=["sme_impacts"]
-                        )
-                    ),
                 ]
             )
         ]
@@ -103,10 +108,8 @@ class ScenarioAgent:
 
 Your role is to:
 1. Understand the scenario description and parameters
-2. Identify affected SMEs based on scenario type
-3. Calculate impact for each affected SME
-4. Aggregate results to portfolio level
-5. Generate actionable insights
+2. Evaluate the scenario across the portfolio
+3. Generate actionable insights
 
 Scenario Types:
 - interest_rate: Changes in interest rates affecting variable rate loans
@@ -117,14 +120,15 @@ Scenario Types:
 
 Process:
 1. Parse scenario description to extract type and parameters
-2. Use identify_affected_smes to find relevant SMEs
-3. Use calculate_sme_impact for each affected SME
-4. Use aggregate_portfolio_impact to generate final results
+2. Call evaluate_scenario once; it scores every affected SME server-side
+3. Narrate the portfolio impact and top impacted SMEs it returns
+
+Do not call calculate_sme_impact per SME; use it only when asked about one specific SME.
 
 Provide clear before/after comparisons and identify top impacted SMEs.
 """
         
-        return self.client.adk.agents.create(
+        return get_genai_client().adk.agents.create(
             model=self.config.model_name,
             system_instruction=system_instruction,
             tools=tools,
@@ -199,6 +203,53 @@ Provide clear before/after comparisons and identify top impacted SMEs.
             "category_after": self._get_category(new_score_value),
         }
     
+    async def evaluate_scenario(
+        self,
+        scenario_type: str,
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Score every affected SME in one batch MCP call and aggregate
+        
+        Replaces one calculate_sme_impact function call (and two MCP
+        requests) per SME with a single model round-trip.
+        """
+        logger.info(f"Evaluating {scenario_type} scenario across portfolio")
+        
+        sme_ids = await self.identify_affected_smes(scenario_type, parameters)
+        
+        result = await self.mcp_client.call_tool(
+            "vertex_ai_server",
+            "batch_predict_scenario_impact",
+            {
+                "sme_ids": [sme_id.replace("#", "") for sme_id in sme_ids],
+                "scenario_parameters": parameters
+            }
+        )
+        if "error" in result:
+            return {"error": result["error"], "scenario_type": scenario_type}
+        
+        sme_impacts = [
+            {
+                "sme_id": p["sme_id"],
+                "sme_name": p["sme_name"],
+                "score_before": p["current_score"],
+                "score_after": p["predicted_score"],
+                "change": p["change"],
+                "category_before": self._get_category(p["current_score"]),
+                "category_after": self._get_category(p["predicted_score"]),
+            }
+            for p in result.get("predictions", [])
+        ]
+        
+        aggregate = await self.aggregate_portfolio_impact(sme_impacts)
+        return {
+            "scenario_type": scenario_type,
+            "parameters": parameters,
+            **aggregate,
+            "not_found": result.get("not_found", []),
+        }
+    
     async def aggregate_portfolio_impact(
         self,
         sme_impacts: List[Dict[str, Any]]
@@ -249,7 +300,7 @@ Provide clear before/after comparisons and identify top impacted SMEs.
         
         try:
             # Start agent session
-            session = self.agent.start_session()
+            session = await llm.start_session(self.agent)
             
             # Send scenario description
             prompt = f"""Analyze this scenario and run a complete simulation:
@@ -258,10 +309,8 @@ Scenario: {scenario_description}
 
 Steps:
 1. Identify the scenario type and parameters
-2. Find all affected SMEs
-3. Calculate impact for each SME
-4. Aggregate to portfolio level
-5. Return comprehensive results
+2. Evaluate the scenario across the portfolio
+3. Return comprehensive results
 
 Portfolio context:
 - Total SMEs: 1,284
@@ -270,38 +319,15 @@ Portfolio context:
 - Current stable: 1,119
 """
             
-            response = session.send_message(prompt)
+            response = await session.send_message(prompt)
             
             # Process function calls
             while response.function_calls:
-                function_responses = []
+                logger.info(f"Agent calling {len(response.function_calls)} functions")
                 
-                for fc in response.function_calls:
-                    logger.info(f"Agent calling function: {fc.name}")
-                    
-                    if fc.name == "identify_affected_smes":
-                        result = await self.identify_affected_smes(
-                            fc.args.get("scenario_type"),
-                            fc.args.get("parameters", {})
-                        )
-                    elif fc.name == "calculate_sme_impact":
-                        result = await self.calculate_sme_impact(
-                            fc.args.get("sme_id"),
-                            fc.args.get("scenario_parameters", {})
-                        )
-                    elif fc.name == "aggregate_portfolio_impact":
-                        result = await self.aggregate_portfolio_impact(
-                            fc.args.get("sme_impacts", [])
-                        )
-                    else:
-                        result = {"error": f"Unknown function: {fc.name}"}
-                    
-                    function_responses.append({
-                        "id": fc.id,
-                        "result": result
-                    })
+                function_responses = await self.tools.dispatch(response.function_calls)
                 
-                response = session.send_message(function_responses)
+                response = await session.send_message(function_responses)
             
             # Parse final response
             return {
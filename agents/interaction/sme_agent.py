@@ -3,13 +3,15 @@ SME Analysis Agent
 Deep dive analysis of individual SME health
 """
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from google import genai
 from google.genai.types import Tool, FunctionDeclaration, Schema, Type
 
+from agents.shared import llm
 from agents.shared.config import get_config
-from agents.shared.mcp_client import MCPClient
+from agents.shared.clients import get_genai_client, get_mcp_client
+from agents.shared.tool_dispatch import ToolDispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -23,17 +25,29 @@ class SMEAnalysisAgent:
     def __init__(self):
         self.config = get_config()
         
-        self.client = genai.Client(
-            vertexai=True,
-            project=self.config.project_id,
-            location=self.config.location,
-        )
-        
-        self.mcp_client = MCPClient(self.config.mcp_server_url)
-        self.agent = self._create_agent()
+        self.mcp_client = get_mcp_client()
+        self.tools = ToolDispatcher({
+            "get_financial_metrics": lambda args: self.get_financial_metrics(args.get("sme_id")),
+            "get_alternative_data": lambda args: self.get_alternative_data(args.get("sme_id")),
+            "get_risk_drivers": lambda args: self.get_risk_drivers(args.get("sme_id")),
+            "get_peer_comparison": lambda args: self.get_peer_comparison(args.get("sme_id")),
+        }, max_concurrency=self.config.tool_concurrency)
+        self._agent: Optional[genai.Agent] = None
         
         logger.info("SME Analysis Agent initialized")
     
+    @property
+    def agent(self) -> genai.Agent:
+        """ADK agent (created on first use)"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
+    
+    @property
+    def is_warm(self) -> bool:
+        """Whether the ADK agent has been built"""
+        return self._agent is not None
+    
     def _create_agent(self) -> genai.Agent:
         """Create SME analysis agent"""
         
@@ -123,7 +137,7 @@ Analysis Framework:
 Provide clear, actionable insights with specific data points and recommendations.
 """
         
-        return self.client.adk.agents.create(
+        return get_genai_client().adk.agents.create(
             model=self.config.model_name,
             system_instruction=system_instruction,
             tools=tools,
@@ -139,23 +153,15 @@ Provide clear, actionable insights with specific data points and recommendations
     
     async def get_alternative_data(self, sme_id: str) -> Dict[str, Any]:
         """Get alternative data signals"""
-        # LinkedIn data
-        linkedin = await self.mcp_client.call_tool(
-            "linkedin_server",
-            "get_employee_count",
-            {"sme_id": sme_id.replace("#", "")}
-        )
-        
-        # Web analytics
-        web_traffic = await self.mcp_client.call_tool(
-            "google_analytics_server",
-            "get_traffic_metrics",
-            {"sme_id": sme_id.replace("#", "")}
-        )
+        # LinkedIn data and web analytics concurrently, each with its own deadline
+        results, unavailable = await self.mcp_client.fan_out({
+            "linkedin": ("linkedin_server", "get_employee_count", {"sme_id": sme_id.replace("#", "")}),
+            "web_traffic": ("google_analytics_server", "get_traffic_metrics", {"sme_id": sme_id.replace("#", "")}),
+        })
         
         return {
-            "linkedin": linkedin,
-            "web_traffic": web_traffic,
+            **results,
+            "unavailable_sources": unavailable,
         }
     
     async def get_risk_drivers(self, sme_id: str) -> Dict[str, Any]:
@@ -187,7 +193,7 @@ Provide clear, actionable insights with specific data points and recommendations
         logger.info(f"Analyzing SME: {sme_id}")
         
         try:
-            session = self.agent.start_session()
+            session = await llm.start_session(self.agent)
             
             prompt = f"""Perform comprehensive analysis of SME {sme_id}.
 
@@ -201,27 +207,12 @@ Include:
 Be specific with data points and actionable.
 """
             
-            response = session.send_message(prompt)
+            response = await session.send_message(prompt)
             
             # Process function calls
             while response.function_calls:
-                function_responses = []
-                
-                for fc in response.function_calls:
-                    if fc.name == "get_financial_metrics":
-                        result = await self.get_financial_metrics(fc.args.get("sme_id"))
-                    elif fc.name == "get_alternative_data":
-                        result = await self.get_alternative_data(fc.args.get("sme_id"))
-                    elif fc.name == "get_risk_drivers":
-                        result = await self.get_risk_drivers(fc.args.get("sme_id"))
-                    elif fc.name == "get_peer_comparison":
-                        result = await self.get_peer_comparison(fc.args.get("sme_id"))
-                    else:
-                        result = {"error": f"Unknown function: {fc.name}"}
-                    
-                    function_responses.append({"id": fc.id, "result": result})
-                
-                response = session.send_message(function_responses)
+                function_responses = await self.tools.dispatch(response.function_calls)
+                response = await session.send_message(function_responses)
             
             return response.text
             
@@ -3,15 +3,19 @@ Master Orchestrator Agent
 Routes requests to specialized agents using ADK v1.19.0
 """
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from google import genai
 from google.genai.types import Tool, FunctionDeclaration, Schema, Type
 
+from agents.shared.clients import get_genai_client
 from agents.shared.config import get_config
+from agents.shared.session_manager import SessionManager
+from agents.shared.tool_dispatch import ToolDispatcher
 from agents.interaction.chat_agent import ChatAgent
 from agents.interaction.scenario_agent import ScenarioAgent
 from agents.interaction.sme_agent import SMEAnalysisAgent
+from agents.orchestrator.intent_router import IntentDecision, IntentRouter
 
 logger = logging.getLogger(__name__)
 
@@ -25,22 +29,81 @@ class MasterOrchestrator:
     def __init__(self):
         self.config = get_config()
         
-        self.client = genai.Client(
-            vertexai=True,
-            project=self.config.project_id,
-            location=self.config.location,
+        # Specialized agents are built on first use
+        self._chat_agent: Optional[ChatAgent] = None
+        self._scenario_agent: Optional[ScenarioAgent] = None
+        self._sme_agent: Optional[SMEAnalysisAgent] = None
+        
+        # Routing calls from one turn run concurrently
+        self.tools = ToolDispatcher({
+            "route_to_chat_agent": lambda args, session_id="default": self.route_to_chat_agent(
+                args.get("query"), session_id
+            ),
+            "route_to_scenario_agent": lambda args, **context: self.route_to_scenario_agent(
+                args.get("scenario_description")
+            ),
+            "route_to_sme_agent": lambda args, **context: self.route_to_sme_agent(args.get("sme_id")),
+        }, max_concurrency=self.config.tool_concurrency)
+        
+        # Local fast path for obvious requests
+        self.intent_router = IntentRouter(
+            threshold=self.config.intent_router_threshold,
+            min_known=self.config.intent_router_min_known,
         )
         
-        # Initialize specialized agents
-        self.chat_agent = ChatAgent()
-        self.scenario_agent = ScenarioAgent()
-        self.sme_agent = SMEAnalysisAgent()
+        # Orchestrator agent is built on first LLM routing
+        self._agent: Optional[genai.Agent] = None
         
-        # Create orchestrator agent
-        self.agent = self._create_agent()
+        # Routing sessions reused per session_id
+        self.sessions = SessionManager.from_config(lambda: self.agent, self.config)
         
         logger.info("Master Orchestrator initialized")
     
+    @property
+    def agent(self) -> genai.Agent:
+        """ADK routing agent (created on first use)"""
+        if self._agent is None:
+            self._agent = self._create_agent()
+        return self._agent
+    
+    @property
+    def chat_agent(self) -> ChatAgent:
+        """Chat agent (created on first use)"""
+        if self._chat_agent is None:
+            self._chat_agent = ChatAgent()
+        return self._chat_agent
+    
+    @property
+    def scenario_agent(self) -> ScenarioAgent:
+        """Scenario agent (created on first use)"""
+        if self._scenario_agent is None:
+            self._scenario_agent = ScenarioAgent()
+        return self._scenario_agent
+    
+    @property
+    def sme_agent(self) -> SMEAnalysisAgent:
+        """SME agent (created on first use)"""
+        if self._sme_agent is None:
+            self._sme_agent = SMEAnalysisAgent()
+        return self._sme_agent
+    
+    def specialized_agents(self) -> Dict[str, Any]:
+        """Specialized agents built so far, by name"""
+        agents = {
+            "chat": self._chat_agent,
+            "scenario": self._scenario_agent,
+            "sme": self._sme_agent,
+        }
+        return {name: agent for name, agent in agents.items() if agent is not None}
+    
+    def warm_state(self) -> Dict[str, bool]:
+        """Which ADK agents have been built (cold ones are built on their first request)"""
+        built = self.specialized_agents()
+        return {
+            "orchestrator": self._agent is not None,
+            **{name: name in built and built[name].is_warm for name in ("chat", "scenario", "sme")},
+        }
+    
     def _create_agent(self) -> genai.Agent:
         """Create orchestrator agent"""
         
@@ -109,15 +172,15 @@ Your role is to analyze user requests and route them to the appropriate speciali
 Route based on intent, not just keywords. Consider context and user's goal.
 """
         
-        return self.client.adk.agents.create(
+        return get_genai_client().adk.agents.create(
             model=self.config.model_name,
             system_instruction=system_instruction,
             tools=tools,
         )
     
-    async def route_to_chat_agent(self, query: str) -> str:
-        """Route to chat agent"""
-        return await self.chat_agent.process_query(query)
+    async def route_to_chat_agent(self, query: str, session_id: str = "default") -> str:
+        """Route to chat agent (continuing the caller's conversation)"""
+        return await self.chat_agent.process_query(query, session_id)
     
     async def route_to_scenario_agent(self, scenario_description: str) -> Dict[str, Any]:
         """Route to scenario agent"""
@@ -127,6 +190,17 @@ Route based on intent, not just keywords. Consider context and user's goal.
         """Route to SME agent"""
         return await self.sme_agent.analyze(sme_id)
     
+    async def _route_directly(self, decision: IntentDecision, user_input: str, session_id: str) -> str:
+        """Send input straight to the agent picked by the intent router"""
+        if decision.intent == "sme":
+            return await self.route_to_sme_agent(decision.sme_id)
+        if decision.intent == "scenario":
+            result = await self.route_to_scenario_agent(user_input)
+            if result.get("status") == "failed":
+                return f"Error processing request: {result.get('error')}"
+            return result.get("analysis", "")
+        return await self.route_to_chat_agent(user_input, session_id)
+    
     async def process(self, user_input: str, session_id: str = "default") -> str:
         """
         Process user input and route to appropriate agent
@@ -134,40 +208,38 @@ Route based on intent, not just keywords. Consider context and user's goal.
         Args:
             user_input: User's request
             session_id: Session ID
-            
+        
         Returns:
             Response from specialized agent
         """
         logger.info(f"Orchestrator processing: {user_input}")
         
         try:
-            session = self.agent.start_session(session_id=session_id)
-            response = session.send_message(user_input)
+            decision = self.intent_router.route(user_input)
             
-            # Process routing function calls
-            while response.function_calls:
-                function_responses = []
+            async with self.sessions.session(session_id) as session:
+                if decision is not None:
+                    logger.info(f"Fast-path routing to {decision.intent} ({decision.confidence:.2f})")
+                    reply = await self._route_directly(decision, user_input, session_id)
+                    # Keep the turn in the conversation the LLM router sees next time
+                    session.record_turn(user_input, reply)
+                    return reply
+                
+                response = await session.send_message(user_input)
                 
-                for fc in response.function_calls:
-                    logger.info(f"Routing to: {fc.name}")
+                # Process routing function calls
+                while response.function_calls:
+                    logger.info(f"Routing to: {[fc.name for fc in response.function_calls]}")
                     
-                    if fc.name == "route_to_chat_agent":
-                        result = await self.route_to_chat_agent(fc.args.get("query"))
-                    elif fc.name == "route_to_scenario_agent":
-                        result = await self.route_to_scenario_agent(
-                            fc.args.get("scenario_description")
-                        )
-                    elif fc.name == "route_to_sme_agent":
-                        result = await self.route_to_sme_agent(fc.args.get("sme_id"))
-                    else:
-                        result = f"Unknown routing: {fc.name}"
+                    function_responses = await self.tools.dispatch(
+                        response.function_calls,
+                        context={"session_id": session_id}
+                    )
                     
-                    function_responses.append({"id": fc.id, "result": result})
+                    response = await session.send_message(function_responses)
                 
-                response = session.send_message(function_responses)
-            
-            return response.text
-            
+                return response.text
+        
         except Exception as e:
             logger.error(f"Orchestrator error: {e}")
             return f"Error processing request: {str(e)}"
@@ -0,0 +1,154 @@
+"""
+Labelled examples for the orchestrator's local intent router
+Intents: chat (general questions), scenario (what-if simulations), sme (deep dive on one SME)
+"""
+
+# (text, intent) pairs the classifier is trained on
+TRAINING_EXAMPLES = [
+    # Chat
+    ("What's our portfolio status?", "chat"),
+    ("Show me recent alerts", "chat"),
+    ("Who is TechStart Solutions?", "chat"),
+    ("How many SMEs are critical right now?", "chat"),
+    ("What is the total exposure of the portfolio?", "chat"),
+    ("Give me a summary of today's news", "chat"),
+    ("Any new alerts this morning?", "chat"),
+    ("What does the risk score mean?", "chat"),
+    ("List the critical SMEs", "chat"),
+    ("Show portfolio metrics", "chat"),
+    ("What happened with GreenLeaf Products this week?", "chat"),
+    ("Is there any news about SME #0531?", "chat"),
+    ("What sector is Urban Fashion in?", "chat"),
+    ("Hello", "chat"),
+    ("Thanks, that helps", "chat"),
+    ("How is the default probability calculated?", "chat"),
+    ("Which SMEs moved to critical recently?", "chat"),
+    ("What's the average risk score?", "chat"),
+    ("Tell me about the news intelligence feed", "chat"),
+    ("Who are the directors of SME #0142?", "chat"),
+    ("Show me the latest news for Natural Wellness", "chat"),
+    ("How many medium risk companies do we have?", "chat"),
+    ("What can you help me with?", "chat"),
+    ("Explain the risk categories", "chat"),
+    ("What is the exposure to retail?", "chat"),
+    ("Any alerts for Digital Marketing Hub?", "chat"),
+    ("Summarise the portfolio for me", "chat"),
+    ("What tasks are open?", "chat"),
+    ("What is the risk score of SME #0287?", "chat"),
+    ("Which sectors have the most critical SMEs?", "chat"),
+    
+    # Scenario
+    ("What if interest rates go up 1%?", "scenario"),
+    ("How would a hemp ban affect us?", "scenario"),
+    ("Simulate GDP drop of 2%", "scenario"),
+    ("What happens if rates rise by 50 basis points?", "scenario"),
+    ("Run a scenario where retail sales fall 10%", "scenario"),
+    ("Stress test the portfolio for a recession", "scenario"),
+    ("What if unemployment increases to 6%?", "scenario"),
+    ("Model the impact of a 2% rate hike", "scenario"),
+    ("Suppose inflation hits 8%, what is the impact?", "scenario"),
+    ("How would a tech sector downturn impact the portfolio?", "scenario"),
+    ("Simulate a ban on CBD products", "scenario"),
+    ("What would happen if energy prices doubled?", "scenario"),
+    ("Run a what-if on a hospitality shock", "scenario"),
+    ("Impact of new regulation on food businesses", "scenario"),
+    ("What if the base rate is cut by 0.5%?", "scenario"),
+    ("Show me the portfolio impact of a UK recession", "scenario"),
+    ("Scenario: interest rates up 2 percent", "scenario"),
+    ("If rates increase how many SMEs become critical?", "scenario"),
+    ("Simulate a 15% drop in consumer spending", "scenario"),
+    ("What happens to the portfolio if the EU bans hemp?", "scenario"),
+    ("Project the effect of a sector shock in retail", "scenario"),
+    ("How would higher rates affect TechStart Solutions?", "scenario"),
+    ("Run a stress scenario for rising inflation", "scenario"),
+    ("What if GDP contracts by 3%?", "scenario"),
+    ("Estimate the impact of a minimum wage increase", "scenario"),
+    ("Simulate a supply chain disruption", "scenario"),
+    ("What would a 1% rate rise do to our critical count?", "scenario"),
+    ("Model a geographic shock in the north west", "scenario"),
+    ("How many SMEs would be affected by a plastic ban?", "scenario"),
+    ("What-if analysis: rates plus 1.5%", "scenario"),
+    
+    # SME deep dive
+    ("Analyze TechStart Solutions in detail", "sme"),
+    ("Deep dive on SME #0142", "sme"),
+    ("Full analysis of GreenLeaf Products", "sme"),
+    ("Analyse SME #0445", "sme"),
+    ("Give me a full risk assessment of Urban Fashion", "sme"),
+    ("Detailed analysis of #0531", "sme"),
+    ("Break down the risk drivers for SME #0142", "sme"),
+    ("Deep dive into Natural Wellness", "sme"),
+    ("Run a comprehensive analysis on Digital Marketing Hub", "sme"),
+    ("Why is SME #0287 critical? Analyse it fully", "sme"),
+    ("Do a deep dive on GreenLeaf", "sme"),
+    ("Full credit review of SME #0672", "sme"),
+    ("Analyze #0445 with peer comparison", "sme"),
+    ("I need an in-depth look at TechStart", "sme"),
+    ("Comprehensive risk analysis for SME #0531", "sme"),
+    ("Examine Urban Fashion Ltd in depth", "sme"),
+    ("Complete analysis of SME 0142 including alternative data", "sme"),
+    ("Investigate SME #0672 thoroughly", "sme"),
+    ("Deep-dive analysis on Digital Marketing Hub please", "sme"),
+    ("Assess the financial health of GreenLeaf Products in detail", "sme"),
+    ("Analyze the risk drivers and peers of #0287", "sme"),
+    ("Thorough analysis of Natural Wellness Ltd", "sme"),
+    ("Give me everything on SME #0142", "sme"),
+    ("Detailed risk profile for TechStart Solutions", "sme"),
+    ("Drill into SME #0445", "sme"),
+    ("Full deep dive: Urban Fashion", "sme"),
+    ("Analyse financial metrics, alternative data and peers for #0531", "sme"),
+    ("Produce a full SME report for #0672", "sme"),
+    ("In-depth review of GreenLeaf", "sme"),
+    ("Analyze SME #0142", "sme"),
+]
+
+# Held-out (text, intent, sme_id) triples for evaluation; sme_id is set for sme routes
+EVALUATION_EXAMPLES = [
+    ("What's the current portfolio status?", "chat", None),
+    ("Show me today's alerts", "chat", None),
+    ("Who is GreenLeaf Products?", "chat", None),
+    ("How many SMEs are in the stable category?", "chat", None),
+    ("Any news about TechStart Solutions?", "chat", None),
+    ("What is our total exposure?", "chat", None),
+    ("Which companies are critical?", "chat", None),
+    ("What is the risk score for SME #0445?", "chat", None),
+    ("Hi there", "chat", None),
+    ("Explain how alerts are generated", "chat", None),
+    ("What sector is Digital Marketing Hub in?", "chat", None),
+    ("Show me the news feed", "chat", None),
+    ("What does critical mean?", "chat", None),
+    ("Give me portfolio metrics for this quarter", "chat", None),
+    ("Are there any open tasks for Urban Fashion?", "chat", None),
+    
+    ("What if interest rates rise by 2%?", "scenario", None),
+    ("Simulate a 5% GDP contraction", "scenario", None),
+    ("How would a ban on hemp products affect the portfolio?", "scenario", None),
+    ("Run a recession stress test", "scenario", None),
+    ("What happens if inflation reaches 10%?", "scenario", None),
+    ("Model the effect of a retail downturn", "scenario", None),
+    ("What if rates go up 0.25%?", "scenario", None),
+    ("Simulate an energy price shock", "scenario", None),
+    ("Impact of a hospitality sector shock on our SMEs", "scenario", None),
+    ("What would happen if unemployment rose sharply?", "scenario", None),
+    ("Stress test for a 3% rate rise", "scenario", None),
+    ("Scenario: new food labelling regulation", "scenario", None),
+    ("If GDP falls 1%, how many SMEs turn critical?", "scenario", None),
+    ("What-if: consumer spending drops 20%", "scenario", None),
+    ("Project the impact of a tech sector crash", "scenario", None),
+    
+    ("Deep dive on SME #0445", "sme", "#0445"),
+    ("Analyze SME #0531 in detail", "sme", "#0531"),
+    ("Full analysis of TechStart Solutions", "sme", "#0142"),
+    ("Detailed risk assessment of Urban Fashion", "sme", "#0287"),
+    ("Analyse Natural Wellness in depth", "sme", "#0672"),
+    ("Comprehensive analysis of #0142", "sme", "#0142"),
+    ("Deep dive into GreenLeaf Products", "sme", "#0445"),
+    ("Give me a full report on SME #0287", "sme", "#0287"),
+    ("Thorough review of Digital Marketing Hub", "sme", "#0531"),
+    ("Break down risk drivers and peers for #0672", "sme", "#0672"),
+    ("In-depth analysis of TechStart", "sme", "#0142"),
+    ("Investigate SME #0445 fully", "sme", "#0445"),
+    ("Full credit analysis of Urban Fashion Ltd", "sme", "#0287"),
+    ("Analyze GreenLeaf", "sme", "#0445"),
+    ("Complete deep dive on SME 0531", "sme", "#0531"),
+]
@@ -0,0 +1,182 @@
+"""
+Local intent router for the Master Orchestrator
+Routes obvious requests without an LLM round-trip; unsure inputs fall back to the LLM router
+"""
+import math
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from agents.orchestrator.intent_examples import TRAINING_EXAMPLES
+
+# Known SME names -> IDs (longest names are matched first)
+SME_GAZETTEER = {
+    "techstart solutions ltd": "#0142",
+    "techstart solutions": "#0142",
+    "techstart": "#0142",
+    "urban fashion ltd": "#0287",
+    "urban fashion": "#0287",
+    "digital marketing hub": "#0531",
+    "greenleaf products": "#0445",
+    "greenleaf": "#0445",
+    "natural wellness ltd": "#0672",
+    "natural wellness": "#0672",
+}
+
+# "#0142", "# 0142", "SME 0142", "SME #0142"
+_SME_ID = re.compile(r"(?:\bsme\s*#?\s*|#\s?)(\d{3,6})\b")
+
+# Placeholder tokens so the classifier learns "an SME is mentioned", not which one
+_SME_TOKEN = "__sme__"
+_NUMBER_TOKEN = "__num__"
+_TOKEN = re.compile(r"__sme__|[a-z]+|\d+(?:\.\d+)?")
+
+
+@dataclass
+class IntentDecision:
+    """A confident local routing decision"""
+    intent: str
+    confidence: float
+    sme_id: Optional[str] = None
+
+
+class NaiveBayesClassifier:
+    """
+    Multinomial Naive Bayes over unigram and bigram tokens
+    
+    Training is a single counting pass, and classification is one dict
+    lookup per feature per class, so predictions take microseconds on CPU.
+    """
+    
+    def __init__(self, alpha: float = 1.0):
+        self.alpha = alpha
+        self.labels: List[str] = []
+        self._log_priors: Dict[str, float] = {}
+        self._log_likelihoods: Dict[str, Dict[str, float]] = {}
+        self._log_unseen: Dict[str, float] = {}
+        self.vocabulary: Set[str] = set()
+    
+    def fit(self, examples: Iterable[Tuple[List[str], str]]) -> "NaiveBayesClassifier":
+        """Train on (features, label) pairs"""
+        doc_counts: Counter = Counter()
+        feature_counts: Dict[str, Counter] = defaultdict(Counter)
+        vocabulary = set()
+        for features, label in examples:
+            doc_counts[label] += 1
+            feature_counts[label].update(features)
+            vocabulary.update(features)
+        
+        total_docs = sum(doc_counts.values())
+        self.labels = sorted(doc_counts)
+        for label in self.labels:
+            counts = feature_counts[label]
+            denominator = sum(counts.values()) + self.alpha * (len(vocabulary) + 1)
+            self._log_priors[label] = math.log(doc_counts[label] / total_docs)
+            self._log_likelihoods[label] = {
+                feature: math.log((count + self.alpha) / denominator) for feature, count in counts.items()
+            }
+            self._log_unseen[label] = math.log(self.alpha / denominator)
+        self.vocabulary = vocabulary
+        return self
+    
+    def predict_proba(self, features: List[str]) -> Dict[str, float]:
+        """Posterior probability of each label"""
+        scores = {}
+        for label in self.labels:
+            likelihoods = self._log_likelihoods[label]
+            unseen = self._log_unseen[label]
+            scores[label] = self._log_priors[label] + sum(likelihoods.get(f, unseen) for f in features)
+        
+        top = max(scores.values())
+        exp = {label: math.exp(score - top) for label, score in scores.items()}
+        total = sum(exp.values())
+        return {label: value / total for label, value in exp.items()}
+
+
+class IntentRouter:
+    """
+    Routes user input to the chat, scenario or SME agent without the LLM
+    
+    SME IDs and known SME names are extracted with regexes and a gazetteer,
+    then replaced by a placeholder before a Naive Bayes classifier scores the
+    text. Inputs whose top intent is below `threshold`, or SME deep dives
+    with no identifiable SME, return None and go to the LLM router.
+    
+    Naive Bayes posteriors are overconfident on inputs unlike the training
+    set (unseen words still shift the odds towards the class with the fewest
+    tokens), so "Create a task for #0142" scores ~0.96 for an SME deep dive.
+    Inputs where fewer than `min_known` of the words were seen in training
+    are therefore left to the LLM whatever their score.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        min_known: float = 0.7,
+        gazetteer: Optional[Dict[str, str]] = None,
+        examples: Optional[List[Tuple[str, str]]] = None,
+    ):
+        self.threshold = threshold
+        self.min_known = min_known
+        self.gazetteer = gazetteer if gazetteer is not None else SME_GAZETTEER
+        names = sorted(self.gazetteer, key=len, reverse=True)
+        self._names = re.compile(r"\b(" + "|".join(re.escape(n) for n in names) + r")\b") if names else None
+        
+        examples = examples if examples is not None else TRAINING_EXAMPLES
+        self.classifier = NaiveBayesClassifier().fit(
+            (self.features(text)[0], intent) for text, intent in examples
+        )
+    
+    def features(self, text: str) -> Tuple[List[str], Optional[str]]:
+        """(classifier features, SME ID mentioned) for text; explicit IDs win over names"""
+        text = text.lower()
+        sme_ids: List[str] = []
+        
+        def _id(match: re.Match) -> str:
+            sme_ids.append(f"#{match.group(1)}")
+            return f" {_SME_TOKEN} "
+        
+        def _name(match: re.Match) -> str:
+            sme_ids.append(self.gazetteer[match.group(1)])
+            return f" {_SME_TOKEN} "
+        
+        text = _SME_ID.sub(_id, text)
+        if self._names is not None:
+            text = self._names.sub(_name, text)
+        
+        tokens = [_NUMBER_TOKEN if token[0].isdigit() else token for token in _TOKEN.findall(text)]
+        bigrams = [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        
+        return tokens + bigrams, sme_ids[0] if sme_ids else None
+    
+    def known_share(self, features: List[str]) -> float:
+        """Share of the words (not bigrams) in features that were seen in training"""
+        words = [feature for feature in features if " " not in feature]
+        if not words:
+            return 0.0
+        return sum(word in self.classifier.vocabulary for word in words) / len(words)
+    
+    def classify(self, text: str) -> Tuple[str, float, Optional[str]]:
+        """(top intent, its probability, SME ID) regardless of threshold"""
+        features, sme_id = self.features(text)
+        return self._classify(features, sme_id)
+    
+    def _classify(self, features: List[str], sme_id: Optional[str]) -> Tuple[str, float, Optional[str]]:
+        """(top intent, its probability, SME ID) for extracted features"""
+        probabilities = self.classifier.predict_proba(features)
+        intent = max(probabilities, key=probabilities.get)
+        return intent, probabilities[intent], sme_id
+    
+    def route(self, text: str) -> Optional[IntentDecision]:
+        """Confident routing decision, or None to defer to the LLM"""
+        features, sme_id = self.features(text)
+        if self.known_share(features) < self.min_known:
+            return None
+        
+        intent, confidence, sme_id = self._classify(features, sme_id)
+        if confidence < self.threshold:
+            return None
+        if intent == "sme" and sme_id is None:
+            return None
+        return IntentDecision(intent=intent, confidence=confidence, sme_id=sme_id)
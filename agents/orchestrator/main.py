@@ -6,6 +6,7 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
 from agents.orchestrator.agent import MasterOrchestrator
+from agents.shared import clients, llm
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -17,7 +18,7 @@ orchestrator = MasterOrchestrator()
 class OrchestratorRequest(BaseModel):
     """Request model"""
     message: str
-    session_id: str = "default"
+    session_id: str
 
 
 class OrchestratorResponse(BaseModel):
@@ -26,6 +27,13 @@ class OrchestratorResponse(BaseModel):
     session_id: str
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled MCP connections and the LLM thread pool"""
+    await clients.aclose()
+    llm.shutdown()
+
+
 @app.post("/orchestrate", response_model=OrchestratorResponse)
 async def orchestrate(request: OrchestratorRequest):
     """Process request via orchestrator"""
@@ -44,12 +52,41 @@ async def orchestrate(request: OrchestratorRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/tool-stats")
+async def tool_stats():
+    """Per-tool call counts and timings for the orchestrator and each sub-agent"""
+    stats = {"orchestrator": orchestrator.tools.get_stats()}
+    for name, agent in orchestrator.specialized_agents().items():
+        stats[name] = agent.tools.get_stats()
+    return stats
+
+
+@app.get("/sessions")
+async def session_stats():
+    """Routing and chat session counts, eviction metrics and per-session tokens and memory"""
+    stats = {"orchestrator": orchestrator.sessions.get_stats()}
+    chat_agent = orchestrator.specialized_agents().get("chat")
+    if chat_agent is not None:
+        stats["chat"] = chat_agent.sessions.get_stats()
+    return stats
+
+
 @app.get("/health")
 async def health():
     """Health check"""
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def ready():
+    """Readiness check with warm state (cold parts are built on first request)"""
+    return {
+        "status": "ready",
+        "clients": clients.status(),
+        "agents": orchestrator.warm_state(),
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8080)
@@ -0,0 +1,51 @@
+"""
+Process-wide GenAI client and MCP connection pool shared by all agents
+"""
+import logging
+from typing import Any, Dict, Optional
+
+from google import genai
+
+from agents.shared.config import get_config
+from agents.shared.mcp_client import MCPClient
+
+logger = logging.getLogger(__name__)
+
+_genai_client: Optional[genai.Client] = None
+_mcp_client: Optional[MCPClient] = None
+
+
+def get_genai_client() -> genai.Client:
+    """Vertex AI GenAI client (created on first use)"""
+    global _genai_client
+    if _genai_client is None:
+        config = get_config()
+        _genai_client = genai.Client(
+            vertexai=True,
+            project=config.project_id,
+            location=config.location,
+        )
+        logger.info("GenAI client created")
+    return _genai_client
+
+
+def get_mcp_client() -> MCPClient:
+    """Pooled MCP client (its connections open on first call)"""
+    global _mcp_client
+    if _mcp_client is None:
+        _mcp_client = MCPClient.from_config(get_config())
+    return _mcp_client
+
+
+def status() -> Dict[str, Any]:
+    """Which shared clients have been created"""
+    return {
+        "genai_client": _genai_client is not None,
+        "mcp_pool": _mcp_client is not None and _mcp_client.is_connected,
+    }
+
+
+async def aclose():
+    """Release pooled MCP connections"""
+    if _mcp_client is not None:
+        await _mcp_client.aclose()
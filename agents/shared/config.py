@@ -14,6 +14,32 @@ class Config:
     model_name: str = "gemini-2.0-flash-exp"
     mcp_server_url: str = "http://localhost:8001"
     backend_api_url: str = "http://localhost:8000"
+    
+    # MCP HTTP connection pool
+    mcp_timeout: float = 30.0
+    mcp_max_connections: int = 100
+    mcp_max_keepalive_connections: int = 20
+    mcp_keepalive_expiry: float = 30.0
+    mcp_http2: bool = False
+    
+    # Per-source deadline for multi-source fan-outs (seconds)
+    mcp_source_timeout: float = 5.0
+    
+    # Function calls from one LLM turn run at most this many at a time
+    tool_concurrency: int = 8
+    
+    # Threads for blocking LLM session calls
+    llm_max_workers: int = 32
+    
+    # Orchestrator routes locally at or above this confidence (above 1 always asks the LLM)
+    intent_router_threshold: float = 0.9
+    # ...and only when at least this share of the input's words were seen in training
+    intent_router_min_known: float = 0.7
+    
+    # Reusable agent sessions
+    agent_max_sessions: int = 1000
+    agent_session_ttl: float = 1800.0
+    agent_max_history_tokens: int = 8000
 
 
 def get_config() -> Config:
@@ -24,4 +50,17 @@ def get_config() -> Config:
         model_name=os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp"),
         mcp_server_url=os.getenv("MCP_SERVER_URL", "http://localhost:8001"),
         backend_api_url=os.getenv("BACKEND_API_URL", "http://localhost:8000"),
+        mcp_timeout=float(os.getenv("MCP_TIMEOUT", "30.0")),
+        mcp_max_connections=int(os.getenv("MCP_MAX_CONNECTIONS", "100")),
+        mcp_max_keepalive_connections=int(os.getenv("MCP_MAX_KEEPALIVE_CONNECTIONS", "20")),
+        mcp_keepalive_expiry=float(os.getenv("MCP_KEEPALIVE_EXPIRY", "30.0")),
+        mcp_http2=os.getenv("MCP_HTTP2", "false").lower() in ("1", "true", "yes"),
+        mcp_source_timeout=float(os.getenv("MCP_SOURCE_TIMEOUT", "5.0")),
+        tool_concurrency=int(os.getenv("AGENT_TOOL_CONCURRENCY", "8")),
+        llm_max_workers=int(os.getenv("LLM_MAX_WORKERS", "32")),
+        intent_router_threshold=float(os.getenv("INTENT_ROUTER_THRESHOLD", "0.9")),
+        intent_router_min_known=float(os.getenv("INTENT_ROUTER_MIN_KNOWN", "0.7")),
+        agent_max_sessions=int(os.getenv("AGENT_MAX_SESSIONS", "1000")),
+        agent_session_ttl=float(os.getenv("AGENT_SESSION_TTL", "1800")),
+        agent_max_history_tokens=int(os.getenv("AGENT_MAX_HISTORY_TOKENS", "8000")),
     )
@@ -0,0 +1,74 @@
+"""
+Async adapter for LLM agent sessions
+"""
+import asyncio
+import inspect
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Optional
+
+from agents.shared.config import get_config
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Dedicated pool for blocking LLM calls (kept apart from the loop's default executor)"""
+    global _executor
+    if _executor is None:
+        max_workers = get_config().llm_max_workers
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm")
+        logger.info(f"LLM thread pool started ({max_workers} workers)")
+    return _executor
+
+
+async def _call(func, *args, **kwargs) -> Any:
+    """Run a blocking SDK call in the LLM pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+
+def _native_async(obj: Any, name: str):
+    """obj.<name>_async if the SDK provides a coroutine version"""
+    method = getattr(obj, f"{name}_async", None)
+    return method if inspect.iscoroutinefunction(method) else None
+
+
+class AsyncSession:
+    """
+    Awaitable wrapper around an agent session
+    
+    Uses the SDK's native async method when there is one; otherwise the
+    blocking send_message runs in a dedicated thread pool, so a model
+    round-trip no longer stalls the event loop and concurrent requests
+    to the agent service overlap instead of queuing.
+    """
+    
+    def __init__(self, session: Any):
+        self.session = session
+    
+    async def send_message(self, message: Any) -> Any:
+        """Send a user message or function responses and await the model's reply"""
+        native = _native_async(self.session, "send_message")
+        if native is not None:
+            return await native(message)
+        return await _call(self.session.send_message, message)
+
+
+async def start_session(agent: Any, **kwargs) -> AsyncSession:
+    """Start an agent session without blocking the event loop"""
+    native = _native_async(agent, "start_session")
+    if native is not None:
+        return AsyncSession(await native(**kwargs))
+    return AsyncSession(await _call(agent.start_session, **kwargs))
+
+
+def shutdown():
+    """Stop the LLM thread pool (waits for in-flight calls)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
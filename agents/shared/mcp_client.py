@@ -2,17 +2,99 @@
 MCP Client for fetching data from MCP servers
 """
 import httpx
+import itertools
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+
+from agents.shared.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Extra time the HTTP request gets beyond the per-call deadline, so the
+# server can answer with its partial results before the client gives up
+_DEADLINE_MARGIN = 2.0
+
+
+def _http2_available() -> bool:
+    """HTTP/2 in httpx needs the optional h2 package"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
 
 class MCPClient:
-    """Client for calling MCP servers"""
+    """
+    Client for calling MCP servers
     
-    def __init__(self, server_url: str):
+    Owns one long-lived httpx.AsyncClient, so tool calls reuse pooled
+    keep-alive connections instead of paying TCP (and TLS) setup each time.
+    The pool is created on first use and released by aclose().
+    """
+    
+    def __init__(
+        self,
+        server_url: str,
+        timeout: float = 30.0,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        source_timeout: Optional[float] = None,
+    ):
         self.server_url = server_url
+        self.timeout = timeout
+        self.source_timeout = source_timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        
+        if http2 and not _http2_available():
+            logger.warning("MCP_HTTP2 requested but the h2 package is not installed; using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        
+        self._client: Optional[httpx.AsyncClient] = None
+        self._ids = itertools.count(1)
+    
+    @classmethod
+    def from_config(cls, config: Config) -> "MCPClient":
+        """Build a client with the pool settings from agent configuration"""
+        return cls(
+            config.mcp_server_url,
+            timeout=config.mcp_timeout,
+            max_connections=config.mcp_max_connections,
+            max_keepalive_connections=config.mcp_max_keepalive_connections,
+            keepalive_expiry=config.mcp_keepalive_expiry,
+            http2=config.mcp_http2,
+            source_timeout=config.mcp_source_timeout,
+        )
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client (created on first use)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.server_url,
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+            )
+        return self._client
+    
+    @property
+    def is_connected(self) -> bool:
+        """Whether the connection pool is open"""
+        return self._client is not None and not self._client.is_closed
+    
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def call_tool(
         self,
@@ -21,20 +103,109 @@ class MCPClient:
         params: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Call MCP tool"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.post(
-                    f"{self.server_url}/rpc",
-                    json={
-                        "jsonrpc": "2.0",
-                        "method": f"{server_name}/{tool_name}",
-                        "params": params,
-                        "id": 1
-                    }
-                )
-                response.raise_for_status()
-                result = response.json()
-                return result.get("result", {})
-            except Exception as e:
-                logger.error(f"MCP call failed: {e}")
-                return {"error": str(e)}
+        try:
+            response = await self.client.post(
+                "/rpc",
+                json=self._request(server_name, tool_name, params)
+            )
+            response.raise_for_status()
+            return self._unwrap(response.json())
+        except Exception as e:
+            logger.error(f"MCP call failed: {e}")
+            return {"error": str(e)}
+    
+    async def call_tools_batch(
+        self,
+        calls: List[Tuple[str, str, Dict[str, Any]]],
+        timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Call several MCP tools in one JSON-RPC batch request
+        
+        Args:
+            calls: (server_name, tool_name, params) for each tool call
+            timeout: Per-call deadline in seconds, enforced by the server
+            
+        Returns:
+            One result per call, in the order given ({"error": ...} for failed calls)
+        """
+        if not calls:
+            return []
+        
+        requests = [self._request(*call) for call in calls]
+        options: Dict[str, Any] = {}
+        if timeout is not None:
+            options["headers"] = {"X-MCP-Call-Timeout": str(timeout)}
+            options["timeout"] = timeout + _DEADLINE_MARGIN
+        
+        try:
+            response = await self.client.post("/rpc", json=requests, **options)
+            response.raise_for_status()
+            body = response.json()
+        except Exception as e:
+            logger.error(f"MCP batch call failed: {e}")
+            return [{"error": str(e)} for _ in calls]
+        
+        if not isinstance(body, list):
+            # Whole batch rejected (e.g. parse error): one error object for everything
+            error = self._unwrap(body)
+            return [error for _ in calls]
+        
+        # Responses may arrive in any order; match them back up by ID
+        by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+        return [
+            self._unwrap(by_id[request["id"]]) if request["id"] in by_id
+            else {"error": f"No response for {request['method']}"}
+            for request in requests
+        ]
+    
+    async def fan_out(
+        self,
+        sources: Dict[str, Tuple[str, str, Dict[str, Any]]],
+        timeout: Optional[float] = None
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Query independent sources concurrently, tolerating slow or failed ones
+        
+        All calls go out together (one batch), so latency is the slowest
+        source, capped at the per-source timeout (default: source_timeout).
+        
+        Args:
+            sources: Result name -> (server_name, tool_name, params)
+            timeout: Per-source deadline in seconds
+            
+        Returns:
+            (results by name, names of sources that failed or timed out)
+        """
+        names = list(sources)
+        results = await self.call_tools_batch(
+            [sources[name] for name in names],
+            timeout=timeout if timeout is not None else self.source_timeout
+        )
+        
+        by_name = dict(zip(names, results))
+        unavailable = [
+            name for name, result in by_name.items()
+            if isinstance(result, dict) and result.get("error")
+        ]
+        if unavailable:
+            logger.warning(f"MCP sources unavailable: {', '.join(unavailable)}")
+        
+        return by_name, unavailable
+    
+    def _request(self, server_name: str, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON-RPC request object with a fresh ID"""
+        return {
+            "jsonrpc": "2.0",
+            "method": f"{server_name}/{tool_name}",
+            "params": params,
+            "id": next(self._ids)
+        }
+    
+    @staticmethod
+    def _unwrap(response: Dict[str, Any]) -> Any:
+        """Result of a JSON-RPC response, or {"error": message}"""
+        if response.get("error"):
+            error = response["error"]
+            return {"error": error.get("message", str(error)) if isinstance(error, dict) else str(error)}
+        return response.get("result", {})
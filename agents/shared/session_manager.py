@@ -0,0 +1,236 @@
+"""
+Agent session manager - reusable LLM sessions with bounded history
+"""
+import asyncio
+import json
+import logging
+import sys
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+from agents.shared import llm
+
+logger = logging.getLogger(__name__)
+
+# Roles replayed into a fresh session when history is trimmed
+_REPLAYED_ROLES = ("user", "model")
+
+
+def estimate_tokens(value: Any) -> int:
+    """Rough token count (about four characters per token)"""
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    return max(1, len(text) // 4)
+
+
+class ManagedSession:
+    """
+    One agent session reused across requests for a session_id
+    
+    Every message and reply is recorded with its estimated token count.
+    Once the total passes the manager's cap, the oldest turns are dropped
+    and the next request starts a fresh model session whose history is the
+    retained user/model turns, each replayed as its own entry, so context
+    (and cost) stays bounded and the token count stays per turn.
+    """
+    
+    def __init__(self, session_id: str, manager: "SessionManager"):
+        self.session_id = session_id
+        self.turns: Deque[Tuple[str, str, int]] = deque()
+        self.tokens = 0
+        self.rotations = 0
+        self.last_active = time.monotonic()
+        self.lock = asyncio.Lock()
+        self._manager = manager
+        self._session: Optional[llm.AsyncSession] = None
+        self._replay = False
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate memory held by the recorded history"""
+        return sum(sys.getsizeof(text) for _, text, _ in self.turns)
+    
+    async def send_message(self, message: Any) -> Any:
+        """Send a user message or function responses and record the exchange"""
+        if self._session is None or self._replay:
+            await self._start()
+        
+        self._record("user" if isinstance(message, str) else "tool", message)
+        response = await self._session.send_message(message)
+        if response.function_calls:
+            self._record("call", [{"name": fc.name, "args": fc.args} for fc in response.function_calls])
+        else:
+            self._record("model", response.text or "")
+        return response
+    
+    def record_turn(self, message: str, reply: str):
+        """
+        Record an exchange answered without this session's model
+        The live model session never saw it, so the next message starts a
+        fresh one with the recorded history replayed.
+        """
+        self._record("user", message)
+        self._record("model", reply)
+        self._replay = True
+    
+    def trim(self, max_tokens: int):
+        """Drop the oldest turns until the history fits in max_tokens"""
+        if self.tokens <= max_tokens:
+            return
+        while self.turns and self.tokens > max_tokens:
+            _, _, tokens = self.turns.popleft()
+            self.tokens -= tokens
+        self.restart()
+    
+    def restart(self):
+        """Start a fresh model session on the next message, replaying the recorded history"""
+        # Only user/model text can be replayed; function calls need the old session
+        kept = deque(turn for turn in self.turns if turn[0] in _REPLAYED_ROLES)
+        # History has to open with a user turn
+        while kept and kept[0][0] != "user":
+            kept.popleft()
+        self.turns = kept
+        self.tokens = sum(tokens for _, _, tokens in kept)
+        self._replay = True
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Turns, tokens and memory for this session"""
+        return {
+            "turns": len(self.turns),
+            "tokens": self.tokens,
+            "memory_bytes": self.memory_bytes,
+            "rotations": self.rotations,
+            "idle_seconds": round(time.monotonic() - self.last_active, 1),
+        }
+    
+    async def _start(self):
+        """Open the underlying model session, seeded with the retained turns after a trim"""
+        replay, self._replay = self._replay, False
+        kwargs = {}
+        if replay:
+            self.rotations += 1
+            kwargs["history"] = self.history()
+        
+        # A new ID after each trim, so the SDK can't resume the untrimmed history
+        sdk_session_id = f"{self.session_id}#{self.rotations}" if self.rotations else self.session_id
+        self._session = await llm.start_session(self._manager.get_agent(), session_id=sdk_session_id, **kwargs)
+    
+    def history(self) -> List[Dict[str, Any]]:
+        """Recorded user/model turns as separate content entries"""
+        return [
+            {"role": role, "parts": [{"text": text}]}
+            for role, text, _ in self.turns
+            if role in _REPLAYED_ROLES
+        ]
+    
+    def _record(self, role: str, content: Any):
+        """Add one turn to the history"""
+        text = content if isinstance(content, str) else json.dumps(content, default=str)
+        tokens = estimate_tokens(text)
+        self.turns.append((role, text, tokens))
+        self.tokens += tokens
+
+
+class SessionManager:
+    """
+    Agent sessions keyed by session_id, in least-recently-used order
+    
+    Sessions are reused instead of started on every request. Idle sessions
+    older than `idle_ttl` seconds are swept off the LRU end and the LRU
+    one is evicted past `max_sessions`, as in the backend chat store.
+    A session is held exclusively (its lock) for the whole of a request,
+    so concurrent requests for one session_id don't interleave turns;
+    sessions in use are never expired or evicted.
+    """
+    
+    def __init__(
+        self,
+        get_agent: Callable[[], Any],
+        max_sessions: int = 1000,
+        idle_ttl: float = 1800.0,
+        max_history_tokens: int = 8000,
+    ):
+        self.get_agent = get_agent
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self.max_history_tokens = max_history_tokens
+        self._sessions: "OrderedDict[str, ManagedSession]" = OrderedDict()
+        
+        # Metrics
+        self.evicted_sessions = 0
+        self.expired_sessions = 0
+    
+    @classmethod
+    def from_config(cls, get_agent: Callable[[], Any], config) -> "SessionManager":
+        """Build a manager with the limits from agent configuration"""
+        return cls(
+            get_agent,
+            max_sessions=config.agent_max_sessions,
+            idle_ttl=config.agent_session_ttl,
+            max_history_tokens=config.agent_max_history_tokens,
+        )
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+    
+    @asynccontextmanager
+    async def session(self, session_id: str) -> AsyncIterator[ManagedSession]:
+        """Hold the session for session_id (creating it if needed) for one request"""
+        now = time.monotonic()
+        self._expire(now)
+        
+        managed = self._sessions.get(session_id)
+        if managed is None:
+            managed = self._sessions[session_id] = ManagedSession(session_id, self)
+            while len(self._sessions) > self.max_sessions and self._evict(keep=session_id):
+                pass
+        else:
+            self._sessions.move_to_end(session_id)
+        managed.last_active = now
+        
+        async with managed.lock:
+            managed.trim(self.max_history_tokens)
+            try:
+                yield managed
+            except Exception:
+                # A request that failed mid tool loop leaves the model session awaiting function results
+                managed.restart()
+                raise
+            finally:
+                managed.last_active = time.monotonic()
+    
+    def clear(self, session_id: str) -> bool:
+        """Drop a session"""
+        return self._sessions.pop(session_id, None) is not None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Session counts, eviction metrics and per-session usage"""
+        self._expire(time.monotonic())
+        per_session = {session_id: managed.get_stats() for session_id, managed in self._sessions.items()}
+        return {
+            "sessions": len(self._sessions),
+            "total_tokens": sum(s["tokens"] for s in per_session.values()),
+            "total_memory_bytes": sum(s["memory_bytes"] for s in per_session.values()),
+            "evicted_sessions": self.evicted_sessions,
+            "expired_sessions": self.expired_sessions,
+            "per_session": per_session,
+        }
+    
+    def _evict(self, keep: str) -> bool:
+        """Evict the least recently used session not in use (False if every one is)"""
+        for session_id, managed in self._sessions.items():
+            if session_id != keep and not managed.lock.locked():
+                del self._sessions[session_id]
+                self.evicted_sessions += 1
+                return True
+        return False
+    
+    def _expire(self, now: float):
+        """Sweep idle sessions off the LRU end"""
+        while self._sessions:
+            session_id, managed = next(iter(self._sessions.items()))
+            if now - managed.last_active < self.idle_ttl or managed.lock.locked():
+                break
+            del self._sessions[session_id]
+            self.expired_sessions += 1
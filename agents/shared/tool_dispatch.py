@@ -0,0 +1,103 @@
+"""
+Concurrent execution of the function calls from one LLM turn
+"""
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# A tool handler receives the call's args dict, plus any per-request
+# context passed to dispatch() as keyword arguments
+ToolHandler = Callable[..., Awaitable[Any]]
+
+
+class _ToolStats:
+    """Running timing totals for one tool"""
+    
+    __slots__ = ("calls", "errors", "total_ms", "max_ms", "wait_ms")
+    
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.wait_ms = 0.0
+
+
+class ToolDispatcher:
+    """
+    Runs a turn's function calls concurrently, at most `max_concurrency` at a time
+    
+    Responses come back in the order the model issued the calls, so a
+    40-call turn costs roughly 40 / max_concurrency call latencies instead
+    of 40. A call that raises is answered with {"error": ...} rather than
+    failing the whole turn. Each call's queue wait and run time is logged
+    and accumulated per tool (see get_stats).
+    """
+    
+    def __init__(self, handlers: Dict[str, ToolHandler], max_concurrency: int = 8):
+        self.handlers = handlers
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._stats: Dict[str, _ToolStats] = defaultdict(_ToolStats)
+    
+    async def dispatch(
+        self,
+        function_calls: List[Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute function calls and return [{"id", "result"}] in call order
+        
+        `context` (e.g. the session_id) is passed to every handler as
+        keyword arguments, separate from the model-supplied args.
+        """
+        results = await asyncio.gather(*[self._run(fc, context or {}) for fc in function_calls])
+        return [{"id": fc.id, "result": result} for fc, result in zip(function_calls, results)]
+    
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-tool call counts, errors and timings (ms)"""
+        return {
+            name: {
+                "calls": stats.calls,
+                "errors": stats.errors,
+                "avg_ms": round(stats.total_ms / stats.calls, 2) if stats.calls else 0.0,
+                "max_ms": round(stats.max_ms, 2),
+                "avg_wait_ms": round(stats.wait_ms / stats.calls, 2) if stats.calls else 0.0,
+            }
+            for name, stats in self._stats.items()
+        }
+    
+    async def _run(self, fc: Any, context: Dict[str, Any]) -> Any:
+        """Execute one call under the semaphore"""
+        handler = self.handlers.get(fc.name)
+        if handler is None:
+            logger.warning(f"Unknown function: {fc.name}")
+            return {"error": f"Unknown function: {fc.name}"}
+        
+        queued = time.perf_counter()
+        async with self._semaphore:
+            started = time.perf_counter()
+            failed = False
+            try:
+                return await handler(fc.args or {}, **context)
+            except Exception as e:
+                failed = True
+                logger.error(f"Function {fc.name} failed: {e}")
+                return {"error": str(e)}
+            finally:
+                finished = time.perf_counter()
+                self._record(fc.name, (started - queued) * 1000, (finished - started) * 1000, failed)
+    
+    def _record(self, name: str, wait_ms: float, run_ms: float, failed: bool):
+        """Log and accumulate one call's timing"""
+        stats = self._stats[name]
+        stats.calls += 1
+        stats.errors += failed
+        stats.total_ms += run_ms
+        stats.max_ms = max(stats.max_ms, run_ms)
+        stats.wait_ms += wait_ms
+        logger.info(f"Function {name} took {run_ms:.1f}ms (queued {wait_ms:.1f}ms)")
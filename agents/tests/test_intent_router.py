@@ -0,0 +1,75 @@
+"""
+Intent router tests
+
+Run from the repository root:
+    python -m pytest agents/tests
+"""
+import pytest
+
+from agents.orchestrator.intent_examples import EVALUATION_EXAMPLES
+from agents.orchestrator.intent_router import IntentRouter
+
+
+@pytest.fixture(scope="module")
+def router():
+    return IntentRouter()
+
+
+def test_features_replace_sme_mentions_with_a_placeholder(router):
+    features, sme_id = router.features("Deep dive on SME #0445 and TechStart")
+    
+    assert sme_id == "#0445"
+    assert features.count("__sme__") == 2
+    assert "0445" not in " ".join(features)
+    assert router.features("Analyze GreenLeaf Products")[1] == "#0445"
+
+
+@pytest.mark.parametrize("text, intent, sme_id", [
+    ("What if interest rates rise by 2%?", "scenario", None),
+    ("Deep dive on SME #0445", "sme", "#0445"),
+    ("Full analysis of TechStart Solutions", "sme", "#0142"),
+    ("Show me the news feed", "chat", None),
+])
+def test_routes_obvious_requests(router, text, intent, sme_id):
+    decision = router.route(text)
+    
+    assert decision is not None
+    assert (decision.intent, decision.sme_id) == (intent, sme_id)
+    assert decision.confidence >= router.threshold
+
+
+@pytest.mark.parametrize("text", [
+    "Create a task for #0142",
+    "Send an email to TechStart",
+    "Book a meeting with GreenLeaf",
+    "",
+])
+def test_unfamiliar_inputs_go_to_the_llm(router, text):
+    # Overconfident posteriors alone would route the first one to the SME agent
+    assert router.route(text) is None
+
+
+def test_sme_deep_dive_without_an_sme_goes_to_the_llm(router):
+    assert router.classify("Give me a full in-depth analysis")[0] == "sme"
+    assert router.route("Give me a full in-depth analysis") is None
+
+
+def test_low_confidence_goes_to_the_llm(router):
+    text = "Hi there"
+    _, confidence, _ = router.classify(text)
+    
+    assert confidence < router.threshold
+    assert router.route(text) is None
+
+
+def test_held_out_routes_are_correct():
+    router = IntentRouter()
+    routed = 0
+    for text, intent, sme_id in EVALUATION_EXAMPLES:
+        decision = router.route(text)
+        if decision is None:
+            continue
+        routed += 1
+        assert (decision.intent, decision.sme_id if intent == "sme" else None) == (intent, sme_id), text
+    
+    assert routed / len(EVALUATION_EXAMPLES) >= 0.9
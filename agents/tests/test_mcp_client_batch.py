@@ -0,0 +1,108 @@
+"""
+MCP client batch round-trip tests against the /rpc endpoint
+
+Run from the repository root:
+    python -m pytest agents/tests
+"""
+import asyncio
+import importlib.util
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from agents.shared.mcp_client import MCPClient
+
+# mcp-servers isn't an importable package name, so load the RPC module by path
+_spec = importlib.util.spec_from_file_location(
+    "mcp_rpc", Path(__file__).resolve().parents[2] / "mcp-servers" / "shared" / "rpc.py"
+)
+rpc = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(rpc)
+
+
+async def get_company(company_id):
+    return {"company_id": company_id}
+
+
+async def get_traffic(company_id, delay=0.0):
+    await asyncio.sleep(delay)
+    return {"visits": 100}
+
+
+def mcp_client(transport: httpx.AsyncBaseTransport) -> MCPClient:
+    client = MCPClient("http://mcp")
+    client._client = httpx.AsyncClient(transport=transport, base_url="http://mcp")
+    return client
+
+
+@pytest.fixture
+def rpc_app():
+    dispatcher = rpc.RPCDispatcher()
+    dispatcher.register(
+        "data",
+        SimpleNamespace(get_company=get_company, get_traffic=get_traffic),
+        ["get_company", "get_traffic"],
+    )
+    app = FastAPI()
+    app.include_router(rpc.create_rpc_router(dispatcher))
+    return app
+
+
+@pytest.mark.asyncio
+async def test_batch_round_trip(rpc_app):
+    client = mcp_client(httpx.ASGITransport(app=rpc_app))
+    
+    results = await client.call_tools_batch([
+        ("data", "get_company", {"company_id": "#0142"}),
+        ("data", "missing_tool", {}),
+        ("data", "get_traffic", {"company_id": "#0142"}),
+    ])
+    
+    assert results[0] == {"company_id": "#0142"}
+    assert results[1] == {"error": "Method not found: data/missing_tool"}
+    assert results[2] == {"visits": 100}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_call_timeout_header_fails_only_the_slow_source(rpc_app):
+    client = mcp_client(httpx.ASGITransport(app=rpc_app))
+    
+    by_name, unavailable = await client.fan_out({
+        "company": ("data", "get_company", {"company_id": "#0142"}),
+        "traffic": ("data", "get_traffic", {"company_id": "#0142", "delay": 1.0}),
+    }, timeout=0.05)
+    
+    assert by_name["company"] == {"company_id": "#0142"}
+    assert unavailable == ["traffic"]
+    assert "Timed out" in by_name["traffic"]["error"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batch_results_are_matched_by_id():
+    seen = {}
+    
+    def reversed_batch(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        seen["timeout"] = request.headers.get("X-MCP-Call-Timeout")
+        # Answer out of order and drop one call entirely
+        return httpx.Response(200, json=[
+            {"jsonrpc": "2.0", "result": call["method"], "id": call["id"]}
+            for call in reversed(body[1:])
+        ])
+    
+    client = mcp_client(httpx.MockTransport(reversed_batch))
+    
+    results = await client.call_tools_batch(
+        [("a", "one", {}), ("b", "two", {}), ("c", "three", {})],
+        timeout=2.5,
+    )
+    
+    assert results == [{"error": "No response for a/one"}, "b/two", "c/three"]
+    assert seen["timeout"] == "2.5"
+    await client.aclose()
@@ -0,0 +1,161 @@
+"""
+Agent session manager tests
+
+Run from the repository root:
+    python -m pytest agents/tests
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agents.shared.session_manager import SessionManager
+
+
+class FakeSession:
+    """Model session that echoes and records what it was given"""
+    
+    def __init__(self, session_id, history):
+        self.session_id = session_id
+        self.history = history or []
+        self.received = []
+    
+    async def send_message_async(self, message):
+        self.received.append(message)
+        return SimpleNamespace(function_calls=None, text=f"reply to {message}")
+
+
+class FakeAgent:
+    def __init__(self):
+        self.sessions = []
+    
+    async def start_session_async(self, session_id, history=None):
+        session = FakeSession(session_id, history)
+        self.sessions.append(session)
+        return session
+
+
+@pytest.fixture
+def agent():
+    return FakeAgent()
+
+
+@pytest.mark.asyncio
+async def test_session_is_reused_per_session_id(agent):
+    manager = SessionManager(lambda: agent)
+    
+    for text in ("one", "two"):
+        async with manager.session("a") as session:
+            await session.send_message(text)
+    
+    assert len(agent.sessions) == 1
+    assert agent.sessions[0].received == ["one", "two"]
+    assert manager.get_stats()["per_session"]["a"]["turns"] == 4
+
+
+@pytest.mark.asyncio
+async def test_trim_replays_retained_turns_as_separate_entries(agent):
+    manager = SessionManager(lambda: agent, max_history_tokens=30)
+    messages = [f"message number {i} " + "x" * 20 for i in range(6)]
+    
+    for text in messages:
+        async with manager.session("a") as session:
+            await session.send_message(text)
+    
+    rotated = agent.sessions[-1]
+    assert len(agent.sessions) > 2
+    assert rotated.session_id == f"a#{len(agent.sessions) - 1}"
+    # The new message goes in untouched, never wrapped in a transcript
+    assert rotated.received == [messages[-1]]
+    assert rotated.history and rotated.history[0]["role"] == "user"
+    for entry in rotated.history:
+        assert entry["role"] in ("user", "model")
+        assert len(entry["parts"]) == 1
+        assert "Conversation so far" not in entry["parts"][0]["text"]
+    
+    stats = manager.get_stats()["per_session"]["a"]
+    assert stats["tokens"] <= 30 + 2 * 15
+
+
+@pytest.mark.asyncio
+async def test_repeated_rotations_do_not_nest_history(agent):
+    manager = SessionManager(lambda: agent, max_history_tokens=60)
+    
+    for i in range(10):
+        async with manager.session("a") as session:
+            await session.send_message(f"question {i} " + "y" * 30)
+    
+    replayed = [entry["parts"][0]["text"] for s in agent.sessions for entry in s.history]
+    assert len(agent.sessions) > 3 and replayed
+    assert max(map(len, replayed)) <= len("reply to question 9 " + "y" * 30)
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_skips_sessions_in_use(agent):
+    manager = SessionManager(lambda: agent, max_sessions=2)
+    release = asyncio.Event()
+    
+    async def hold_a():
+        async with manager.session("a") as session:
+            await session.send_message("hold")
+            await release.wait()
+    
+    holder = asyncio.create_task(hold_a())
+    await asyncio.sleep(0)
+    
+    async with manager.session("b") as session:
+        await session.send_message("b")
+    async with manager.session("c") as session:
+        await session.send_message("c")
+    
+    # "a" is least recently used but busy, so "b" went instead
+    assert set(manager._sessions) == {"a", "c"}
+    assert manager.evicted_sessions == 1
+    
+    release.set()
+    await holder
+
+
+@pytest.mark.asyncio
+async def test_idle_sessions_expire(agent):
+    manager = SessionManager(lambda: agent, idle_ttl=0)
+    async with manager.session("a") as session:
+        await session.send_message("hi")
+    
+    assert manager.get_stats()["sessions"] == 0
+    assert manager.expired_sessions == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_request_restarts_session(agent):
+    manager = SessionManager(lambda: agent)
+    
+    with pytest.raises(RuntimeError):
+        async with manager.session("a") as session:
+            await session.send_message("first")
+            raise RuntimeError("tool loop failed")
+    
+    async with manager.session("a") as session:
+        await session.send_message("second")
+    
+    assert len(agent.sessions) == 2
+    assert [e["parts"][0]["text"] for e in agent.sessions[1].history] == ["first", "reply to first"]
+
+
+@pytest.mark.asyncio
+async def test_turns_answered_elsewhere_are_replayed_to_the_model(agent):
+    manager = SessionManager(lambda: agent)
+    
+    async with manager.session("a") as session:
+        await session.send_message("one")
+    async with manager.session("a") as session:
+        session.record_turn("fast path question", "fast path answer")
+    async with manager.session("a") as session:
+        await session.send_message("two")
+    
+    # The first model session never saw the fast-path turn, so a fresh one replays it
+    assert len(agent.sessions) == 2
+    assert [entry["parts"][0]["text"] for entry in agent.sessions[1].history] == [
+        "one", "reply to one", "fast path question", "fast path answer",
+    ]
+    assert agent.sessions[1].received == ["two"]
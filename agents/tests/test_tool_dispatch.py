@@ -0,0 +1,50 @@
+"""
+Tool dispatcher tests
+
+Run from the repository root:
+    python -m pytest agents/tests
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from agents.shared.tool_dispatch import ToolDispatcher
+
+
+def call(id, name, **args):
+    return SimpleNamespace(id=id, name=name, args=args)
+
+
+@pytest.mark.asyncio
+async def test_results_in_call_order_with_errors_isolated():
+    async def echo(args):
+        return args["value"]
+    
+    async def boom(args):
+        raise ValueError("bad input")
+    
+    tools = ToolDispatcher({"echo": echo, "boom": boom}, max_concurrency=2)
+    
+    results = await tools.dispatch([call("1", "echo", value=1), call("2", "boom"), call("3", "missing"), call("4", "echo", value=4)])
+    
+    assert [r["id"] for r in results] == ["1", "2", "3", "4"]
+    assert results[0]["result"] == 1 and results[3]["result"] == 4
+    assert results[1]["result"] == {"error": "bad input"}
+    assert "error" in results[2]["result"]
+    assert tools.get_stats()["boom"]["errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_context_reaches_handlers_separately_from_args():
+    seen = []
+    
+    async def route(args, session_id="default"):
+        seen.append((args["query"], session_id))
+        return "ok"
+    
+    tools = ToolDispatcher({"route": route})
+    
+    await tools.dispatch([call("1", "route", query="hi", session_id="spoofed")], context={"session_id": "s-42"})
+    await tools.dispatch([call("2", "route", query="again")])
+    
+    assert seen == [("hi", "s-42"), ("again", "default")]
@@ -2,7 +2,7 @@
 API routes aggregator
 """
 from fastapi import APIRouter
-from app.api.v1 import portfolio, scenarios, tasks, news, chat, activities
+from app.api.v1 import portfolio, scenarios, tasks, news, chat, activities, events
 
 api_router = APIRouter()
 
@@ -42,3 +42,9 @@ api_router.include_router(
     prefix="/v1/activities",
     tags=["activities"]
 )
+
+api_router.include_router(
+    events.router,
+    prefix="/v1/events",
+    tags=["events"]
+)
@@ -1,8 +1,8 @@
 """
 Activities API endpoints
 """
-from fastapi import APIRouter
-from typing import List
+from fastapi import APIRouter, Query
+from typing import List, Optional
 from app.models.activity import Activity
 from app.services.activity_service import ActivityService
 
@@ -11,6 +11,10 @@ activity_service = ActivityService()
 
 
 @router.get("/", response_model=List[Activity])
-async def get_activities():
-    """Get system activities"""
-    return activity_service.get_all_activities()
+async def get_activities(
+    since: Optional[int] = Query(None, ge=0, description="Only activities with seq greater than this"),
+    before: Optional[int] = Query(None, ge=1, description="Only activities with seq less than this (history paging)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum activities to return")
+):
+    """Get system activities, newest first"""
+    return activity_service.get_activities(since=since, before=before, limit=limit)
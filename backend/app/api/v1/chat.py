@@ -1,8 +1,10 @@
 """
 Chat API endpoints
 """
-from fastapi import APIRouter
-from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional
+import json
 from app.models.chat import ChatMessage, ChatRequest
 from app.services.chat_service import ChatService
 
@@ -13,10 +15,45 @@ chat_service = ChatService()
 @router.post("/message", response_model=ChatMessage)
 async def send_message(request: ChatRequest):
     """Send message to AI assistant"""
-    return await chat_service.process_message(request.message)
+    return await chat_service.process_message(request.message, session_id=request.session_id)
+
+
+@router.post("/stream")
+async def stream_message(request: ChatRequest):
+    """Send message to AI assistant and stream the reply as Server-Sent Events"""
+    async def _frames() -> AsyncIterator[str]:
+        async for event in chat_service.stream_message(request.message, session_id=request.session_id):
+            yield f"data: {json.dumps(event)}\n\n"
+    
+    return StreamingResponse(
+        _frames(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
 
 
 @router.get("/history", response_model=List[ChatMessage])
-async def get_chat_history():
-    """Get chat history"""
-    return chat_service.get_history()
+async def get_chat_history(
+    session_id: str = Query(..., min_length=1, max_length=128),
+    before: Optional[str] = Query(None, description="Only messages older than this message ID"),
+    limit: int = Query(100, ge=1, le=500)
+):
+    """Get chat history for a session (one page, oldest first)"""
+    return chat_service.get_history(session_id, before=before, limit=limit)
+
+
+@router.delete("/history")
+async def clear_chat_history(session_id: str = Query(..., min_length=1, max_length=128)):
+    """Clear chat history for a session"""
+    if not chat_service.clear_history(session_id):
+        raise HTTPException(status_code=404, detail=f"Chat session {session_id} not found")
+    return {"message": f"Chat session {session_id} cleared"}
+
+
+@router.get("/stats")
+async def get_chat_stats():
+    """Chat session metrics"""
+    return chat_service.get_stats()
@@ -0,0 +1,65 @@
+"""
+Server-Sent Events endpoint - fallback transport for real-time updates
+"""
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Optional
+import json
+
+from app.config import settings
+from app.api.v1.websocket import event_log, manager
+from app.services.event_log import parse_cursor
+
+router = APIRouter()
+
+
+async def _event_stream(request: Request, cursor: int, boot_id: Optional[str]) -> AsyncIterator[str]:
+    """Follow the shared event log from cursor until the client goes away"""
+    # Tell EventSource how long to wait before reconnecting
+    yield f"retry: {settings.SSE_RETRY_MS}\n\n"
+    yield f"data: {json.dumps(manager.hello_frame())}\n\n"
+    
+    while not await request.is_disconnected():
+        events = event_log.since(cursor, boot_id)
+        
+        if events is None:
+            # Gap was evicted from the ring, or the cursor is from another boot;
+            # client must reload via REST
+            cursor, boot_id = event_log.last_seq, event_log.boot_id
+            yield f"data: {json.dumps(manager.resync_frame())}\n\n"
+            continue
+        
+        for event in events:
+            yield event.sse_frame
+            cursor = event.seq
+        
+        if not await event_log.wait(cursor, timeout=settings.WS_HEARTBEAT_INTERVAL):
+            # Comment frame keeps proxies from closing an idle stream
+            yield ": keep-alive\n\n"
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    last_seq: Optional[int] = Query(None, ge=0, description="Resume after this sequence number"),
+    boot_id: Optional[str] = Query(None, description="Boot ID the last_seq cursor belongs to"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """Stream real-time updates as Server-Sent Events"""
+    # EventSource sends Last-Event-ID ("<boot_id>:<seq>") on automatic
+    # reconnects, and it is newer than the last_seq baked into the original URL
+    cursor = last_seq
+    event_boot_id, event_seq = parse_cursor(last_event_id)
+    if event_seq is not None:
+        cursor, boot_id = event_seq, event_boot_id
+    if cursor is None:
+        cursor, boot_id = event_log.last_seq, event_log.boot_id
+    
+    return StreamingResponse(
+        _event_stream(request, cursor, boot_id),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
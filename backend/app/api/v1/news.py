@@ -1,9 +1,10 @@
 """
 News & Events API endpoints
 """
-from fastapi import APIRouter
-from typing import List
-from app.models.news import PredictedEvent, NewsItem
+from fastapi import APIRouter, Query
+from typing import List, Literal, Optional
+from datetime import datetime
+from app.models.news import PredictedEvent, NewsItem, NewsIngestResult
 from app.services.news_service import NewsService
 
 router = APIRouter()
@@ -11,12 +12,32 @@ news_service = NewsService()
 
 
 @router.get("/predicted-events", response_model=List[PredictedEvent])
-async def get_predicted_events():
-    """Get predicted events (next 90 days)"""
-    return news_service.get_predicted_events()
+async def get_predicted_events(
+    days: int = Query(90, ge=1, le=3650, description="Look-ahead window in days")
+):
+    """Get predicted events (next 90 days by default)"""
+    return news_service.get_predicted_events(within_days=days)
 
 
 @router.get("/intelligence", response_model=List[NewsItem])
-async def get_news_intelligence():
-    """Get news intelligence items"""
-    return news_service.get_news_intelligence()
+async def get_news_intelligence(
+    since: Optional[datetime] = Query(None, description="Only items detected after this timestamp"),
+    severity: Optional[Literal["critical", "warning", "info"]] = Query(None, description="Filter by severity"),
+    sme_id: Optional[str] = Query(None, description="Filter by SME"),
+    type: Optional[Literal["departure", "payment_delay", "churn", "other"]] = Query(None, description="Filter by news type"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Maximum items to return")
+):
+    """Get news intelligence items, newest first"""
+    return news_service.get_news_intelligence(
+        since=since,
+        severity=severity,
+        sme_id=sme_id,
+        news_type=type,
+        limit=limit
+    )
+
+
+@router.post("/intelligence", response_model=NewsIngestResult)
+async def ingest_news_item(item: NewsItem):
+    """Ingest a news item (near-duplicates are merged into the existing item)"""
+    return await news_service.ingest_news_item(item)
@@ -1,9 +1,10 @@
 """
 Tasks API endpoints
 """
-from fastapi import APIRouter, HTTPException
-from typing import List
-from app.models.task import Task
+from fastapi import APIRouter, HTTPException, Query, Response
+from typing import List, Literal, Optional
+from datetime import datetime
+from app.models.task import Task, BulkTaskCreate, BulkTaskUpdate, BulkTaskComplete
 from app.services.task_service import TaskService
 
 router = APIRouter()
@@ -11,15 +12,65 @@ task_service = TaskService()
 
 
 @router.get("/", response_model=List[Task])
-async def get_tasks():
-    """Get all tasks"""
-    return task_service.get_all_tasks()
+async def get_tasks(
+    response: Response,
+    status: Optional[Literal["overdue", "due_today", "upcoming", "completed"]] = None,
+    assignee: Optional[str] = None,
+    sme_id: Optional[str] = None,
+    due_after: Optional[datetime] = Query(None, description="Only tasks due at or after this time"),
+    due_before: Optional[datetime] = Query(None, description="Only tasks due at or before this time"),
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+):
+    """Get tasks in due-date order, optionally filtered and paginated"""
+    tasks, total = task_service.query_tasks(
+        status=status,
+        assignee=assignee,
+        sme_id=sme_id,
+        due_after=due_after,
+        due_before=due_before,
+        offset=offset,
+        limit=limit,
+    )
+    response.headers["X-Total-Count"] = str(total)
+    return tasks
 
 
 @router.post("/", response_model=Task)
 async def create_task(task: Task):
     """Create new task"""
-    return task_service.create_task(task)
+    created = await task_service.create_task(task)
+    if not created:
+        raise HTTPException(status_code=409, detail=f"Task {task.id} already exists")
+    return created
+
+
+# Bulk routes are registered before /{task_id} so "bulk" isn't taken as an ID
+@router.post("/bulk", response_model=List[Task])
+async def bulk_create_tasks(request: BulkTaskCreate):
+    """Create many tasks in one atomic operation"""
+    tasks, errors = await task_service.bulk_create_tasks(request.tasks)
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+    return tasks
+
+
+@router.patch("/bulk", response_model=List[Task])
+async def bulk_update_tasks(request: BulkTaskUpdate):
+    """Update (e.g. reassign) many tasks in one atomic operation"""
+    tasks, errors = await task_service.bulk_update_tasks(request.updates)
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+    return tasks
+
+
+@router.post("/bulk/complete", response_model=List[Task])
+async def bulk_complete_tasks(request: BulkTaskComplete):
+    """Mark many tasks complete in one atomic operation"""
+    tasks, errors = await task_service.bulk_complete_tasks(request.ids)
+    if errors:
+        raise HTTPException(status_code=404, detail=errors)
+    return tasks
 
 
 @router.get("/{task_id}", response_model=Task)
@@ -34,7 +85,7 @@ async def get_task(task_id: str):
 @router.patch("/{task_id}", response_model=Task)
 async def update_task(task_id: str, updates: dict):
     """Update task"""
-    task = task_service.update_task(task_id, updates)
+    task = await task_service.update_task(task_id, updates)
     if not task:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
     return task
@@ -43,7 +94,7 @@ async def update_task(task_id: str, updates: dict):
 @router.delete("/{task_id}")
 async def delete_task(task_id: str):
     """Delete task"""
-    success = task_service.delete_task(task_id)
+    success = await task_service.delete_task(task_id)
     if not success:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
     return {"message": "Task deleted successfully"}
@@ -52,7 +103,7 @@ async def delete_task(task_id: str):
 @router.post("/{task_id}/complete", response_model=Task)
 async def complete_task(task_id: str):
     """Mark task as complete"""
-    task = task_service.complete_task(task_id)
+    task = await task_service.complete_task(task_id)
     if not task:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
     return task
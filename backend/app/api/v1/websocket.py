@@ -2,55 +2,320 @@
 WebSocket endpoint for real-time updates
 """
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import List
+from typing import Dict, List, Optional, Set
 import asyncio
 import json
 import logging
+import time
+
+from app.config import settings
+from app.models.event import Event
+from app.services.event_log import EventLog
+from app.services.timer_wheel import TimerWheel
 
 logger = logging.getLogger(__name__)
 
+# Heartbeat wheel resolution in seconds
+HEARTBEAT_TICK = 1.0
+
+# Longest a reap waits on the close handshake of a dead socket
+REAP_CLOSE_TIMEOUT = 5.0
+
+
+class ClientConnection:
+    """Per-socket state tracked by the connection manager"""
+    
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self.connected_at = time.monotonic()
+        self.last_seen = self.connected_at
+        # Events up to this seq already reached the client (hello, replay or resync)
+        self.delivered_seq = 0
+    
+    def touch(self):
+        """Record inbound traffic from the client"""
+        self.last_seen = time.monotonic()
+
 
 class ConnectionManager:
     """WebSocket connection manager"""
     
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(self, event_log: EventLog):
+        # Keyed by id(websocket), the same key the heartbeat wheel's timers use,
+        # so expired timers map straight back to their connection
+        self.active_connections: Dict[int, ClientConnection] = {}
+        self.event_log = event_log
+        
+        # One wheel drives pings and idle checks for every socket
+        self._wheel = TimerWheel(
+            tick=HEARTBEAT_TICK,
+            slots=int(settings.WS_HEARTBEAT_INTERVAL / HEARTBEAT_TICK) + 1
+        )
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._heartbeat_sends: Set[asyncio.Future] = set()
+        
+        # Events waiting for the current flush window
+        self._pending: List[Event] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_now = asyncio.Event()
+        
+        # Metrics
+        self.total_connections = 0
+        self.peak_connections = 0
+        self.reaped_connections = 0
+        self.pings_sent = 0
+        self.frames_flushed = 0
+        self.events_flushed = 0
     
-    async def connect(self, websocket: WebSocket):
-        """Accept new connection"""
+    async def connect(
+        self,
+        websocket: WebSocket,
+        last_seq: Optional[int] = None,
+        boot_id: Optional[str] = None
+    ) -> ClientConnection:
+        """Accept new connection, replaying missed events when resuming"""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        
+        # Tell the client which event log its cursor now refers to
+        await self.send_personal_message(self.hello_frame(), websocket)
+        
+        if last_seq is not None:
+            await self.replay(websocket, last_seq, boot_id)
+        
+        # Replay caught up with the log, so anything still pending up to the
+        # current seq was either replayed or predates the hello's cursor
+        connection = ClientConnection(websocket)
+        connection.delivered_seq = self.event_log.last_seq
+        self.active_connections[id(websocket)] = connection
+        self._wheel.schedule(id(websocket), settings.WS_HEARTBEAT_INTERVAL)
+        
+        self.total_connections += 1
+        self.peak_connections = max(self.peak_connections, len(self.active_connections))
         logger.info(f"WebSocket connected. Active connections: {len(self.active_connections)}")
+        return connection
+    
+    def hello_frame(self) -> dict:
+        """Greeting with the event log's boot ID and current sequence number"""
+        return {
+            "type": "hello",
+            "data": {"boot_id": self.event_log.boot_id, "last_seq": self.event_log.last_seq},
+        }
+    
+    def resync_frame(self) -> dict:
+        """Tell the client its cursor is unusable and where the log is now"""
+        return {
+            "type": "resync_required",
+            "data": {"boot_id": self.event_log.boot_id, "last_seq": self.event_log.last_seq},
+        }
+    
+    async def replay(self, websocket: WebSocket, last_seq: int, boot_id: Optional[str] = None) -> int:
+        """
+        Send events published after last_seq, returning the seq the client is now at
+        Loops until caught up so nothing published mid-replay is lost; the
+        caller registers the connection right after, with no await between.
+        A cursor from another boot (or an evicted gap) gets a resync instead.
+        """
+        cursor = last_seq
+        while True:
+            missed = self.event_log.since(cursor, boot_id)
+            
+            if missed is None:
+                resync = self.resync_frame()
+                await self.send_personal_message(resync, websocket)
+                return resync["data"]["last_seq"]
+            
+            if not missed:
+                return cursor
+            
+            await websocket.send_text(self._encode_frame(missed))
+            cursor = missed[-1].seq
     
     def disconnect(self, websocket: WebSocket):
         """Remove connection"""
-        self.active_connections.remove(websocket)
+        if self.active_connections.pop(id(websocket), None) is None:
+            return
+        self._wheel.cancel(id(websocket))
         logger.info(f"WebSocket disconnected. Active connections: {len(self.active_connections)}")
     
+    async def reap(self, websocket: WebSocket, reason: str):
+        """Drop a dead or idle connection and close the socket"""
+        if id(websocket) not in self.active_connections:
+            return
+        
+        self.disconnect(websocket)
+        self.reaped_connections += 1
+        logger.info(f"Reaped WebSocket connection: {reason}")
+        
+        try:
+            await asyncio.wait_for(websocket.close(code=1001), timeout=REAP_CLOSE_TIMEOUT)
+        except Exception:
+            # Socket is usually already half-open or gone
+            pass
+    
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send message to specific client"""
         await websocket.send_json(message)
     
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients"""
-        for connection in self.active_connections:
+    def publish(self, event: Event):
+        """
+        Queue event for the current flush window
+        Events published within WS_BATCH_WINDOW_MS go out as one frame per
+        client; a full batch is flushed straight away.
+        """
+        self._pending.append(event)
+        if settings.WS_BATCH_WINDOW_MS <= 0 or len(self._pending) >= settings.WS_BATCH_MAX_EVENTS:
+            self._flush_now.set()
+        
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._run_flush())
+    
+    async def _run_flush(self):
+        """Wait out the window, then flush until nothing is pending"""
+        try:
             try:
-                await connection.send_json(message)
+                await asyncio.wait_for(
+                    self._flush_now.wait(),
+                    timeout=settings.WS_BATCH_WINDOW_MS / 1000
+                )
+            except asyncio.TimeoutError:
+                pass
+            
+            # Events published while sending join the next frame, not a new window
+            while self._pending:
+                self._flush_now.clear()
+                batch = self._pending[:settings.WS_BATCH_MAX_EVENTS]
+                del self._pending[:len(batch)]
+                await self.broadcast(batch)
+        finally:
+            self._flush_now.clear()
+            self._flush_task = None
+    
+    def _encode_frame(self, events: List[Event]) -> str:
+        """One frame for a run of events, built from their cached encodings"""
+        if len(events) == 1:
+            return events[0].payload
+        return '{"type":"batch","events":[' + ",".join(e.payload for e in events) + "]}"
+    
+    async def broadcast(self, events: List[Event]):
+        """Broadcast events to all connected clients (encoded once, not per client)"""
+        frame = self._encode_frame(events)
+        self.frames_flushed += 1
+        self.events_flushed += len(events)
+        
+        for connection in list(self.active_connections.values()):
+            text = frame
+            if connection.delivered_seq >= events[0].seq:
+                # Just replayed: drop what the replay already sent
+                fresh = [event for event in events if event.seq > connection.delivered_seq]
+                if not fresh:
+                    continue
+                text = self._encode_frame(fresh)
+            
+            try:
+                await connection.websocket.send_text(text)
             except Exception as e:
                 logger.error(f"Error broadcasting to client: {e}")
+                await self.reap(connection.websocket, "broadcast failed")
+    
+    async def start_heartbeat(self):
+        """Start the shared heartbeat ticker"""
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._run_heartbeat())
+    
+    async def stop_heartbeat(self):
+        """Stop the shared heartbeat ticker"""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+    
+    async def _run_heartbeat(self):
+        """Advance the wheel once per tick and service expired timers"""
+        while True:
+            await asyncio.sleep(HEARTBEAT_TICK)
+            try:
+                await self._heartbeat(self._wheel.advance())
+            except Exception as e:
+                logger.error(f"Heartbeat error: {e}")
+    
+    async def _heartbeat(self, expired: List[int]):
+        """Ping due connections and reap those idle past the timeout"""
+        now = time.monotonic()
+        sends = []
+        
+        for key in expired:
+            connection = self.active_connections.get(key)
+            if connection is None:
+                continue
+            
+            if now - connection.last_seen >= settings.WS_IDLE_TIMEOUT:
+                sends.append(self.reap(connection.websocket, "idle timeout"))
+                continue
+            
+            self._wheel.schedule(key, settings.WS_HEARTBEAT_INTERVAL)
+            sends.append(self._ping(connection))
+        
+        if sends:
+            # Pings and close handshakes run off the ticker, so a slow
+            # socket can't stall it for everyone else
+            task = asyncio.gather(*sends)
+            self._heartbeat_sends.add(task)
+            task.add_done_callback(self._heartbeat_sends.discard)
+    
+    async def _ping(self, connection: ClientConnection):
+        """Send a server ping; a socket that can't take it within an interval is dead"""
+        try:
+            await asyncio.wait_for(
+                connection.websocket.send_json({"type": "ping", "timestamp": int(time.time() * 1000)}),
+                timeout=settings.WS_HEARTBEAT_INTERVAL
+            )
+            self.pings_sent += 1
+        except Exception:
+            await self.reap(connection.websocket, "ping failed")
+    
+    def get_stats(self) -> dict:
+        """Connection and reaping metrics"""
+        return {
+            "active_connections": len(self.active_connections),
+            "peak_connections": self.peak_connections,
+            "total_connections": self.total_connections,
+            "reaped_connections": self.reaped_connections,
+            "pings_sent": self.pings_sent,
+            "frames_flushed": self.frames_flushed,
+            "events_flushed": self.events_flushed,
+            "pending_events": len(self._pending),
+            "scheduled_timers": len(self._wheel),
+        }
 
 
-manager = ConnectionManager()
+event_log = EventLog(settings.WS_REPLAY_BUFFER_SIZE)
+manager = ConnectionManager(event_log)
+
+
+def _parse_seq(value) -> Optional[int]:
+    """Parse a client-supplied sequence number"""
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
 
 
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint handler"""
-    await manager.connect(websocket)
+    connection = await manager.connect(
+        websocket,
+        last_seq=_parse_seq(websocket.query_params.get("last_seq")),
+        boot_id=websocket.query_params.get("boot_id")
+    )
     
     try:
         while True:
             # Receive message from client
             data = await websocket.receive_text()
+            connection.touch()
             message = json.loads(data)
             
             # Handle different message types
@@ -63,6 +328,10 @@ async def websocket_endpoint(websocket: WebSocket):
                     websocket
                 )
             
+            elif msg_type == "pong":
+                # Reply to a server ping; touch() above already recorded it
+                pass
+            
             elif msg_type == "subscribe":
                 # Handle subscription (future implementation)
                 await manager.send_personal_message(
@@ -70,6 +339,13 @@ async def websocket_endpoint(websocket: WebSocket):
                     websocket
                 )
             
+            elif msg_type == "resume":
+                # Client missed events on an already-open socket
+                last_seq = _parse_seq(message.get("last_seq"))
+                if last_seq is not None:
+                    replayed = await manager.replay(websocket, last_seq, message.get("boot_id"))
+                    connection.delivered_seq = max(connection.delivered_seq, replayed)
+            
             else:
                 logger.warning(f"Unknown message type: {msg_type}")
     
@@ -84,9 +360,8 @@ async def websocket_endpoint(websocket: WebSocket):
 async def broadcast_update(update_type: str, data: dict):
     """
     Broadcast update to all connected clients
-    Called by services when data changes
+    Called by services when data changes; appending to the shared event log
+    also wakes SSE streams. WebSocket delivery is batched per flush window.
     """
-    await manager.broadcast({
-        "type": update_type,
-        "data": data
-    })
+    event = event_log.append(update_type, data)
+    manager.publish(event)
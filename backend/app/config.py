@@ -30,8 +30,38 @@ class Settings(BaseSettings):
     AGENT_ORCHESTRATOR_URL: str = "http://localhost:8080"
     MCP_SERVER_URL: str = "http://localhost:8001"
     
+    # IDs (10-bit node in every generated ID; give each worker process its own, 0-1023)
+    WORKER_ID: int = 0
+    
+    # Persistence (empty DATABASE_PATH keeps everything in memory)
+    DATABASE_PATH: str = "foresight.db"
+    DB_COMMIT_INTERVAL_MS: int = 50
+    DB_COMMIT_MAX_BATCH: int = 1000
+    
     # WebSocket
     WS_HEARTBEAT_INTERVAL: int = 30
+    WS_IDLE_TIMEOUT: int = 90
+    WS_REPLAY_BUFFER_SIZE: int = 1000
+    WS_BATCH_WINDOW_MS: int = 25
+    WS_BATCH_MAX_EVENTS: int = 500
+    
+    # Chat history (per session)
+    CHAT_MAX_SESSIONS: int = 1000
+    CHAT_MAX_MESSAGES_PER_SESSION: int = 200
+    CHAT_SESSION_TTL_SECONDS: int = 3600
+    
+    # News ingestion (near-duplicate detection)
+    NEWS_DEDUP_THRESHOLD: float = 0.5
+    
+    # Server-Sent Events
+    SSE_RETRY_MS: int = 3000
+    
+    # Activity feed (in-memory tail; empty ACTIVITY_LOG_DIR disables the on-disk history)
+    ACTIVITY_LOG_CAPACITY: int = 10000
+    ACTIVITY_LOG_DIR: str = "activity_log"
+    ACTIVITY_SEGMENT_BYTES: int = 64 * 1024 * 1024
+    ACTIVITY_INDEX_INTERVAL: int = 64
+    ACTIVITY_FSYNC_INTERVAL_MS: int = 1000
     
     class Config:
         env_file = ".env"
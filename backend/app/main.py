@@ -8,7 +8,10 @@ import logging
 
 from app.config import settings
 from app.api.routes import api_router
-from app.api.v1.websocket import websocket_endpoint
+from app.api.v1.websocket import websocket_endpoint, manager
+from app.api.v1.tasks import task_service
+from app.api.v1.activities import activity_service
+from app.services.persistence import PersistenceError, close_store
 
 # Configure logging
 logging.basicConfig(
@@ -40,12 +43,28 @@ async def startup_event():
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Debug mode: {settings.DEBUG}")
     logger.info(f"CORS origins: {settings.CORS_ORIGINS}")
+    
+    task_service.open()
+    activity_service.open()
+    await manager.start_heartbeat()
+    await task_service.start_scheduler()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Application shutdown"""
     logger.info("Shutting down application")
+    
+    await manager.stop_heartbeat()
+    await task_service.stop_scheduler()
+    activity_service.close()
+    close_store()
+
+
+@app.exception_handler(PersistenceError)
+async def persistence_error_handler(request, exc: PersistenceError):
+    """A write was applied in memory but could not be saved"""
+    return JSONResponse(status_code=503, content={"detail": f"Change could not be saved: {exc}"})
 
 
 @app.get("/")
@@ -64,6 +83,12 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/ws/stats")
+async def websocket_stats():
+    """WebSocket connection metrics"""
+    return manager.get_stats()
+
+
 # Include API routes
 app.include_router(api_router, prefix="/api")
 
@@ -1,10 +1,11 @@
 """Data models"""
 from .sme import SME, PortfolioMetrics, BreakdownData
 from .scenario import Scenario, ScenarioResults
-from .task import Task
-from .news import PredictedEvent, NewsItem
+from .task import Task, TaskUpdate, BulkTaskCreate, BulkTaskUpdate, BulkTaskComplete
+from .news import PredictedEvent, NewsItem, NewsIngestResult
 from .chat import ChatMessage
 from .activity import Activity
+from .event import Event
 
 __all__ = [
     "SME",
@@ -13,8 +14,14 @@ __all__ = [
     "Scenario",
     "ScenarioResults",
     "Task",
+    "TaskUpdate",
+    "BulkTaskCreate",
+    "BulkTaskUpdate",
+    "BulkTaskComplete",
     "PredictedEvent",
     "NewsItem",
+    "NewsIngestResult",
     "ChatMessage",
     "Activity",
+    "Event",
 ]
@@ -1,6 +1,6 @@
 """Activity data models"""
 from pydantic import BaseModel, Field
-from typing import Literal
+from typing import Literal, Optional
 
 
 class Activity(BaseModel):
@@ -11,3 +11,4 @@ class Activity(BaseModel):
         ..., description="Activity type"
     )
     message: str = Field(..., description="Activity message")
+    seq: Optional[int] = Field(None, description="Feed sequence number (cursor for since=)")
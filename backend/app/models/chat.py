@@ -14,3 +14,4 @@ class ChatMessage(BaseModel):
 class ChatRequest(BaseModel):
     """Chat request"""
     message: str = Field(..., description="User message")
+    session_id: str = Field(..., min_length=1, max_length=128, description="Chat session ID")
@@ -0,0 +1,33 @@
+"""Real-time event data models"""
+from pydantic import BaseModel, Field, PrivateAttr
+from typing import Optional
+
+
+class Event(BaseModel):
+    """Sequenced real-time update event"""
+    seq: int = Field(..., ge=1, description="Monotonic event sequence number")
+    type: str = Field(..., description="Event type (e.g., scenario_update)")
+    data: dict = Field(..., description="Event payload")
+    timestamp: str = Field(..., description="Event timestamp")
+    
+    _payload: Optional[str] = PrivateAttr(default=None)
+    _sse_frame: Optional[str] = PrivateAttr(default=None)
+    # Boot ID of the event log that assigned seq (sequence numbers restart with the server)
+    _boot_id: str = PrivateAttr(default="")
+    
+    @property
+    def payload(self) -> str:
+        """JSON encoding, computed once and shared by every client"""
+        if self._payload is None:
+            self._payload = self.model_dump_json()
+        return self._payload
+    
+    @property
+    def sse_frame(self) -> str:
+        """Server-Sent Events frame wrapping the shared JSON payload"""
+        if self._sse_frame is None:
+            # Unnamed frame: the payload carries the type, same as over WebSocket.
+            # The id carries the boot ID so Last-Event-ID resumes can detect a restart.
+            event_id = f"{self._boot_id}:{self.seq}" if self._boot_id else str(self.seq)
+            self._sse_frame = f"id: {event_id}\ndata: {self.payload}\n\n"
+        return self._sse_frame
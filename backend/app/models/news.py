@@ -32,3 +32,10 @@ class NewsItem(BaseModel):
     summary: str = Field(..., description="News summary")
     signals: List[dict] = Field(..., description="Data signals")
     recommendation: str = Field(..., description="AI recommendation")
+
+
+class NewsIngestResult(BaseModel):
+    """Outcome of ingesting a news item"""
+    item: NewsItem = Field(..., description="Stored item (the existing one when merged)")
+    merged: bool = Field(..., description="True if collapsed into a near-duplicate")
+    similarity: Optional[float] = Field(None, description="Estimated similarity to the merged item")
@@ -1,6 +1,6 @@
 """Task data models"""
 from pydantic import BaseModel, Field
-from typing import Literal
+from typing import List, Literal
 
 
 class Task(BaseModel):
@@ -19,3 +19,24 @@ class Task(BaseModel):
     description: str = Field(..., description="Task description")
     source: str = Field(..., description="Task source")
     created_at: str = Field(..., description="Creation timestamp")
+
+
+class TaskUpdate(BaseModel):
+    """Field updates for one task in a bulk update"""
+    id: str = Field(..., description="Task ID")
+    updates: dict = Field(..., description="Fields to change (e.g., assignee)")
+
+
+class BulkTaskCreate(BaseModel):
+    """Bulk task creation request"""
+    tasks: List[Task] = Field(..., min_length=1, max_length=5000, description="Tasks to create")
+
+
+class BulkTaskUpdate(BaseModel):
+    """Bulk task update request"""
+    updates: List[TaskUpdate] = Field(..., min_length=1, max_length=5000, description="Per-task updates")
+
+
+class BulkTaskComplete(BaseModel):
+    """Bulk task completion request"""
+    ids: List[str] = Field(..., min_length=1, max_length=5000, description="Task IDs to complete")
@@ -0,0 +1,72 @@
+"""
+Activity log - fixed-capacity ring buffer with sequence cursors
+"""
+from typing import List, Optional
+
+from app.models.activity import Activity
+
+
+class ActivityLog:
+    """
+    Ring buffer of the most recent activities
+    
+    Each activity gets a monotonic sequence number and lives in slot
+    seq % capacity, so appends are O(1), memory is capped, and reading
+    from a cursor jumps straight to the right slot (O(page)).
+    """
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._slots: List[Optional[Activity]] = [None] * capacity
+        self._last_seq = 0
+    
+    def __len__(self) -> int:
+        return min(self._last_seq, self.capacity)
+    
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the newest activity (0 if empty)"""
+        return self._last_seq
+    
+    @property
+    def first_seq(self) -> int:
+        """Sequence number of the oldest activity still held"""
+        return max(1, self._last_seq - self.capacity + 1)
+    
+    def append(self, activity: Activity, seq: Optional[int] = None) -> Activity:
+        """Store activity under the next (or a restored) sequence number"""
+        seq = seq if seq is not None else self._last_seq + 1
+        if seq <= self._last_seq:
+            raise ValueError(f"Activity seq {seq} is not after {self._last_seq}")
+        
+        # Clear slots skipped over by a restored seq so stale entries can't resurface
+        for skipped in range(max(self._last_seq + 1, seq - self.capacity + 1), seq):
+            self._slots[skipped % self.capacity] = None
+        
+        activity.seq = seq
+        self._slots[seq % self.capacity] = activity
+        self._last_seq = seq
+        return activity
+    
+    def latest(self, limit: Optional[int] = None) -> List[Activity]:
+        """Newest activities first"""
+        return self.since(self.first_seq - 1, limit, oldest_first=False)
+    
+    def since(self, cursor: int, limit: Optional[int] = None, oldest_first: bool = True) -> List[Activity]:
+        """
+        Activities with seq > cursor, newest first
+        
+        With a limit, oldest_first picks the page that directly follows the
+        cursor (so a poller can advance without gaps); otherwise the newest
+        `limit` entries are returned.
+        """
+        start = max(cursor + 1, self.first_seq)
+        stop = self._last_seq
+        if limit is not None and stop - start + 1 > limit:
+            if oldest_first:
+                stop = start + limit - 1
+            else:
+                start = stop - limit + 1
+        
+        page = [self._slots[seq % self.capacity] for seq in range(stop, start - 1, -1)]
+        return [activity for activity in page if activity is not None]
@@ -1,32 +1,116 @@
 """
 Activity service - system activity logging
 """
-from typing import List
+from typing import List, Optional
+import logging
+from app.config import settings
 from app.models.activity import Activity
+from app.services.activity_log import ActivityLog
+from app.services.id_generator import new_id
+from app.services.segment_log import SegmentedLog
+
+logger = logging.getLogger(__name__)
+
+# Page size for history reads that don't specify a limit
+DEFAULT_HISTORY_PAGE = 100
 
 
 class ActivityService:
     """System activity logging service"""
     
     def __init__(self):
-        # Mock activities
-        self._activities = self._generate_mock_activities()
+        # Hot tail in a bounded ring; full history in segment files on disk (when
+        # enabled), opened at app startup rather than on import
+        self._log = ActivityLog(settings.ACTIVITY_LOG_CAPACITY)
+        self._disk: Optional[SegmentedLog] = None
+        self._opened = False
+    
+    def open(self):
+        """Open the on-disk log and warm the ring"""
+        if self._opened:
+            return
+        self._opened = True
+        
+        if settings.ACTIVITY_LOG_DIR:
+            self._disk = SegmentedLog(
+                settings.ACTIVITY_LOG_DIR,
+                segment_bytes=settings.ACTIVITY_SEGMENT_BYTES,
+                index_interval=settings.ACTIVITY_INDEX_INTERVAL,
+                fsync_interval_ms=settings.ACTIVITY_FSYNC_INTERVAL_MS,
+            )
+        self._load_activities()
+    
+    def _load_activities(self):
+        """Warm the ring from the tail of the on-disk log, seeding mock data if empty"""
+        records = self._disk.tail(self._log.capacity) if self._disk else []
+        if records:
+            logger.info(f"Loaded {len(records)} recent activities from {self._disk.directory}")
+            for seq, data in records:
+                self._log.append(Activity.model_validate_json(data), seq=seq)
+            return
+        
+        # Mock data is listed newest first
+        for activity in reversed(self._generate_mock_activities()):
+            self._append(activity)
     
     def get_all_activities(self) -> List[Activity]:
-        """Get all system activities"""
-        return self._activities
+        """Get all activities held in memory, newest first"""
+        return self._log.latest()
+    
+    def get_activities(
+        self,
+        since: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> List[Activity]:
+        """
+        Get activities newest first
+        
+        Without a cursor this is the newest `limit` entries. With `since`, only
+        entries after that seq are returned, and a limit keeps the page that
+        directly follows the cursor so a poller never skips entries. With
+        `before`, the page just older than that seq is returned, reaching into
+        the on-disk history once it falls out of the in-memory tail.
+        """
+        if before is None:
+            if since is None:
+                return self._log.latest(limit)
+            return self._log.since(since, limit)
+        
+        limit = limit or DEFAULT_HISTORY_PAGE
+        lo = max(1, before - limit, (since or 0) + 1)
+        if lo >= before:
+            return []
+        
+        if lo >= self._log.first_seq or self._disk is None:
+            return self._log.since(lo - 1, before - lo)
+        
+        records = self._disk.read(lo, before - lo)
+        return [Activity.model_validate_json(data) for seq, data in reversed(records) if seq < before]
+    
+    def close(self):
+        """Flush and close the on-disk log"""
+        if self._disk:
+            self._disk.close()
     
     def log_activity(self, activity_type: str, message: str):
         """Log new activity"""
         import time
         
         activity = Activity(
-            id=f"act_{int(time.time() * 1000)}",
+            id=new_id("act"),
             timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
             type=activity_type,
             message=message
         )
-        self._activities.insert(0, activity)
+        self._append(activity)
+    
+    def _append(self, activity: Activity):
+        """Add activity to the in-memory tail and append it to the on-disk log"""
+        self._log.append(activity)
+        if self._disk:
+            # Written out on the log's fsync interval (and before any read), not per append
+            self._disk.append(activity.seq, activity.model_dump_json())
     
     def _generate_mock_activities(self) -> List[Activity]:
         """Generate mock activity data"""
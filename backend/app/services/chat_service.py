@@ -1,48 +1,99 @@
 """
 Chat service - AI assistant logic
 """
-from typing import List
+from typing import AsyncIterator, List, Optional
+import asyncio
+import re
 import time
+from app.config import settings
 from app.models.chat import ChatMessage
+from app.services.chat_store import ChatSessionStore
+from app.services.id_generator import new_id
 
 
 class ChatService:
     """AI chat assistant service"""
     
     def __init__(self):
-        # In-memory chat history
-        self._messages: List[ChatMessage] = []
+        # In-memory chat history, bounded per session
+        self._store = ChatSessionStore(
+            max_sessions=settings.CHAT_MAX_SESSIONS,
+            max_messages=settings.CHAT_MAX_MESSAGES_PER_SESSION,
+            idle_ttl=settings.CHAT_SESSION_TTL_SECONDS,
+        )
     
-    async def process_message(self, user_message: str) -> ChatMessage:
+    async def process_message(self, user_message: str, session_id: str) -> ChatMessage:
         """
         Process user message and generate AI response
         In production, this would call the Agent Orchestrator
         """
-        # Store user message
+        ai_msg = None
+        async for event in self.stream_message(user_message, session_id):
+            if event["type"] == "message_end":
+                ai_msg = event["data"]
+        return ChatMessage(**ai_msg)
+    
+    async def stream_message(self, user_message: str, session_id: str) -> AsyncIterator[dict]:
+        """
+        Process user message, yielding the AI response as it is produced
+        
+        Yields a message_start event, one message_delta per chunk and a
+        message_end event carrying the complete message. The assistant
+        message is stored once, when the stream finishes (or with whatever
+        was produced if the client disconnects part-way).
+        """
         user_msg = ChatMessage(
-            id=f"user_{int(time.time() * 1000)}",
+            id=new_id("user"),
             role="user",
             content=user_message,
             timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
         )
-        self._messages.append(user_msg)
+        self._store.append(session_id, user_msg)
         
-        # Generate AI response (mock - would call agent in production)
-        ai_content = self._generate_mock_response(user_message)
+        message_id = new_id("assistant")
+        yield {"type": "message_start", "data": {"id": message_id, "user_message_id": user_msg.id}}
         
-        ai_msg = ChatMessage(
-            id=f"assistant_{int(time.time() * 1000)}",
-            role="assistant",
-            content=ai_content,
-            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        )
-        self._messages.append(ai_msg)
+        parts: List[str] = []
+        completed = False
+        try:
+            async for chunk in self._generate_response_chunks(user_message):
+                parts.append(chunk)
+                yield {"type": "message_delta", "data": {"id": message_id, "delta": chunk}}
+            completed = True
+        finally:
+            if completed or parts:
+                ai_msg = ChatMessage(
+                    id=message_id,
+                    role="assistant",
+                    content="".join(parts),
+                    timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                )
+                self._store.append(session_id, ai_msg)
         
-        return ai_msg
+        yield {"type": "message_end", "data": ai_msg.dict()}
+    
+    async def _generate_response_chunks(self, user_message: str) -> AsyncIterator[str]:
+        """
+        Yield the AI response in chunks
+        In production, this would relay the Agent Orchestrator's partial
+        output as it arrives; the mock splits the canned response into words
+        """
+        for chunk in re.findall(r"\S+\s*|\s+", self._generate_mock_response(user_message)):
+            yield chunk
+            # Hand control back so each chunk is flushed to the client
+            await asyncio.sleep(0)
+    
+    def get_history(self, session_id: str, before: Optional[str] = None, limit: int = 100) -> List[ChatMessage]:
+        """Get one page of a session's chat history, oldest first"""
+        return self._store.history(session_id, before=before, limit=limit)
+    
+    def clear_history(self, session_id: str) -> bool:
+        """Clear a session's chat history"""
+        return self._store.clear(session_id)
     
-    def get_history(self) -> List[ChatMessage]:
-        """Get chat history"""
-        return self._messages
+    def get_stats(self) -> dict:
+        """Chat session metrics"""
+        return self._store.get_stats()
     
     def _generate_mock_response(self, user_message: str) -> str:
         """
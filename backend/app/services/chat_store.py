@@ -0,0 +1,131 @@
+"""
+Chat store - bounded per-session chat history
+"""
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from typing import List, Optional
+import time
+
+from app.models.chat import ChatMessage
+from app.services.id_generator import id_sort_key
+
+
+class _Session:
+    """
+    One session's recent messages
+    
+    A plain list (indexable in O(1) for bisect), holding up to a quarter
+    more than `max_messages`; the overflow is cut off the front in one
+    slice, so trimming is amortized O(1) per append.
+    """
+    
+    __slots__ = ("messages", "max_messages", "last_active")
+    
+    def __init__(self, max_messages: int):
+        self.messages: List[ChatMessage] = []
+        self.max_messages = max_messages
+        self.last_active = time.monotonic()
+    
+    @property
+    def start(self) -> int:
+        """Index of the oldest message still retained"""
+        return max(0, len(self.messages) - self.max_messages)
+    
+    def __len__(self) -> int:
+        return len(self.messages) - self.start
+    
+    def append(self, message: ChatMessage):
+        """Add a message in ID order, dropping old ones in batches"""
+        if self.messages and id_sort_key(message.id) < id_sort_key(self.messages[-1].id):
+            # A streamed reply is stored when it finishes, after newer messages
+            insort(self.messages, message, key=lambda m: id_sort_key(m.id))
+        else:
+            self.messages.append(message)
+        if len(self.messages) > self.max_messages + max(1, self.max_messages // 4):
+            del self.messages[:self.start]
+
+
+class ChatSessionStore:
+    """
+    Chat history partitioned by session
+    
+    Each session keeps at most `max_messages` (oldest fall off the front).
+    Sessions sit in an OrderedDict in least-recently-used order, so idle
+    sessions past `idle_ttl` seconds are swept off the front and the LRU
+    one is evicted once there are more than `max_sessions`; both are O(1)
+    per session removed.
+    """
+    
+    def __init__(self, max_sessions: int, max_messages: int, idle_ttl: float):
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+        self.idle_ttl = idle_ttl
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        
+        # Metrics
+        self.evicted_sessions = 0
+        self.expired_sessions = 0
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+    
+    def append(self, session_id: str, message: ChatMessage):
+        """Add message to a session, creating (and possibly evicting) sessions as needed"""
+        now = time.monotonic()
+        self._expire(now)
+        
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = _Session(self.max_messages)
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.evicted_sessions += 1
+        else:
+            self._sessions.move_to_end(session_id)
+        
+        session.append(message)
+        session.last_active = now
+    
+    def history(self, session_id: str, before: Optional[str] = None, limit: int = 100) -> List[ChatMessage]:
+        """
+        Up to `limit` messages older than message ID `before` (default: newest), oldest first
+        
+        Message IDs are time-ordered, so the cursor is found by bisecting
+        the session's messages and only the page itself is copied.
+        """
+        self._expire(time.monotonic())
+        
+        session = self._sessions.get(session_id)
+        if session is None:
+            return []
+        self._sessions.move_to_end(session_id)
+        session.last_active = time.monotonic()
+        
+        messages = session.messages
+        start, end = session.start, len(messages)
+        if before is not None:
+            end = bisect_left(messages, id_sort_key(before), lo=start, key=lambda m: id_sort_key(m.id))
+        
+        return messages[max(start, end - limit):end]
+    
+    def clear(self, session_id: str) -> bool:
+        """Drop a session's history"""
+        return self._sessions.pop(session_id, None) is not None
+    
+    def get_stats(self) -> dict:
+        """Session counts and eviction metrics"""
+        return {
+            "sessions": len(self._sessions),
+            "messages": sum(len(s) for s in self._sessions.values()),
+            "evicted_sessions": self.evicted_sessions,
+            "expired_sessions": self.expired_sessions,
+        }
+    
+    def _expire(self, now: float):
+        """Sweep idle sessions off the LRU end"""
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_active < self.idle_ttl:
+                break
+            del self._sessions[session_id]
+            self.expired_sessions += 1
@@ -0,0 +1,102 @@
+"""
+Event log - sequenced replay buffer for real-time updates
+"""
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional, Tuple
+import secrets
+import time
+
+from app.models.event import Event
+
+
+class EventLog:
+    """
+    Bounded in-memory ring of recently published events
+    
+    Every event gets a monotonic sequence number so reconnecting clients
+    can ask for just the events they missed instead of reloading everything.
+    It is the single producer for both WebSocket and SSE transports: each
+    client only holds a cursor (last seq seen) into the shared log.
+    
+    Sequence numbers restart at 1 with every process, so each log also has
+    a random boot ID. Clients send it back with their cursor; a cursor from
+    another boot refers to unrelated events and always forces a resync.
+    """
+    
+    def __init__(self, capacity: int):
+        self.boot_id = secrets.token_hex(8)
+        self._events: Deque[Event] = deque(maxlen=capacity)
+        self._last_seq = 0
+        self._appended = asyncio.Event()
+    
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recent event (0 if none)"""
+        return self._last_seq
+    
+    def append(self, event_type: str, data: dict) -> Event:
+        """Assign the next sequence number and store the event"""
+        self._last_seq += 1
+        event = Event(
+            seq=self._last_seq,
+            type=event_type,
+            data=data,
+            timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        )
+        event._boot_id = self.boot_id
+        self._events.append(event)
+        
+        # Wake every waiting cursor, then arm a fresh event for the next append
+        self._appended.set()
+        self._appended = asyncio.Event()
+        return event
+    
+    async def wait(self, cursor: int, timeout: float) -> bool:
+        """
+        Wait until an event newer than cursor exists
+        Returns False on timeout so callers can send keep-alives.
+        """
+        if cursor < self._last_seq:
+            return True
+        
+        try:
+            await asyncio.wait_for(self._appended.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def since(self, last_seq: int, boot_id: Optional[str] = None) -> Optional[List[Event]]:
+        """
+        Get events published after last_seq
+        
+        Returns None when part of the gap has already been evicted from
+        the ring, or the cursor is from another boot (boot_id mismatch, or
+        ahead of this log), in which case the client has to do a full resync.
+        """
+        if boot_id is not None and boot_id != self.boot_id:
+            return None
+        
+        if last_seq > self._last_seq:
+            return None
+        
+        if last_seq == self._last_seq:
+            return []
+        
+        if not self._events or last_seq < self._events[0].seq - 1:
+            return None
+        
+        # Sequence numbers are contiguous, so the offset is direct
+        start = last_seq - self._events[0].seq + 1
+        return list(islice(self._events, start, None))
+
+
+def parse_cursor(value: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
+    """Split a "<boot_id>:<seq>" (or bare "<seq>") cursor into (boot_id, seq)"""
+    if not value:
+        return None, None
+    boot_id, _, seq = value.rpartition(":")
+    if not seq.isdigit():
+        return None, None
+    return boot_id or None, int(seq)
@@ -0,0 +1,91 @@
+"""
+ID generator - time-ordered, collision-free IDs shared by all services
+"""
+import threading
+import time
+from typing import Tuple
+
+from app.config import settings
+
+# Crockford base32: no I, L, O, U, and ascending in ASCII so text order is numeric order
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+# 48-bit millisecond timestamp | 22-bit sequence | 10-bit node = 80 bits = 16 chars
+TIME_BITS = 48
+SEQUENCE_BITS = 22
+NODE_BITS = 10
+ENCODED_LENGTH = (TIME_BITS + SEQUENCE_BITS + NODE_BITS) // 5
+
+_SEQUENCE_MASK = (1 << SEQUENCE_BITS) - 1
+_NODE_MASK = (1 << NODE_BITS) - 1
+
+# Wall clock anchored once, then advanced by the monotonic clock so IDs
+# never go backwards when NTP or an operator adjusts the system time
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _node_id(worker_id: int) -> int:
+    """Node bits from the configured worker ID"""
+    if not 0 <= worker_id <= _NODE_MASK:
+        raise ValueError(f"WORKER_ID must be between 0 and {_NODE_MASK}, got {worker_id}")
+    return worker_id
+
+
+# Unique per worker by configuration, so workers never share a node
+_NODE = _node_id(settings.WORKER_ID)
+
+# The sequence restarts every millisecond, so a bare counter (itertools.count)
+# can't drive it: the clock check and the (ms, sequence) update must happen
+# together. The lock keeps that atomic for callers in the sync threadpool.
+_lock = threading.Lock()
+_last_ms = 0
+_sequence = 0
+
+
+def _now_ms() -> int:
+    """Milliseconds since the Unix epoch on a monotonic timeline"""
+    return (time.monotonic_ns() + _EPOCH_OFFSET_NS) // 1_000_000
+
+
+def _next_slot() -> Tuple[int, int]:
+    """(timestamp_ms, sequence) for the next ID, strictly increasing per process"""
+    global _last_ms, _sequence
+    with _lock:
+        now = _now_ms()
+        if now > _last_ms:
+            _last_ms, _sequence = now, 0
+        elif _sequence < _SEQUENCE_MASK:
+            _sequence += 1
+        else:
+            # Sequence exhausted within this millisecond: carry into the next one
+            _last_ms, _sequence = _last_ms + 1, 0
+        return _last_ms, _sequence
+
+
+def _encode(value: int) -> str:
+    """Fixed-width Crockford base32"""
+    chars = []
+    for _ in range(ENCODED_LENGTH):
+        value, digit = divmod(value, 32)
+        chars.append(_ALPHABET[digit])
+    return "".join(reversed(chars))
+
+
+def new_id(prefix: str) -> str:
+    """
+    New unique ID such as "act_01JC3Q7Y8K2M4N6P"
+    
+    IDs with the same prefix sort (as strings) by creation time, and within a
+    millisecond by a per-process sequence, so they work as range-scan keys.
+    The sequence restarts every millisecond; past four million IDs in one
+    millisecond it carries into the next, so IDs never repeat or go backwards.
+    """
+    timestamp_ms, sequence = _next_slot()
+    value = (timestamp_ms << (SEQUENCE_BITS + NODE_BITS)) | (sequence << NODE_BITS) | _NODE
+    return f"{prefix}_{_encode(value)}"
+
+
+def id_sort_key(value: str) -> str:
+    """Time-ordered part of an ID, comparable across prefixes (e.g. user_ vs assistant_)"""
+    return value.rpartition("_")[2]
+
@@ -0,0 +1,109 @@
+"""
+News dedup - MinHash LSH index for near-duplicate news items
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import random
+import re
+import zlib
+
+# Mersenne prime for the universal hash family (a * x + b) mod p
+_PRIME = (1 << 61) - 1
+
+_WORD = re.compile(r"[a-z0-9€£$%]+")
+
+
+def shingles(text: str, size: int = 3) -> Set[int]:
+    """Hashed word k-grams of normalized text"""
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+    return {
+        zlib.crc32(" ".join(words[i:i + size]).encode("utf-8"))
+        for i in range(len(words) - size + 1)
+    }
+
+
+class NearDuplicateIndex:
+    """
+    MinHash signatures bucketed by locality-sensitive hashing
+    
+    Each document is reduced to `num_perm` MinHash values; the signature is
+    split into `bands` bands and every band is a bucket key. Documents that
+    share any bucket are candidates, and only those are compared, so a
+    lookup costs O(bands) dict probes instead of a scan of the whole feed.
+    An optional scope (e.g. the SME) is part of every bucket key, so only
+    documents in the same scope are ever compared.
+    Candidates are confirmed by estimated Jaccard similarity (the fraction
+    of agreeing MinHash values) against `threshold`.
+    """
+    
+    def __init__(self, num_perm: int = 64, bands: int = 16, threshold: float = 0.5, shingle_size: int = 3, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+        
+        self._signatures: Dict[str, Tuple[str, Tuple[int, ...]]] = {}
+        self._buckets: List[Dict[Tuple, Set[str]]] = [defaultdict(set) for _ in range(bands)]
+    
+    def __len__(self) -> int:
+        return len(self._signatures)
+    
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """MinHash signature of text (None when it has no words to compare)"""
+        hashed = shingles(text, self.shingle_size)
+        if not hashed:
+            # Every empty text would get the same all-_PRIME signature and match
+            return None
+        return tuple(min((a * x + b) % _PRIME for x in hashed) for a, b in self._perms)
+    
+    def find(self, signature: Tuple[int, ...], scope: str = "") -> Optional[Tuple[str, float]]:
+        """Most similar document in scope at or above the threshold, as (key, similarity)"""
+        candidates: Set[str] = set()
+        for band, buckets in zip(self._bands(scope, signature), self._buckets):
+            bucket = buckets.get(band)
+            if bucket:
+                candidates |= bucket
+        
+        best: Optional[Tuple[str, float]] = None
+        for key in candidates:
+            similarity = self._similarity(signature, self._signatures[key][1])
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+    
+    def add(self, key: str, signature: Tuple[int, ...], scope: str = ""):
+        """Index a document signature under key; only documents in the same scope can match"""
+        self.remove(key)
+        self._signatures[key] = (scope, signature)
+        for band, buckets in zip(self._bands(scope, signature), self._buckets):
+            buckets[band].add(key)
+    
+    def remove(self, key: str):
+        """Drop a document from the index"""
+        entry = self._signatures.pop(key, None)
+        if entry is None:
+            return
+        for band, buckets in zip(self._bands(*entry), self._buckets):
+            bucket = buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del buckets[band]
+    
+    def _bands(self, scope: str, signature: Tuple[int, ...]) -> Iterable[Tuple]:
+        """Split a signature into band bucket keys within a scope"""
+        return ((scope, signature[i:i + self.rows]) for i in range(0, self.num_perm, self.rows))
+    
+    @staticmethod
+    def _similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for a, b in zip(left, right) if a == b) / len(left)
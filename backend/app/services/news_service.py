@@ -1,33 +1,111 @@
 """
 News service - news intelligence logic
 """
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timedelta
-from app.models.news import PredictedEvent, NewsItem
+from app.config import settings
+from app.models.news import PredictedEvent, NewsItem, NewsIngestResult
+from app.services.news_store import NewsStore, PredictedEventCalendar, parse_timestamp
+from app.services.news_dedup import NearDuplicateIndex
+from app.api.v1.websocket import broadcast_update
+
+# Higher wins when merging duplicates
+_SEVERITY_RANK = {"info": 0, "warning": 1, "critical": 2}
 
 
 class NewsService:
     """News intelligence service"""
     
     def __init__(self):
-        # Mock data
-        self._predicted_events = self._generate_mock_events()
-        self._news_items = self._generate_mock_news()
+        # Indexed in-memory storage for demo (mock data)
+        self._events = PredictedEventCalendar()
+        for event in self._generate_mock_events():
+            self._events.add(event)
+        
+        self._news = NewsStore()
+        self._dedup = NearDuplicateIndex(threshold=settings.NEWS_DEDUP_THRESHOLD)
+        for item in self._generate_mock_news():
+            self._store_news_item(item)
+    
+    def get_predicted_events(self, within_days: Optional[int] = None) -> List[PredictedEvent]:
+        """Get upcoming predicted events, soonest first (past events expire)"""
+        return self._events.upcoming(within_days)
+    
+    def get_news_intelligence(
+        self,
+        since: Optional[datetime] = None,
+        severity: Optional[str] = None,
+        sme_id: Optional[str] = None,
+        news_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[NewsItem]:
+        """Get news intelligence items, newest first"""
+        return self._news.query(since=since, severity=severity, sme_id=sme_id, news_type=news_type, limit=limit)
+    
+    async def ingest_news_item(self, item: NewsItem) -> NewsIngestResult:
+        """
+        Ingest a news item, collapsing it into a near-duplicate if one exists
+        
+        Title and summary are shingled and MinHashed; the LSH index finds an
+        existing item for the same SME reporting the same event. Its signals
+        are merged and severity escalated instead of storing another item,
+        and the updated item is re-timestamped and broadcast as news_updated.
+        """
+        signature = self._dedup.signature(f"{item.title} {item.summary}")
+        # Items with no words can't be compared, so they are never merged
+        match = self._dedup.find(signature, scope=item.sme_id) if signature is not None else None
+        
+        if match is not None:
+            existing = self._news.get(match[0])
+            if existing is not None:
+                self._merge(existing, item)
+                await broadcast_update("news_updated", existing.dict())
+                return NewsIngestResult(item=existing, merged=True, similarity=round(match[1], 3))
+        
+        self._store_news_item(item, signature)
+        await broadcast_update("news_created", item.dict())
+        return NewsIngestResult(item=item, merged=False)
+    
+    def _store_news_item(self, item: NewsItem, signature: Optional[tuple] = None):
+        """Add item to the store and the near-duplicate index"""
+        if signature is None:
+            signature = self._dedup.signature(f"{item.title} {item.summary}")
+        self._news.add(item)
+        if signature is not None:
+            self._dedup.add(item.id, signature, scope=item.sme_id)
     
-    def get_predicted_events(self) -> List[PredictedEvent]:
-        """Get predicted events"""
-        return self._predicted_events
+    def _merge(self, existing: NewsItem, duplicate: NewsItem):
+        """Fold a duplicate's signals and severity into the existing item"""
+        # Unindex before touching indexed fields, then re-file under the new values
+        self._news.remove(existing.id)
+        
+        seen = {(s.get("source"), s.get("detail")) for s in existing.signals}
+        for signal in duplicate.signals:
+            key = (signal.get("source"), signal.get("detail"))
+            if key not in seen:
+                seen.add(key)
+                existing.signals.append(signal)
+        
+        if _SEVERITY_RANK[duplicate.severity] > _SEVERITY_RANK[existing.severity]:
+            existing.severity = duplicate.severity
+        
+        # Move it to the head of the feed so since= pollers pick up the merge
+        now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+        existing.timestamp = max(now, duplicate.timestamp, key=parse_timestamp)
+        
+        self._news.add(existing)
     
-    def get_news_intelligence(self) -> List[NewsItem]:
-        """Get news intelligence items"""
-        return self._news_items
+    def add_predicted_event(self, event: PredictedEvent):
+        """Add or replace a predicted event"""
+        self._events.add(event)
     
     def _generate_mock_events(self) -> List[PredictedEvent]:
-        """Generate mock predicted events"""
+        """Generate mock predicted events (dated relative to today)"""
+        today = datetime.utcnow().date()
         return [
             PredictedEvent(
                 id="evt_001",
-                date="2024-12-01",
+                date=(today + timedelta(days=17)).isoformat(),
                 days_until=17,
                 title="UK Hemp Products Ban",
                 probability=75,
@@ -39,7 +117,7 @@ class NewsService:
             ),
             PredictedEvent(
                 id="evt_002",
-                date="2024-12-15",
+                date=(today + timedelta(days=31)).isoformat(),
                 days_until=31,
                 title="BoE Interest Rate Decision",
                 probability=60,
@@ -51,7 +129,7 @@ class NewsService:
             ),
             PredictedEvent(
                 id="evt_003",
-                date="2025-01-10",
+                date=(today + timedelta(days=57)).isoformat(),
                 days_until=57,
                 title="EU Data Privacy Regulation",
                 probability=40,
@@ -0,0 +1,178 @@
+"""
+News store - time-ordered news index and expiring predicted-event calendar
+"""
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from app.models.news import NewsItem, PredictedEvent
+from app.utils.time import to_naive_utc
+
+
+class _IndexKeys(NamedTuple):
+    """Indexed field values a news item was last filed under"""
+    time: datetime
+    sme_id: str
+    severity: str
+    type: str
+
+
+def parse_timestamp(timestamp: str) -> datetime:
+    """Parse an ISO timestamp into a naive UTC datetime (unparseable sorts first)"""
+    try:
+        return to_naive_utc(datetime.fromisoformat(timestamp.replace("Z", "+00:00")))
+    except (AttributeError, ValueError):
+        return datetime.min
+
+
+class NewsStore:
+    """
+    News items ordered by timestamp with secondary indexes
+    
+    The time index is a sorted list of (timestamp, id), so "since" queries
+    are a bisect and newest-first pages walk it backwards. SME, severity
+    and type filters intersect id sets, as in the task store. Items are
+    unindexed by the keys they were filed under, so one mutated in place
+    still comes out of its old buckets; re-add() it to refile.
+    """
+    
+    def __init__(self):
+        self._by_id: Dict[str, NewsItem] = {}
+        self._keys: Dict[str, _IndexKeys] = {}
+        self._by_time: List[Tuple[datetime, str]] = []
+        self._by_sme: Dict[str, Set[str]] = defaultdict(set)
+        self._by_severity: Dict[str, Set[str]] = defaultdict(set)
+        self._by_type: Dict[str, Set[str]] = defaultdict(set)
+    
+    def __len__(self) -> int:
+        return len(self._by_id)
+    
+    def get(self, news_id: str) -> Optional[NewsItem]:
+        """Get news item by ID"""
+        return self._by_id.get(news_id)
+    
+    def add(self, item: NewsItem):
+        """Add news item (replacing any item with the same ID)"""
+        self.remove(item.id)
+        
+        keys = _IndexKeys(parse_timestamp(item.timestamp), item.sme_id, item.severity, item.type)
+        self._by_id[item.id] = item
+        self._keys[item.id] = keys
+        insort(self._by_time, (keys.time, item.id))
+        self._by_sme[keys.sme_id].add(item.id)
+        self._by_severity[keys.severity].add(item.id)
+        self._by_type[keys.type].add(item.id)
+    
+    def remove(self, news_id: str) -> Optional[NewsItem]:
+        """Remove news item, returning it if it existed"""
+        item = self._by_id.pop(news_id, None)
+        if item is None:
+            return None
+        
+        keys = self._keys.pop(news_id)
+        pos = bisect_left(self._by_time, (keys.time, news_id))
+        if pos < len(self._by_time) and self._by_time[pos] == (keys.time, news_id):
+            del self._by_time[pos]
+        for index, value in (
+            (self._by_sme, keys.sme_id),
+            (self._by_severity, keys.severity),
+            (self._by_type, keys.type),
+        ):
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.discard(news_id)
+                if not bucket:
+                    del index[value]
+        return item
+    
+    def query(
+        self,
+        since: Optional[datetime] = None,
+        severity: Optional[str] = None,
+        sme_id: Optional[str] = None,
+        news_type: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[NewsItem]:
+        """Items newer than `since` matching every given filter, newest first"""
+        since = to_naive_utc(since) if since is not None else None
+        # Strictly after `since`: skip every entry at that exact timestamp
+        lo = bisect_right(self._by_time, (since, chr(0x10FFFF))) if since is not None else 0
+        
+        candidates = [
+            index.get(value, set())
+            for index, value in (
+                (self._by_severity, severity),
+                (self._by_sme, sme_id),
+                (self._by_type, news_type),
+            )
+            if value is not None
+        ]
+        
+        # Walk the index backwards in place rather than copying the slice
+        newest_first = (self._by_time[pos][1] for pos in range(len(self._by_time) - 1, lo - 1, -1))
+        
+        if candidates:
+            candidates.sort(key=len)
+            ids = set(candidates[0])
+            for other in candidates[1:]:
+                ids &= other
+            
+            if len(ids) * 8 <= len(self._by_time) - lo:
+                # Sparse match: sort the few matches instead of walking the index
+                keyed = [(self._keys[news_id].time, news_id) for news_id in ids]
+                if since is not None:
+                    keyed = [k for k in keyed if k[0] > since]
+                keyed.sort(reverse=True)
+                newest_first = (news_id for _, news_id in keyed)
+            else:
+                newest_first = (news_id for news_id in newest_first if news_id in ids)
+        
+        return [self._by_id[news_id] for news_id in islice(newest_first, limit)]
+
+
+class PredictedEventCalendar:
+    """
+    Predicted events ordered by date, dropping past events automatically
+    
+    Events sit in a list sorted by (date, id). Whenever the calendar is read
+    on a new day, everything dated before today is cut off the front in one
+    slice and days_until is recomputed once, not on every request.
+    """
+    
+    def __init__(self):
+        self._events: List[Tuple[date, str, PredictedEvent]] = []
+        self._today: Optional[date] = None
+    
+    def __len__(self) -> int:
+        return len(self._events)
+    
+    def add(self, event: PredictedEvent):
+        """Add event (replacing any event with the same ID)"""
+        self._events = [entry for entry in self._events if entry[1] != event.id]
+        insort(self._events, (date.fromisoformat(event.date), event.id, event), key=lambda entry: entry[:2])
+        if self._today is not None:
+            event.days_until = (date.fromisoformat(event.date) - self._today).days
+    
+    def upcoming(self, within_days: Optional[int] = None, today: Optional[date] = None) -> List[PredictedEvent]:
+        """Events from today onwards (optionally only the next `within_days` days), soonest first"""
+        today = today or datetime.utcnow().date()
+        self._expire(today)
+        
+        end = len(self._events)
+        if within_days is not None:
+            end = bisect_right(self._events, today + timedelta(days=within_days), key=lambda entry: entry[0])
+        return [entry[2] for entry in self._events[:end]]
+    
+    def _expire(self, today: date):
+        """Drop past events and refresh days_until, at most once per day"""
+        if today == self._today:
+            return
+        self._today = today
+        
+        cut = bisect_left(self._events, today, key=lambda entry: entry[0])
+        if cut:
+            del self._events[:cut]
+        for event_date, _, event in self._events:
+            event.days_until = (event_date - today).days
@@ -0,0 +1,228 @@
+"""
+Persistence - embedded SQLite storage with group commit
+"""
+from concurrent.futures import Future, wait
+from typing import List, Optional, Tuple
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Statement text is fixed so sqlite3's per-connection statement cache
+# keeps each one prepared for the life of the connection
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS tasks (
+        id TEXT PRIMARY KEY,
+        data TEXT NOT NULL
+    )""",
+)
+_UPSERT_TASK = "INSERT INTO tasks (id, data) VALUES (?, ?) ON CONFLICT(id) DO UPDATE SET data = excluded.data"
+_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+
+
+class PersistenceError(Exception):
+    """A queued write could not be committed"""
+
+
+class _Unit:
+    """One logical operation: its writes commit together or not at all"""
+    
+    __slots__ = ("writes", "future")
+    
+    def __init__(self, writes: List[Tuple[str, tuple]]):
+        self.writes = writes
+        self.future: Future = Future()
+
+
+class SQLiteStore:
+    """
+    Write-behind SQLite store in WAL mode
+    
+    Services keep serving reads from memory and hand writes to this store,
+    which queues them for a single writer thread. The writer drains
+    everything that arrives within the commit interval into one transaction
+    (group commit), so a burst of writes costs one fsync, not one each.
+    
+    Each call queues one unit (a bulk save is one unit, however many rows)
+    and returns a Future that resolves once the unit is committed or fails
+    with PersistenceError. Groups are capped at max_batch writes, but a unit
+    is never split across transactions.
+    """
+    
+    def __init__(self, path: str, commit_interval_ms: int = 50, max_batch: int = 1000):
+        self.path = path
+        self._commit_interval = commit_interval_ms / 1000
+        self._max_batch = max_batch
+        
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        
+        # Guards the shared connection between startup reads and the writer
+        self._lock = threading.Lock()
+        
+        # Metrics
+        self.commits = 0
+        self.writes = 0
+        self.failed_writes = 0
+        
+        self._queue: "queue.Queue" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="sqlite-writer", daemon=True)
+        self._writer.start()
+        
+        logger.info(f"SQLite store opened at {path} (WAL)")
+    
+    def load_tasks(self) -> List[str]:
+        """All persisted task documents in one query"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT data FROM tasks")]
+    
+    def save_task(self, task_id: str, data: str) -> Future:
+        """Queue a task upsert"""
+        return self._submit([(_UPSERT_TASK, (task_id, data))])
+    
+    def save_tasks(self, rows: List[Tuple[str, str]]) -> Future:
+        """Queue many task upserts as one unit (committed together or not at all)"""
+        return self._submit([(_UPSERT_TASK, row) for row in rows])
+    
+    def delete_task(self, task_id: str) -> Future:
+        """Queue a task delete"""
+        return self._submit([(_DELETE_TASK, (task_id,))])
+    
+    def flush(self, timeout: Optional[float] = None):
+        """Block until everything queued so far is committed (or has failed)"""
+        wait([self._submit([])], timeout)
+    
+    def close(self):
+        """Commit outstanding writes and close the database"""
+        self.flush(timeout=10)
+        self._queue.put(None)
+        self._writer.join(timeout=10)
+        self._conn.close()
+    
+    def _submit(self, writes: List[Tuple[str, tuple]]) -> Future:
+        """Queue one unit for the writer thread"""
+        unit = _Unit(writes)
+        self._queue.put(unit)
+        return unit.future
+    
+    def _write_loop(self):
+        """Writer thread: gather a group of writes, commit them together"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            
+            group = [item]
+            size = len(item.writes)
+            if not item.writes:
+                # Flush barrier: someone is waiting, commit now
+                self._commit(group)
+                continue
+            
+            deadline = time.monotonic() + self._commit_interval
+            while size < self._max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._commit(group)
+                    return
+                if size + len(item.writes) > self._max_batch:
+                    # Whole units only: this one starts the next group
+                    self._commit(group)
+                    group, size = [], 0
+                group.append(item)
+                size += len(item.writes)
+                if not item.writes:
+                    # Someone is waiting: commit now rather than at the deadline
+                    break
+            
+            self._commit(group)
+    
+    def _commit(self, group: List[_Unit]):
+        """Apply a group of units in one transaction, isolating a failing unit"""
+        if not group:
+            return
+        try:
+            self._apply([write for unit in group for write in unit.writes])
+        except Exception as e:
+            if len(group) == 1:
+                self._fail(group[0], e)
+                return
+            # Retry unit by unit so one bad write doesn't fail its neighbours
+            for unit in group:
+                try:
+                    self._apply(unit.writes)
+                except Exception as unit_error:
+                    self._fail(unit, unit_error)
+                else:
+                    unit.future.set_result(None)
+            return
+        
+        for unit in group:
+            unit.future.set_result(None)
+    
+    def _apply(self, writes: List[Tuple[str, tuple]]):
+        """Run writes in a single transaction, rolling back on any error"""
+        if not writes:
+            return
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN")
+                # Consecutive writes with the same statement run as one executemany
+                start = 0
+                while start < len(writes):
+                    sql = writes[start][0]
+                    end = start
+                    while end < len(writes) and writes[end][0] == sql:
+                        end += 1
+                    self._conn.executemany(sql, [params for _, params in writes[start:end]])
+                    start = end
+                self._conn.execute("COMMIT")
+            except Exception:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+        self.commits += 1
+        self.writes += len(writes)
+    
+    def _fail(self, unit: _Unit, error: Exception):
+        """Report a unit that could not be committed"""
+        logger.error(f"SQLite commit failed ({len(unit.writes)} writes): {error}")
+        self.failed_writes += len(unit.writes)
+        unit.future.set_exception(PersistenceError(str(error)))
+
+
+_store: Optional[SQLiteStore] = None
+
+
+def get_store() -> Optional[SQLiteStore]:
+    """Process-wide store, or None when persistence is disabled (empty DATABASE_PATH)"""
+    global _store
+    if _store is None and settings.DATABASE_PATH:
+        _store = SQLiteStore(
+            settings.DATABASE_PATH,
+            commit_interval_ms=settings.DB_COMMIT_INTERVAL_MS,
+            max_batch=settings.DB_COMMIT_MAX_BATCH,
+        )
+    return _store
+
+
+def close_store():
+    """Flush and close the process-wide store"""
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
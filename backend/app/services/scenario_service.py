@@ -7,6 +7,7 @@ import asyncio
 import time
 from app.models.scenario import Scenario, ScenarioResults
 from app.api.v1.websocket import broadcast_update
+from app.services.id_generator import new_id
 
 
 class ScenarioService:
@@ -27,7 +28,7 @@ class ScenarioService:
     
     def create_scenario(self, description: str) -> Scenario:
         """Create new scenario"""
-        scenario_id = f"scenario_{int(time.time() * 1000)}"
+        scenario_id = new_id("scenario")
         
         scenario = Scenario(
             id=scenario_id,
@@ -0,0 +1,297 @@
+"""
+Segment log - append-only record files with a sparse offset index
+"""
+from array import array
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+import logging
+import mmap
+import os
+import struct
+import time
+
+logger = logging.getLogger(__name__)
+
+# One (seq, byte offset) pair per index entry
+_INDEX_ENTRY = struct.Struct(">QQ")
+
+
+class _Segment:
+    """One log file plus its sparse index (seqs and offsets held in memory)"""
+    
+    def __init__(self, directory: str, base_seq: int):
+        self.base_seq = base_seq
+        self.log_path = os.path.join(directory, f"{base_seq:020d}.log")
+        self.index_path = os.path.join(directory, f"{base_seq:020d}.idx")
+        self.index_seqs = array("Q")
+        self.index_offsets = array("Q")
+        self.last_seq = base_seq - 1
+        self.size = 0
+        # Records written since the last index entry
+        self.unindexed = 0
+    
+    def load_index(self):
+        """Read the sparse index, dropping any torn trailing entry"""
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, "rb") as f:
+            raw = f.read()
+        usable = len(raw) - len(raw) % _INDEX_ENTRY.size
+        for seq, offset in _INDEX_ENTRY.iter_unpack(raw[:usable]):
+            self.index_seqs.append(seq)
+            self.index_offsets.append(offset)
+    
+    def start_offset(self, seq: int) -> int:
+        """Byte offset of the last indexed record at or before seq"""
+        pos = bisect_right(self.index_seqs, seq) - 1
+        return self.index_offsets[pos] if pos >= 0 else 0
+
+
+class SegmentedLog:
+    """
+    Append-only log split into fixed-size segment files
+    
+    Each record is one "<seq>\\t<payload>\\n" line. Every `index_interval`
+    records the (seq, offset) of a line is added to the segment's sparse
+    index, so a read bisects the index, maps the segment with mmap and
+    scans at most one interval of lines before it reaches the first wanted
+    record. Old segments are never rewritten and are read without loading
+    the whole file; only the open segment has a file handle.
+    
+    Writes are fsynced when a segment is sealed (roll or close) and by the
+    first append after `fsync_interval_ms` has passed since the last sync
+    (0 syncs every append), bounding what a power loss can take.
+    """
+    
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        index_interval: int = 64,
+        fsync_interval_ms: int = 1000,
+    ):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.index_interval = index_interval
+        self.fsync_interval = fsync_interval_ms / 1000
+        os.makedirs(directory, exist_ok=True)
+        
+        self._last_sync = time.monotonic()
+        self.syncs = 0
+        
+        self._segments: List[_Segment] = []
+        self._base_seqs: List[int] = []
+        self._log_file = None
+        self._index_file = None
+        
+        self._open_existing()
+    
+    @property
+    def first_seq(self) -> int:
+        """Oldest seq on disk (0 if empty)"""
+        for segment in self._segments:
+            if segment.last_seq >= segment.base_seq:
+                return segment.base_seq
+        return 0
+    
+    @property
+    def last_seq(self) -> int:
+        """Newest seq on disk (0 if empty)"""
+        return self._segments[-1].last_seq if self._segments else 0
+    
+    def append(self, seq: int, payload: str):
+        """Append one record; seqs must increase"""
+        if seq <= self.last_seq:
+            raise ValueError(f"Log seq {seq} is not after {self.last_seq}")
+        
+        segment = self._segments[-1] if self._segments else None
+        if segment is None or segment.size >= self.segment_bytes:
+            segment = self._roll(seq)
+        
+        if segment.unindexed == 0 or segment.unindexed >= self.index_interval:
+            segment.index_seqs.append(seq)
+            segment.index_offsets.append(segment.size)
+            self._index_file.write(_INDEX_ENTRY.pack(seq, segment.size))
+            segment.unindexed = 0
+        
+        line = f"{seq}\t{payload}\n".encode("utf-8")
+        self._log_file.write(line)
+        segment.size += len(line)
+        segment.last_seq = seq
+        segment.unindexed += 1
+        
+        if time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+    
+    def flush(self):
+        """Push buffered writes to the OS so readers (and other processes) see them"""
+        if self._log_file is not None:
+            self._log_file.flush()
+            self._index_file.flush()
+    
+    def sync(self):
+        """Flush and fsync the open segment so its records survive a power loss"""
+        if self._log_file is not None:
+            self.flush()
+            os.fsync(self._log_file.fileno())
+            os.fsync(self._index_file.fileno())
+            self.syncs += 1
+        self._last_sync = time.monotonic()
+    
+    def read(self, from_seq: int, limit: int) -> List[Tuple[int, str]]:
+        """Up to `limit` (seq, payload) records with seq >= from_seq, oldest first"""
+        self.flush()
+        records: List[Tuple[int, str]] = []
+        
+        pos = max(0, bisect_right(self._base_seqs, from_seq) - 1)
+        for segment in self._segments[pos:]:
+            if len(records) >= limit:
+                break
+            if segment.last_seq < from_seq or segment.size == 0:
+                continue
+            records.extend(self._read_segment(segment, from_seq, limit - len(records)))
+        
+        return records
+    
+    def tail(self, count: int) -> List[Tuple[int, str]]:
+        """The newest `count` records, oldest first"""
+        last = self.last_seq
+        if last == 0 or count <= 0:
+            return []
+        
+        # Seqs may have gaps, so widen the window until enough records are found
+        window = count
+        while True:
+            from_seq = max(1, last - window + 1)
+            records = self.read(from_seq, window)
+            if len(records) >= count or from_seq <= self.first_seq:
+                return records[-count:]
+            window *= 2
+    
+    def close(self):
+        """Sync and close the open segment"""
+        if self._log_file is not None:
+            self.sync()
+            self._log_file.close()
+            self._index_file.close()
+            self._log_file = self._index_file = None
+    
+    def _read_segment(self, segment: _Segment, from_seq: int, limit: int) -> List[Tuple[int, str]]:
+        """Scan one mapped segment from the nearest index entry"""
+        records = []
+        with open(segment.log_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                offset = segment.start_offset(from_seq)
+                end = min(len(mapped), segment.size)
+                while offset < end and len(records) < limit:
+                    newline = mapped.find(b"\n", offset, end)
+                    if newline < 0:
+                        break
+                    tab = mapped.find(b"\t", offset, newline)
+                    if tab < 0:
+                        # Torn tail (recovery cuts it off on the next open)
+                        break
+                    seq = int(mapped[offset:tab])
+                    if seq >= from_seq:
+                        records.append((seq, mapped[tab + 1:newline].decode("utf-8")))
+                    offset = newline + 1
+        return records
+    
+    def _roll(self, base_seq: int) -> _Segment:
+        """Seal the open segment and start a new one at base_seq"""
+        self.close()
+        segment = _Segment(self.directory, base_seq)
+        self._segments.append(segment)
+        self._base_seqs.append(base_seq)
+        self._log_file = open(segment.log_path, "ab")
+        self._index_file = open(segment.index_path, "ab")
+        self._sync_directory()
+        return segment
+    
+    def _sync_directory(self):
+        """fsync the directory so newly created segment files are durable too"""
+        try:
+            fd = os.open(self.directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            # Not supported everywhere (e.g. some platforms refuse directory fsync)
+            pass
+        finally:
+            os.close(fd)
+    
+    def _open_existing(self):
+        """Load segment indexes and recover the tail of the newest segment"""
+        base_seqs = sorted(
+            int(name[:-4]) for name in os.listdir(self.directory)
+            if name.endswith(".log") and name[:-4].isdigit()
+        )
+        for base_seq in base_seqs:
+            segment = _Segment(self.directory, base_seq)
+            segment.load_index()
+            segment.size = os.path.getsize(segment.log_path)
+            self._segments.append(segment)
+            self._base_seqs.append(base_seq)
+        
+        for segment in self._segments[:-1]:
+            segment.last_seq = self._scan_last_seq(segment)
+        
+        if self._segments:
+            segment = self._segments[-1]
+            segment.last_seq = self._scan_last_seq(segment, recover=True)
+            self._log_file = open(segment.log_path, "ab")
+            self._index_file = open(segment.index_path, "ab")
+            logger.info(f"Opened activity log at {self.directory} ({len(self._segments)} segments, last seq {self.last_seq})")
+    
+    def _scan_last_seq(self, segment: _Segment, recover: bool = False) -> int:
+        """Find a segment's last seq by scanning from its last index entry"""
+        while True:
+            if recover:
+                # Index entries pointing past the end of the log are from a torn write
+                while segment.index_offsets and segment.index_offsets[-1] >= segment.size:
+                    segment.index_offsets.pop()
+                    segment.index_seqs.pop()
+            
+            last_seq, count, end = self._scan(segment)
+            if not recover or end >= segment.size:
+                break
+            
+            # Partial final record from a crash mid-write: cut it off and rescan
+            logger.warning(f"Truncating partial record at {segment.log_path}:{end}")
+            os.truncate(segment.log_path, end)
+            segment.size = end
+        
+        if recover:
+            if os.path.exists(segment.index_path):
+                # Cut the index file back to the entries that survived recovery
+                os.truncate(segment.index_path, len(segment.index_seqs) * _INDEX_ENTRY.size)
+            segment.unindexed = count
+        
+        return last_seq
+    
+    @staticmethod
+    def _scan(segment: _Segment) -> Tuple[int, int, int]:
+        """(last seq, records seen, end offset of the last complete record) from the last index entry"""
+        last_seq = segment.index_seqs[-1] - 1 if segment.index_seqs else segment.base_seq - 1
+        count = 0
+        offset = segment.index_offsets[-1] if segment.index_offsets else 0
+        if segment.size == 0:
+            return last_seq, count, offset
+        
+        with open(segment.log_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                while offset < len(mapped):
+                    newline = mapped.find(b"\n", offset)
+                    if newline < 0:
+                        break
+                    tab = mapped.find(b"\t", offset, newline)
+                    if tab < 0:
+                        # A line without its seq separator is a torn tail too
+                        break
+                    last_seq = int(mapped[offset:tab])
+                    offset = newline + 1
+                    count += 1
+        
+        return last_seq, count, offset
@@ -0,0 +1,163 @@
+"""
+Task status scheduler - time-driven overdue/due_today transitions
+"""
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import heapq
+import itertools
+import logging
+
+from app.models.task import Task
+from app.services.task_store import TaskStore, parse_due_date
+
+logger = logging.getLogger(__name__)
+
+# Longest single sleep, so wall-clock adjustments are picked up eventually
+MAX_SLEEP_SECONDS = 300
+
+# Statuses derived from the due date; "completed" is never touched
+TIME_DRIVEN_STATUSES = ("upcoming", "due_today", "overdue")
+
+
+def status_for(due: datetime, now: datetime) -> str:
+    """Time-driven status of a task due at `due`, as of `now` (UTC days)"""
+    day_start = due.replace(hour=0, minute=0, second=0, microsecond=0)
+    if now < day_start:
+        return "upcoming"
+    if now < day_start + timedelta(days=1):
+        return "due_today"
+    return "overdue"
+
+
+def next_boundary(due: datetime, now: datetime) -> Optional[datetime]:
+    """When the time-driven status next changes (None once overdue)"""
+    day_start = due.replace(hour=0, minute=0, second=0, microsecond=0)
+    if now < day_start:
+        return day_start
+    if now < day_start + timedelta(days=1):
+        return day_start + timedelta(days=1)
+    return None
+
+
+class TaskStatusScheduler:
+    """
+    Flips task statuses exactly when they cross a day boundary
+    
+    Each open task has one entry in a min-heap keyed by its next boundary,
+    so the scheduler sleeps until the earliest one and never looks at tasks
+    that aren't due to change. Re-tracking or removing a task retires its
+    version, and stale heap entries are skipped when popped; once they
+    outnumber live ones the heap is rebuilt from the live versions.
+    Re-tracking a task whose due date and status haven't changed is a no-op.
+    """
+    
+    def __init__(self, store: TaskStore):
+        self._store = store
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._versions: Dict[str, int] = {}
+        # (due_date, status) each live entry was scheduled for
+        self._scheduled_for: Dict[str, Tuple[str, str]] = {}
+        self._version_counter = itertools.count(1)
+        self._wakeup = asyncio.Event()
+    
+    def __len__(self) -> int:
+        return len(self._versions)
+    
+    def track(self, task: Task, now: Optional[datetime] = None):
+        """(Re)schedule task's next status transition"""
+        key = (task.due_date, task.status)
+        if task.id in self._versions and self._scheduled_for.get(task.id) == key:
+            return
+        self.untrack(task.id)
+        
+        if task.status not in TIME_DRIVEN_STATUSES:
+            return
+        
+        due = parse_due_date(task.due_date)
+        if due == datetime.max:
+            return
+        
+        now = now or datetime.utcnow()
+        if task.status != status_for(due, now):
+            # Already stale (e.g. created with the wrong status): fix on next run
+            at = now
+        else:
+            at = next_boundary(due, now)
+            if at is None:
+                return
+        
+        version = next(self._version_counter)
+        self._versions[task.id] = version
+        self._scheduled_for[task.id] = key
+        heapq.heappush(self._heap, (at, version, task.id))
+        self._compact()
+        
+        if self._heap[0][1] == version:
+            # New earliest deadline: re-arm the sleeping loop
+            self._wakeup.set()
+    
+    def untrack(self, task_id: str):
+        """Forget task's pending transition (its heap entry goes stale)"""
+        self._versions.pop(task_id, None)
+        self._scheduled_for.pop(task_id, None)
+    
+    def _is_live(self, entry: Tuple[datetime, int, str]) -> bool:
+        """Whether a heap entry is its task's current version"""
+        return self._versions.get(entry[2]) == entry[1]
+    
+    def _compact(self):
+        """Rebuild the heap from live entries once stale ones outnumber them"""
+        if len(self._heap) > 2 * len(self._versions) + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+    
+    def advance(self, now: datetime) -> List[Tuple[Task, str]]:
+        """Apply every transition due by now; returns (task, previous_status)"""
+        transitions = []
+        
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue
+            task_id = entry[2]
+            self.untrack(task_id)
+            
+            task = self._store.get(task_id)
+            if task is None or task.status not in TIME_DRIVEN_STATUSES:
+                continue
+            
+            previous = task.status
+            status = status_for(parse_due_date(task.due_date), now)
+            if status != previous:
+                self._store.update(task_id, {"status": status})
+                transitions.append((task, previous))
+            
+            self.track(task, now)
+        
+        return transitions
+    
+    async def run(self, on_transition: Callable[[Task, str], Awaitable[None]]):
+        """Sleep until the earliest boundary, apply transitions, repeat"""
+        while True:
+            self._wakeup.clear()
+            
+            # Don't wake up for deadlines that were retired
+            while self._heap and not self._is_live(self._heap[0]):
+                heapq.heappop(self._heap)
+            
+            timeout = MAX_SLEEP_SECONDS
+            if self._heap:
+                delay = (self._heap[0][0] - datetime.utcnow()).total_seconds()
+                timeout = min(MAX_SLEEP_SECONDS, max(0.0, delay))
+            
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            
+            for task, previous in self.advance(datetime.utcnow()):
+                try:
+                    await on_transition(task, previous)
+                except Exception as e:
+                    logger.error(f"Task transition handler failed for {task.id}: {e}")
@@ -1,31 +1,161 @@
 """
 Task service - task management logic
 """
-from typing import List, Optional
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
-from app.models.task import Task
+import asyncio
+import logging
+from pydantic import ValidationError
+from app.models.task import Task, TaskUpdate
+from app.services.task_store import TaskStore
+from app.services.task_scheduler import TaskStatusScheduler
+from app.services.persistence import PersistenceError, get_store
 from app.api.v1.websocket import broadcast_update
 
+logger = logging.getLogger(__name__)
+
 
 class TaskService:
     """Task management service"""
     
     def __init__(self):
-        # In-memory storage for demo
-        self._tasks: List[Task] = []
+        # Indexed in-memory cache; SQLite (when enabled) is the durable copy,
+        # opened at app startup rather than on import
+        self._store = TaskStore()
+        self._db = None
+        self._opened = False
+        
+        # Time-driven status transitions (overdue/due_today)
+        self._scheduler = TaskStatusScheduler(self._store)
+        self._scheduler_task: Optional[asyncio.Task] = None
+    
+    def open(self):
+        """Open the database and warm the cache"""
+        if self._opened:
+            return
+        self._opened = True
+        
+        self._db = get_store()
+        self._load_tasks()
+        for task in self._store.all():
+            self._scheduler.track(task)
+    
+    async def start_scheduler(self):
+        """Start the background status scheduler"""
+        if self._scheduler_task is None:
+            self._scheduler_task = asyncio.create_task(
+                self._scheduler.run(self._on_status_transition)
+            )
+            logger.info(f"Task status scheduler started ({len(self._scheduler)} tasks tracked)")
+    
+    async def stop_scheduler(self):
+        """Stop the background status scheduler"""
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+            self._scheduler_task = None
+    
+    def _load_tasks(self):
+        """Warm the cache from the database in one query, seeding mock data if empty"""
+        documents = self._db.load_tasks() if self._db else []
+        if documents:
+            self._store.add_many([Task.model_validate_json(doc) for doc in documents])
+            logger.info(f"Loaded {len(documents)} tasks from {self._db.path}")
+            return
+        
         self._generate_mock_tasks()
+        self._persist(*self._store.all())
+    
+    def _persist(self, *tasks: Task) -> Optional[Future]:
+        """Queue tasks for the next group commit (as one unit)"""
+        if self._db:
+            return self._db.save_tasks([(task.id, task.model_dump_json()) for task in tasks])
+        return None
+    
+    async def _save(self, *tasks: Task):
+        """Queue tasks for the next group commit and wait until it lands (raises PersistenceError)"""
+        future = self._persist(*tasks)
+        if future is not None:
+            await asyncio.wrap_future(future)
+    
+    async def _save_or_restore(self, previous: Dict[str, Optional[Task]], *tasks: Task):
+        """
+        Save tasks, putting the cache back as it was if the commit fails
+        previous maps each touched task ID to a copy of its prior state
+        (None for a task that didn't exist), so a 503 leaves nothing behind.
+        """
+        try:
+            await self._save(*tasks)
+        except PersistenceError:
+            for task_id, task in previous.items():
+                self._store.remove(task_id)
+                self._scheduler.untrack(task_id)
+                if task is not None:
+                    self._store.add(task)
+                    self._scheduler.track(task)
+            raise
+    
+    async def _on_status_transition(self, task: Task, previous_status: str):
+        """Persist and broadcast a time-driven status change"""
+        # Not awaited, so a midnight run doesn't wait out one commit per task
+        future = self._persist(task)
+        if future is not None:
+            future.add_done_callback(lambda f: self._log_failed_save(f, task.id))
+        await broadcast_update("task_status_changed", {
+            **task.dict(),
+            "previous_status": previous_status
+        })
+    
+    @staticmethod
+    def _log_failed_save(future: Future, task_id: str):
+        """Report a background save that didn't land"""
+        error = future.exception()
+        if error is not None:
+            # The status is derived from the clock, so the cache stays right;
+            # the row catches up on the task's next write or on restart
+            logger.error(f"Failed to persist status change for {task_id}: {error}")
     
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks"""
-        return self._tasks
+        return self._store.all()
+    
+    def query_tasks(
+        self,
+        status: Optional[str] = None,
+        assignee: Optional[str] = None,
+        sme_id: Optional[str] = None,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Task], int]:
+        """Get one page of filtered tasks and the total match count"""
+        return self._store.query(
+            status=status,
+            assignee=assignee,
+            sme_id=sme_id,
+            due_after=due_after,
+            due_before=due_before,
+            offset=offset,
+            limit=limit,
+        )
     
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """Get task by ID"""
-        return next((t for t in self._tasks if t.id == task_id), None)
+        return self._store.get(task_id)
     
-    def create_task(self, task: Task) -> Task:
-        """Create new task"""
-        self._tasks.insert(0, task)
+    async def create_task(self, task: Task) -> Optional[Task]:
+        """Create new task (None if the ID is already taken)"""
+        if task.id in self._store:
+            return None
+        
+        self._store.add(task)
+        self._scheduler.track(task)
+        await self._save_or_restore({task.id: None}, task)
         
         # Broadcast task creation via WebSocket
         asyncio.create_task(
@@ -34,42 +164,146 @@ class TaskService:
         
         return task
     
-    def update_task(self, task_id: str, updates: dict) -> Optional[Task]:
+    async def update_task(self, task_id: str, updates: dict) -> Optional[Task]:
         """Update task"""
-        task = self.get_task_by_id(task_id)
-        if not task:
+        previous = self._store.get(task_id)
+        if previous is None:
             return None
+        previous = previous.model_copy()
         
-        # Update fields
-        for key, value in updates.items():
-            if hasattr(task, key):
-                setattr(task, key, value)
-        
+        task = self._store.update(task_id, updates)
+        self._scheduler.track(task)
+        await self._save_or_restore({task_id: previous}, task)
         return task
     
-    def delete_task(self, task_id: str) -> bool:
+    async def delete_task(self, task_id: str) -> bool:
         """Delete task"""
-        task = self.get_task_by_id(task_id)
-        if task:
-            self._tasks.remove(task)
-            return True
-        return False
+        self._scheduler.untrack(task_id)
+        if self._store.remove(task_id) is None:
+            return False
+        if self._db:
+            await asyncio.wrap_future(self._db.delete_task(task_id))
+        return True
     
-    def complete_task(self, task_id: str) -> Optional[Task]:
+    async def complete_task(self, task_id: str) -> Optional[Task]:
         """Mark task as complete"""
-        task = self.get_task_by_id(task_id)
-        if not task:
+        previous = self._store.get(task_id)
+        if previous is None:
             return None
+        previous = previous.model_copy()
         
-        task.status = "completed"
+        task = self._store.update(task_id, {"status": "completed"})
+        self._scheduler.untrack(task_id)
+        await self._save_or_restore({task_id: previous}, task)
         return task
     
+    async def bulk_create_tasks(self, tasks: List[Task]) -> Tuple[List[Task], List[str]]:
+        """
+        Create a batch of tasks atomically
+        Returns (created, errors); nothing is applied if there are errors.
+        """
+        errors = []
+        seen = set()
+        for task in tasks:
+            if task.id in seen:
+                errors.append(f"Task {task.id} appears more than once")
+            elif task.id in self._store:
+                errors.append(f"Task {task.id} already exists")
+            seen.add(task.id)
+        
+        if errors:
+            return [], errors
+        
+        self._store.add_many(tasks)
+        for task in tasks:
+            self._scheduler.track(task)
+        await self._save_or_restore(dict.fromkeys(task.id for task in tasks), *tasks)
+        
+        self._broadcast_tasks_changed(created=tasks)
+        return tasks, []
+    
+    async def bulk_update_tasks(self, updates: List[TaskUpdate]) -> Tuple[List[Task], List[str]]:
+        """
+        Apply field updates to a batch of tasks atomically
+        Every update is validated against the Task model before any is applied.
+        """
+        errors = []
+        validated = []
+        seen = set()
+        for item in updates:
+            task = self._store.get(item.id)
+            if item.id in seen:
+                errors.append(f"Task {item.id} appears more than once")
+                continue
+            seen.add(item.id)
+            if not task:
+                errors.append(f"Task {item.id} not found")
+                continue
+            
+            unknown = [key for key in item.updates if key == "id" or key not in Task.model_fields]
+            if unknown:
+                errors.append(f"Task {item.id}: cannot update {', '.join(unknown)}")
+                continue
+            
+            try:
+                merged = Task(**{**task.dict(), **item.updates})
+            except ValidationError as e:
+                errors.append(f"Task {item.id}: {e.errors()[0]['msg']}")
+                continue
+            
+            validated.append((item.id, {key: getattr(merged, key) for key in item.updates}))
+        
+        if errors:
+            return [], errors
+        
+        previous = {task_id: self._store.get(task_id).model_copy() for task_id, _ in validated}
+        changed = []
+        for task_id, fields in validated:
+            task = self._store.update(task_id, fields)
+            self._scheduler.track(task)
+            changed.append(task)
+        await self._save_or_restore(previous, *changed)
+        
+        self._broadcast_tasks_changed(updated=changed)
+        return changed, []
+    
+    async def bulk_complete_tasks(self, task_ids: List[str]) -> Tuple[List[Task], List[str]]:
+        """Mark a batch of tasks complete atomically"""
+        missing = [task_id for task_id in task_ids if task_id not in self._store]
+        if missing:
+            return [], [f"Task {task_id} not found" for task_id in missing]
+        
+        previous = {task_id: self._store.get(task_id).model_copy() for task_id in task_ids}
+        completed = []
+        for task_id in previous:
+            completed.append(self._store.update(task_id, {"status": "completed"}))
+            self._scheduler.untrack(task_id)
+        await self._save_or_restore(previous, *completed)
+        
+        self._broadcast_tasks_changed(completed=completed)
+        return completed, []
+    
+    def _broadcast_tasks_changed(
+        self,
+        created: Sequence[Task] = (),
+        updated: Sequence[Task] = (),
+        completed: Sequence[Task] = (),
+    ):
+        """One aggregated event for a whole bulk operation"""
+        asyncio.create_task(
+            broadcast_update("tasks_changed", {
+                "created": [t.dict() for t in created],
+                "updated": [t.dict() for t in updated],
+                "completed": [t.dict() for t in completed],
+            })
+        )
+    
     def _generate_mock_tasks(self):
         """Generate mock tasks for demo"""
         now = datetime.utcnow()
         
         # Overdue task
-        self._tasks.append(
+        self._store.add(
             Task(
                 id="task_001",
                 title="Follow up: TechStart Solutions - Revenue Decline",
@@ -87,7 +321,7 @@ class TaskService:
         )
         
         # Due today
-        self._tasks.append(
+        self._store.add(
             Task(
                 id="task_002",
                 title="Review: GreenTech Energy - New Application",
@@ -104,7 +338,7 @@ class TaskService:
             )
         )
         
-        self._tasks.append(
+        self._store.add(
             Task(
                 id="task_003",
                 title="Hemp Ban Impact: Review GreenLeaf Products",
@@ -123,7 +357,7 @@ class TaskService:
         
         # Upcoming tasks
         for i in range(7):
-            self._tasks.append(
+            self._store.add(
                 Task(
                     id=f"task_{100 + i}",
                     title=f"Quarterly Review: SME Portfolio {i+1}",
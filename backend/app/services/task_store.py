@@ -0,0 +1,203 @@
+"""
+Task store - indexed in-memory task repository
+"""
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from itertools import islice
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from app.models.task import Task
+from app.utils.time import to_naive_utc
+
+
+class _IndexKeys(NamedTuple):
+    """Indexed field values a task was last filed under"""
+    status: str
+    assignee: str
+    sme_id: str
+    due: datetime
+
+
+def parse_due_date(due_date: str) -> datetime:
+    """Parse an ISO due date into a naive UTC datetime (unparseable sorts last)"""
+    try:
+        return to_naive_utc(datetime.fromisoformat(due_date.replace("Z", "+00:00")))
+    except (AttributeError, ValueError):
+        return datetime.max
+
+
+class TaskStore:
+    """
+    Task repository with an id map and secondary indexes
+    
+    Lookups by id are O(1); status, assignee and SME filters intersect
+    id sets; the due-date index is a sorted list of (due, id) so range
+    queries and pagination are a bisect plus a slice.
+    """
+    
+    def __init__(self):
+        self._by_id: Dict[str, Task] = {}
+        self._keys: Dict[str, _IndexKeys] = {}
+        self._by_status: Dict[str, Set[str]] = defaultdict(set)
+        self._by_assignee: Dict[str, Set[str]] = defaultdict(set)
+        self._by_sme: Dict[str, Set[str]] = defaultdict(set)
+        self._by_due: List[Tuple[datetime, str]] = []
+    
+    def __len__(self) -> int:
+        return len(self._by_id)
+    
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._by_id
+    
+    def get(self, task_id: str) -> Optional[Task]:
+        """Get task by ID"""
+        return self._by_id.get(task_id)
+    
+    def all(self) -> List[Task]:
+        """All tasks in due-date order"""
+        return [self._by_id[task_id] for _, task_id in self._by_due]
+    
+    def add(self, task: Task):
+        """Add task (replacing any task with the same ID)"""
+        if task.id in self._by_id:
+            self._unindex(task.id)
+        
+        self._by_id[task.id] = task
+        self._index(task)
+    
+    def add_many(self, tasks: List[Task]):
+        """Add a batch of tasks, re-sorting the due index once instead of per insert"""
+        # Last one wins for a repeated ID, same as calling add() in turn
+        batch = {task.id: task for task in tasks}
+        
+        # Unindex replaced tasks while the due index is still sorted for bisect
+        for task_id in batch:
+            if task_id in self._by_id:
+                self._unindex(task_id)
+        
+        for task in batch.values():
+            self._by_id[task.id] = task
+            self._index(task, ordered=False)
+        self._by_due.sort()
+    
+    def remove(self, task_id: str) -> Optional[Task]:
+        """Remove task, returning it if it existed"""
+        task = self._by_id.pop(task_id, None)
+        if task is not None:
+            self._unindex(task_id)
+        return task
+    
+    def update(self, task_id: str, updates: dict) -> Optional[Task]:
+        """Apply field updates and re-file the task under its new index keys"""
+        task = self._by_id.get(task_id)
+        if task is None:
+            return None
+        
+        self._unindex(task_id)
+        for key, value in updates.items():
+            if key != "id" and hasattr(task, key):
+                setattr(task, key, value)
+        self._index(task)
+        
+        return task
+    
+    def query(
+        self,
+        status: Optional[str] = None,
+        assignee: Optional[str] = None,
+        sme_id: Optional[str] = None,
+        due_after: Optional[datetime] = None,
+        due_before: Optional[datetime] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Task], int]:
+        """
+        Filter tasks using the indexes
+        
+        Returns one page in due-date order plus the total number of matches.
+        """
+        due_after = to_naive_utc(due_after) if due_after is not None else None
+        due_before = to_naive_utc(due_before) if due_before is not None else None
+        
+        lo = bisect_left(self._by_due, (due_after,)) if due_after is not None else 0
+        hi = (
+            bisect_right(self._by_due, (due_before, chr(0x10FFFF)))
+            if due_before is not None else len(self._by_due)
+        )
+        
+        candidates = [
+            index.get(value, set())
+            for index, value in (
+                (self._by_status, status),
+                (self._by_assignee, assignee),
+                (self._by_sme, sme_id),
+            )
+            if value is not None
+        ]
+        
+        if not candidates:
+            # Pure due-date range: page straight off the ordered index
+            total = max(0, hi - lo)
+            start = lo + offset
+            stop = hi if limit is None else min(hi, start + limit)
+            return [self._by_id[task_id] for _, task_id in self._by_due[start:stop]], total
+        
+        # Intersect from the smallest set so the work is bounded by it
+        candidates.sort(key=len)
+        ids = set(candidates[0])
+        for other in candidates[1:]:
+            ids &= other
+        
+        ranged = due_after is not None or due_before is not None
+        stop = None if limit is None else offset + limit
+        
+        if len(ids) * 8 > hi - lo:
+            # Dense match: walk the ordered index instead of sorting the matches
+            matches = (task_id for _, task_id in islice(self._by_due, lo, hi) if task_id in ids)
+            if not ranged:
+                # Every match is in range, so the count is free and the walk can stop early
+                return [self._by_id[task_id] for task_id in islice(matches, offset, stop)], len(ids)
+            matched = list(matches)
+            return [self._by_id[task_id] for task_id in matched[offset:stop]], len(matched)
+        
+        keyed = [(self._keys[task_id].due, task_id) for task_id in ids]
+        if ranged:
+            lo_key = due_after if due_after is not None else datetime.min
+            hi_key = due_before if due_before is not None else datetime.max
+            keyed = [k for k in keyed if lo_key <= k[0] <= hi_key]
+        keyed.sort()
+        
+        return [self._by_id[task_id] for _, task_id in keyed[offset:stop]], len(keyed)
+    
+    def _index(self, task: Task, ordered: bool = True):
+        """File task under its current field values"""
+        keys = _IndexKeys(task.status, task.assignee, task.sme_id, parse_due_date(task.due_date))
+        self._keys[task.id] = keys
+        self._by_status[keys.status].add(task.id)
+        self._by_assignee[keys.assignee].add(task.id)
+        self._by_sme[keys.sme_id].add(task.id)
+        if ordered:
+            insort(self._by_due, (keys.due, task.id))
+        else:
+            self._by_due.append((keys.due, task.id))
+    
+    def _unindex(self, task_id: str):
+        """Remove task from every index using the keys it was filed under"""
+        keys = self._keys.pop(task_id)
+        self._discard(self._by_status, keys.status, task_id)
+        self._discard(self._by_assignee, keys.assignee, task_id)
+        self._discard(self._by_sme, keys.sme_id, task_id)
+        
+        pos = bisect_left(self._by_due, (keys.due, task_id))
+        if pos < len(self._by_due) and self._by_due[pos] == (keys.due, task_id):
+            del self._by_due[pos]
+    
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], value: str, task_id: str):
+        """Remove id from an index bucket, dropping empty buckets"""
+        bucket = index.get(value)
+        if bucket is not None:
+            bucket.discard(task_id)
+            if not bucket:
+                del index[value]
@@ -0,0 +1,59 @@
+"""
+Timer wheel - O(1) scheduling of many coarse-grained timers
+"""
+from typing import Dict, Hashable, List
+import math
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel
+    
+    Timers are bucketed into fixed-width slots and the wheel is advanced by
+    a single ticker, so thousands of timers cost one loop instead of one
+    task each. Delays longer than a full turn carry a rounds counter.
+    """
+    
+    def __init__(self, tick: float, slots: int):
+        self.tick = tick
+        self._slots: List[Dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._where: Dict[Hashable, int] = {}
+        self._cursor = 0
+    
+    def __len__(self) -> int:
+        return len(self._where)
+    
+    def schedule(self, key: Hashable, delay: float):
+        """Schedule key to expire after delay seconds (replaces any existing timer)"""
+        self.cancel(key)
+        
+        ticks = max(1, math.ceil(delay / self.tick))
+        rounds, offset = divmod(ticks, len(self._slots))
+        if offset == 0:
+            rounds, offset = rounds - 1, len(self._slots)
+        
+        slot = (self._cursor + offset) % len(self._slots)
+        self._slots[slot][key] = rounds
+        self._where[key] = slot
+    
+    def cancel(self, key: Hashable):
+        """Cancel timer for key if scheduled"""
+        slot = self._where.pop(key, None)
+        if slot is not None:
+            self._slots[slot].pop(key, None)
+    
+    def advance(self) -> List[Hashable]:
+        """Advance one tick and return keys whose timers expired"""
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        bucket = self._slots[self._cursor]
+        
+        expired = []
+        for key, rounds in list(bucket.items()):
+            if rounds > 0:
+                bucket[key] = rounds - 1
+            else:
+                del bucket[key]
+                del self._where[key]
+                expired.append(key)
+        
+        return expired
@@ -0,0 +1,11 @@
+"""
+Time helpers shared by the in-memory stores
+"""
+from datetime import datetime, timezone
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """Normalize a datetime to naive UTC, the form used as index keys"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
@@ -0,0 +1,273 @@
+"""
+WebSocket broadcast benchmark
+
+Runs the backend in this process and N WebSocket clients (a mix of fast and
+slow readers) in a child process, drives broadcast_update at a fixed rate,
+then reports delivery latency percentiles, the time for each event to reach
+every client, server memory per connection and dropped messages. Latencies
+compare CLOCK_MONOTONIC readings across the two processes, so both must run
+on one host. The app runs without SQLite or an activity log on disk.
+
+Usage (from backend/):
+    python -m benchmarks.ws_broadcast --clients 1000 --rate 50 --duration 10
+    python -m benchmarks.ws_broadcast --clients 5000 --slow-ratio 0.1 --slow-delay 0.05
+"""
+import argparse
+import asyncio
+import gc
+import json
+import multiprocessing
+import os
+import resource
+import time
+import tracemalloc
+from multiprocessing.connection import Connection
+from typing import Dict, List, Optional, Tuple
+
+import uvicorn
+import websockets
+
+# Keep the benchmark off disk: no SQLite file or activity log segments
+os.environ["DATABASE_PATH"] = ""
+os.environ["ACTIVITY_LOG_DIR"] = ""
+
+BENCH_EVENT = "bench"
+
+
+class BenchClient:
+    """Single WebSocket reader recording per-message delivery latency"""
+    
+    def __init__(self, url: str, slow_delay: float = 0.0):
+        self.url = url
+        self.slow_delay = slow_delay
+        self.latencies: List[float] = []
+        # Event number -> arrival time, for time to reach every client
+        self.arrivals: Dict[int, float] = {}
+        self.received = 0
+        self.error: Optional[str] = None
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def connect(self):
+        """Open the socket and start reading"""
+        self._ws = await websockets.connect(self.url, max_queue=None, ping_interval=None)
+        self._task = asyncio.create_task(self._read())
+    
+    async def _read(self):
+        """Read until closed, answering server heartbeats (latency is per event, not per frame)"""
+        try:
+            async for raw in self._ws:
+                message = json.loads(raw)
+                
+                if message.get("type") == "ping":
+                    await self._ws.send('{"type": "pong"}')
+                    continue
+                
+                # Events inside one flush window arrive as a single batch frame
+                events = message["events"] if message.get("type") == "batch" else [message]
+                received_at = time.monotonic()
+                bench_events = [e for e in events if e.get("type") == BENCH_EVENT]
+                if not bench_events:
+                    continue
+                
+                for event in bench_events:
+                    self.latencies.append(received_at - event["data"]["sent_at"])
+                    self.arrivals[event["data"]["n"]] = received_at
+                self.received += len(bench_events)
+                
+                if self.slow_delay:
+                    await asyncio.sleep(self.slow_delay)
+        except Exception as e:
+            self.error = str(e)
+    
+    async def close(self):
+        """Close the socket and stop reading"""
+        if self._ws is not None:
+            await self._ws.close()
+        if self._task is not None:
+            self._task.cancel()
+
+
+def _raise_fd_limit(clients: int):
+    """Each client costs one descriptor in each process"""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    wanted = min(hard, max(soft, clients + 256))
+    if wanted > soft:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (wanted, hard))
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+async def _start_server() -> Tuple[uvicorn.Server, asyncio.Task, int]:
+    """Start the app on an ephemeral port in this event loop"""
+    from app.main import app
+    
+    config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", ws="websockets")
+    server = uvicorn.Server(config)
+    task = asyncio.create_task(server.serve())
+    
+    while not server.started:
+        await asyncio.sleep(0.05)
+    
+    port = server.servers[0].sockets[0].getsockname()[1]
+    return server, task, port
+
+
+async def _connect_all(clients: List[BenchClient], concurrency: int):
+    """Open client sockets with bounded connection concurrency"""
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _open(client: BenchClient):
+        async with semaphore:
+            await client.connect()
+    
+    await asyncio.gather(*[_open(c) for c in clients])
+
+
+async def _run_clients(args, url: str, conn: Connection):
+    """Client process: connect, report, read until told to stop, send results"""
+    _raise_fd_limit(args.clients)
+    slow_count = int(args.clients * args.slow_ratio)
+    clients = [
+        BenchClient(url, slow_delay=args.slow_delay if i < slow_count else 0.0)
+        for i in range(args.clients)
+    ]
+    
+    connect_start = time.monotonic()
+    await _connect_all(clients, args.connect_concurrency)
+    conn.send(time.monotonic() - connect_start)
+    
+    # Block off-loop so the readers keep running
+    await asyncio.get_running_loop().run_in_executor(None, conn.recv)
+    
+    # Latest arrival of each event across all clients
+    last_arrival: Dict[int, float] = {}
+    for client in clients:
+        for n, received_at in client.arrivals.items():
+            last_arrival[n] = max(last_arrival.get(n, 0.0), received_at)
+    
+    conn.send({
+        "latencies": [lat for c in clients for lat in c.latencies],
+        "fast_latencies": [lat for c in clients if not c.slow_delay for lat in c.latencies],
+        "last_arrival": last_arrival,
+        "received": sum(c.received for c in clients),
+        "errors": sum(1 for c in clients if c.error),
+    })
+    
+    for client in clients:
+        await client.close()
+
+
+def _client_main(args, url: str, conn: Connection):
+    """Entry point of the client process"""
+    asyncio.run(_run_clients(args, url, conn))
+
+
+async def run(args) -> dict:
+    """Run the benchmark and return the report"""
+    from app.api.v1.websocket import broadcast_update, manager
+    
+    _raise_fd_limit(args.clients)
+    server, server_task, port = await _start_server()
+    url = f"ws://127.0.0.1:{port}/ws"
+    loop = asyncio.get_running_loop()
+    
+    # Only the server lives in this process, so its memory is all we measure
+    gc.collect()
+    tracemalloc.start()
+    mem_before, _ = tracemalloc.get_traced_memory()
+    # ru_maxrss is peak RSS in KiB on Linux
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    
+    # Spawn, not fork: the child must not inherit the running server loop
+    context = multiprocessing.get_context("spawn")
+    conn, child_conn = context.Pipe()
+    process = context.Process(target=_client_main, args=(args, url, child_conn))
+    process.start()
+    connect_time = await loop.run_in_executor(None, conn.recv)
+    
+    gc.collect()
+    mem_after, _ = tracemalloc.get_traced_memory()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.stop()
+    
+    # Drive broadcasts at the requested rate
+    total = int(args.rate * args.duration)
+    interval = 1.0 / args.rate
+    sent_at: List[float] = []
+    start = time.monotonic()
+    
+    for i in range(total):
+        target = start + i * interval
+        delay = target - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        sent_at.append(time.monotonic())
+        await broadcast_update(BENCH_EVENT, {"n": i, "sent_at": sent_at[-1]})
+    
+    send_elapsed = time.monotonic() - start
+    
+    # Let slow readers drain before counting drops
+    await asyncio.sleep(args.drain)
+    
+    conn.send("stop")
+    results = await loop.run_in_executor(None, conn.recv)
+    await loop.run_in_executor(None, process.join)
+    stats = manager.get_stats()
+    
+    server.should_exit = True
+    await server_task
+    
+    # Time from broadcast_update until the event reached every client that got it
+    fanout = [results["last_arrival"][n] - sent_at[n] for n in results["last_arrival"]]
+    expected = total * args.clients
+    
+    return {
+        "clients": args.clients,
+        "slow_clients": int(args.clients * args.slow_ratio),
+        "connect_time_s": round(connect_time, 3),
+        "broadcasts": total,
+        "achieved_rate": round(total / send_elapsed, 1) if send_elapsed else 0.0,
+        "fanout_p50_ms": round(_percentile(fanout, 50) * 1000, 2),
+        "fanout_p99_ms": round(_percentile(fanout, 99) * 1000, 2),
+        "delivery_p50_ms": round(_percentile(results["latencies"], 50) * 1000, 2),
+        "delivery_p99_ms": round(_percentile(results["latencies"], 99) * 1000, 2),
+        "fast_reader_p99_ms": round(_percentile(results["fast_latencies"], 99) * 1000, 2),
+        "server_heap_per_conn_kb": round((mem_after - mem_before) / max(1, args.clients) / 1024, 2),
+        "server_rss_per_conn_kb": round((rss_after - rss_before) / max(1, args.clients), 2),
+        "expected_messages": expected,
+        "received_messages": results["received"],
+        "dropped_messages": expected - results["received"],
+        "client_errors": results["errors"],
+        "reaped_connections": stats["reaped_connections"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WebSocket broadcast benchmark")
+    parser.add_argument("--clients", type=int, default=1000, help="Concurrent WebSocket clients")
+    parser.add_argument("--rate", type=float, default=20.0, help="Broadcasts per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of broadcasting")
+    parser.add_argument("--slow-ratio", type=float, default=0.05, help="Fraction of slow readers")
+    parser.add_argument("--slow-delay", type=float, default=0.05, help="Seconds a slow reader sleeps per message")
+    parser.add_argument("--drain", type=float, default=5.0, help="Seconds to wait for delivery after sending")
+    parser.add_argument("--connect-concurrency", type=int, default=200, help="Parallel connection attempts")
+    args = parser.parse_args()
+    
+    report = asyncio.run(run(args))
+    
+    width = max(len(k) for k in report)
+    for key, value in report.items():
+        print(f"{key:<{width}}  {value}")
+
+
+if __name__ == "__main__":
+    main()
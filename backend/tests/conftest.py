@@ -0,0 +1,21 @@
+"""
+Shared test setup
+"""
+import os
+
+import pytest
+
+# Keep the app in memory: no SQLite file or activity log segments under backend/
+os.environ.setdefault("DATABASE_PATH", "")
+os.environ.setdefault("ACTIVITY_LOG_DIR", "")
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One running app per test session (services are module-level singletons bound to its loop)"""
+    from fastapi.testclient import TestClient
+    
+    from app.main import app
+    
+    with TestClient(app) as test_client:
+        yield test_client
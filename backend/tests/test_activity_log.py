@@ -0,0 +1,70 @@
+"""
+Activity ring buffer tests
+"""
+import pytest
+
+from app.models.activity import Activity
+from app.services.activity_log import ActivityLog
+
+
+def make_activity(n: int) -> Activity:
+    return Activity(id=f"act_{n}", timestamp="2026-05-10T00:00:00Z", type="info", message=f"activity {n}")
+
+
+def fill(log: ActivityLog, count: int):
+    for n in range(1, count + 1):
+        log.append(make_activity(n))
+
+
+def seqs(activities) -> list:
+    return [activity.seq for activity in activities]
+
+
+def test_ring_wraps_around_and_keeps_the_newest():
+    log = ActivityLog(capacity=4)
+    fill(log, 10)
+    
+    assert len(log) == 4
+    assert log.last_seq == 10
+    assert log.first_seq == 7
+    assert [a.message for a in log.latest()] == ["activity 10", "activity 9", "activity 8", "activity 7"]
+
+
+def test_first_seq_before_the_ring_fills():
+    log = ActivityLog(capacity=4)
+    assert (log.first_seq, log.last_seq, len(log)) == (1, 0, 0)
+    assert log.latest() == []
+    
+    fill(log, 3)
+    assert (log.first_seq, len(log)) == (1, 3)
+
+
+def test_since_after_eviction_starts_at_the_oldest_held():
+    log = ActivityLog(capacity=4)
+    fill(log, 10)
+    
+    # Cursor points into the evicted range: only what's still held comes back
+    assert seqs(log.since(2)) == [10, 9, 8, 7]
+    assert seqs(log.since(8)) == [10, 9]
+    assert log.since(10) == []
+
+
+def test_since_limit_pages_forward_from_the_cursor():
+    log = ActivityLog(capacity=4)
+    fill(log, 10)
+    
+    assert seqs(log.since(6, limit=2)) == [8, 7]
+    assert seqs(log.since(6, limit=2, oldest_first=False)) == [10, 9]
+    assert seqs(log.latest(3)) == [10, 9, 8]
+
+
+def test_restored_seq_clears_skipped_slots():
+    log = ActivityLog(capacity=4)
+    fill(log, 4)
+    
+    log.append(make_activity(99), seq=6)
+    
+    # Seq 5 was never written, and slot 5 % 4 held seq 1: it must not resurface
+    assert seqs(log.latest()) == [6, 4, 3]
+    with pytest.raises(ValueError):
+        log.append(make_activity(100), seq=6)
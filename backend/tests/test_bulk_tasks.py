@@ -0,0 +1,110 @@
+"""
+Bulk task endpoint tests
+"""
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+
+from app.api.v1.tasks import task_service
+from app.models.task import Task
+from app.services.persistence import PersistenceError
+
+
+def make_task(n: int) -> dict:
+    now = datetime.utcnow() + timedelta(days=30)
+    return Task(
+        id=f"bulk_api_{n:03d}",
+        title=f"Task {n}",
+        sme_id="#0002",
+        sme_name="SME 2",
+        exposure="€50K",
+        assignee="Jane Doe",
+        priority="medium",
+        due_date=(now + timedelta(days=n)).isoformat() + "Z",
+        status="upcoming",
+        description="",
+        source="test",
+        created_at=now.isoformat() + "Z",
+    ).model_dump()
+
+
+def test_bulk_create_is_all_or_nothing(client):
+    existing = make_task(0)
+    assert client.post("/api/v1/tasks/", json=existing).status_code == 200
+    
+    response = client.post("/api/v1/tasks/bulk", json={"tasks": [make_task(1), existing, make_task(2)]})
+    
+    assert response.status_code == 422
+    assert response.json()["detail"] == ["Task bulk_api_000 already exists"]
+    assert client.get("/api/v1/tasks/bulk_api_001").status_code == 404
+
+
+def test_bulk_update_validates_every_item_first(client):
+    client.post("/api/v1/tasks/bulk", json={"tasks": [make_task(10), make_task(11)]})
+    
+    response = client.patch("/api/v1/tasks/bulk", json={"updates": [
+        {"id": "bulk_api_010", "updates": {"assignee": "Ann"}},
+        {"id": "bulk_api_011", "updates": {"priority": "urgent"}},
+        {"id": "bulk_api_404", "updates": {"assignee": "Ann"}},
+        {"id": "bulk_api_010", "updates": {"id": "renamed"}},
+    ]})
+    
+    assert response.status_code == 422
+    assert len(response.json()["detail"]) == 3
+    assert client.get("/api/v1/tasks/bulk_api_010").json()["assignee"] == "Jane Doe"
+    
+    response = client.patch("/api/v1/tasks/bulk", json={"updates": [
+        {"id": "bulk_api_010", "updates": {"assignee": "Ann"}},
+        {"id": "bulk_api_011", "updates": {"assignee": "Ann", "priority": "high"}},
+    ]})
+    
+    assert response.status_code == 200
+    assert client.get("/api/v1/tasks/", params={"assignee": "Ann"}).headers["X-Total-Count"] == "2"
+    assert client.get("/api/v1/tasks/bulk_api_011").json()["priority"] == "high"
+
+
+def test_bulk_complete(client):
+    client.post("/api/v1/tasks/bulk", json={"tasks": [make_task(20), make_task(21)]})
+    
+    missing = client.post("/api/v1/tasks/bulk/complete", json={"ids": ["bulk_api_020", "bulk_api_999"]})
+    assert missing.status_code == 404
+    assert client.get("/api/v1/tasks/bulk_api_020").json()["status"] == "upcoming"
+    
+    done = client.post("/api/v1/tasks/bulk/complete", json={"ids": ["bulk_api_020", "bulk_api_021", "bulk_api_020"]})
+    assert done.status_code == 200
+    assert [t["status"] for t in done.json()] == ["completed", "completed"]
+
+
+class FailingStore:
+    """Database stand-in whose commits always fail"""
+    
+    def save_tasks(self, writes):
+        future = Future()
+        future.set_exception(PersistenceError("disk full"))
+        return future
+
+
+def test_failed_commit_rolls_back_the_cache(client, monkeypatch):
+    client.post("/api/v1/tasks/bulk", json={"tasks": [make_task(30), make_task(31)]})
+    monkeypatch.setattr(task_service, "_db", FailingStore())
+    
+    created = client.post("/api/v1/tasks/bulk", json={"tasks": [make_task(32)]})
+    updated = client.patch("/api/v1/tasks/bulk", json={"updates": [
+        {"id": "bulk_api_030", "updates": {"assignee": "Ann", "priority": "high"}},
+    ]})
+    completed = client.post("/api/v1/tasks/bulk/complete", json={"ids": ["bulk_api_030", "bulk_api_031"]})
+    
+    assert [r.status_code for r in (created, updated, completed)] == [503, 503, 503]
+    assert client.get("/api/v1/tasks/bulk_api_032").status_code == 404
+    task = client.get("/api/v1/tasks/bulk_api_030").json()
+    assert (task["assignee"], task["priority"], task["status"]) == ("Jane Doe", "medium", "upcoming")
+    assert client.get("/api/v1/tasks/bulk_api_031").json()["status"] == "upcoming"
+    # ...and re-filed in the indexes under its old values
+    assert "bulk_api_030" not in [t["id"] for t in client.get("/api/v1/tasks/", params={"assignee": "Ann"}).json()]
+
+
+def test_failed_background_save_is_logged(caplog):
+    future = FailingStore().save_tasks([])
+    
+    task_service._log_failed_save(future, "task_001")
+    
+    assert "Failed to persist status change for task_001: disk full" in caplog.text
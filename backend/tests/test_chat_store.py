@@ -0,0 +1,85 @@
+"""
+Chat history store tests
+"""
+import asyncio
+
+from app.models.chat import ChatMessage
+from app.services.chat_service import ChatService
+from app.services.chat_store import ChatSessionStore
+from app.services.id_generator import new_id
+
+
+def make_message(role: str = "user") -> ChatMessage:
+    return ChatMessage(id=new_id(role), role=role, content="hi", timestamp="2026-01-01T00:00:00Z")
+
+
+def test_history_pages_backwards_with_cursor():
+    store = ChatSessionStore(max_sessions=10, max_messages=100, idle_ttl=3600)
+    messages = [make_message("user" if i % 2 else "assistant") for i in range(30)]
+    for message in messages:
+        store.append("s", message)
+    
+    assert store.history("s", limit=5) == messages[25:]
+    assert store.history("s", before=messages[25].id, limit=5) == messages[20:25]
+    assert store.history("s", before=messages[2].id, limit=5) == messages[:2]
+    assert store.history("s", before=messages[0].id) == []
+
+
+def test_history_keeps_only_max_messages():
+    store = ChatSessionStore(max_sessions=10, max_messages=8, idle_ttl=3600)
+    messages = [make_message() for _ in range(23)]
+    for message in messages:
+        store.append("s", message)
+    
+    assert store.history("s") == messages[-8:]
+    # A cursor older than the retained window yields nothing rather than trimmed messages
+    assert store.history("s", before=messages[16].id) == messages[15:16]
+    assert store.history("s", before=messages[10].id) == []
+    assert store.get_stats()["messages"] == 8
+    assert len(store._sessions["s"].messages) <= 8 + 2
+
+
+def test_sessions_evicted_in_lru_order():
+    store = ChatSessionStore(max_sessions=2, max_messages=10, idle_ttl=3600)
+    store.append("a", make_message())
+    store.append("b", make_message())
+    store.history("a")
+    store.append("c", make_message())
+    
+    assert store.history("b") == []
+    assert len(store.history("a")) == 1
+    assert store.get_stats()["evicted_sessions"] == 1
+
+
+def test_idle_sessions_expire():
+    store = ChatSessionStore(max_sessions=10, max_messages=10, idle_ttl=0)
+    store.append("a", make_message())
+    
+    assert store.history("a") == []
+    assert store.get_stats()["expired_sessions"] == 1
+
+
+def test_late_append_is_stored_in_id_order():
+    store = ChatSessionStore(max_sessions=10, max_messages=10, idle_ttl=3600)
+    first, second, third = make_message("assistant"), make_message(), make_message()
+    store.append("s", second)
+    store.append("s", third)
+    store.append("s", first)
+    
+    assert store.history("s") == [first, second, third]
+    assert store.history("s", before=second.id) == [first]
+
+
+async def test_concurrent_streams_keep_history_ordered():
+    service = ChatService()
+    
+    async def consume(text):
+        return [event async for event in service.stream_message(text, "s")]
+    
+    # The long reply starts first and finishes last
+    await asyncio.gather(consume("tell me about techstart"), consume("hi"))
+    
+    history = service.get_history("s")
+    assert len(history) == 4
+    assert [m.id for m in history] == sorted((m.id for m in history), key=lambda i: i.rpartition("_")[2])
+    assert service.get_history("s", before=history[2].id) == history[:2]
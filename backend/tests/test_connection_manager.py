@@ -0,0 +1,95 @@
+"""
+WebSocket connection manager heartbeat and replay tests
+"""
+import asyncio
+import json
+
+from app.api.v1 import websocket as ws_module
+from app.api.v1.websocket import ClientConnection, ConnectionManager
+from app.services.event_log import EventLog
+
+
+class HangingSocket:
+    """Socket whose close handshake never completes"""
+    
+    def __init__(self):
+        self.closing = asyncio.Event()
+    
+    async def close(self, code: int = 1000):
+        self.closing.set()
+        await asyncio.Event().wait()
+    
+    async def send_json(self, message: dict):
+        pass
+
+
+class RecordingSocket:
+    """Socket that keeps every frame it is sent"""
+    
+    def __init__(self):
+        self.frames = []
+    
+    async def accept(self):
+        pass
+    
+    async def send_json(self, message: dict):
+        self.frames.append(message)
+    
+    async def send_text(self, text: str):
+        self.frames.append(json.loads(text))
+
+
+def seqs(frames) -> list:
+    """Event seqs carried by frames, in delivery order"""
+    events = []
+    for frame in frames:
+        events.extend(frame["events"] if frame["type"] == "batch" else [frame])
+    return [event["seq"] for event in events if "seq" in event]
+
+
+async def test_replayed_events_are_not_sent_again_by_the_flush():
+    log = EventLog(capacity=10)
+    manager = ConnectionManager(log)
+    # Published but not yet flushed when the client reconnects
+    pending = [log.append("alert", {"n": i}) for i in range(3)]
+    
+    resumed, fresh = RecordingSocket(), RecordingSocket()
+    await manager.connect(resumed, last_seq=1, boot_id=log.boot_id)
+    await manager.connect(fresh)
+    await manager.broadcast(pending)
+    await manager.broadcast([log.append("alert", {"n": 3})])
+    
+    assert seqs(resumed.frames) == [2, 3, 4]
+    # The hello told the fresh client it was at seq 3, so only seq 4 follows
+    assert fresh.frames[0]["data"]["last_seq"] == 3
+    assert seqs(fresh.frames) == [4]
+
+
+async def test_broadcast_sends_only_the_unreplayed_part_of_a_batch():
+    log = EventLog(capacity=10)
+    manager = ConnectionManager(log)
+    first = log.append("alert", {"n": 0})
+    
+    socket = RecordingSocket()
+    await manager.connect(socket, last_seq=0, boot_id=log.boot_id)
+    await manager.broadcast([first, log.append("alert", {"n": 1})])
+    
+    assert seqs(socket.frames) == [1, 2]
+
+
+async def test_heartbeat_does_not_wait_for_idle_reaps(monkeypatch):
+    monkeypatch.setattr(ws_module, "REAP_CLOSE_TIMEOUT", 0.05)
+    manager = ConnectionManager(EventLog(capacity=10))
+    socket = HangingSocket()
+    connection = ClientConnection(socket)
+    connection.last_seen -= ws_module.settings.WS_IDLE_TIMEOUT + 1
+    manager.active_connections[id(socket)] = connection
+    
+    await asyncio.wait_for(manager._heartbeat([id(socket)]), timeout=0.01)
+    await asyncio.wait_for(socket.closing.wait(), timeout=1)
+    
+    assert id(socket) not in manager.active_connections
+    assert manager.reaped_connections == 1
+    
+    # The close handshake is abandoned after REAP_CLOSE_TIMEOUT
+    await asyncio.wait_for(asyncio.gather(*manager._heartbeat_sends), timeout=1)
@@ -0,0 +1,62 @@
+"""
+Event log replay and boot ID tests
+"""
+from app.services.event_log import EventLog, parse_cursor
+
+
+def test_since_returns_events_after_cursor():
+    log = EventLog(capacity=10)
+    for i in range(5):
+        log.append("alert", {"n": i})
+    
+    events = log.since(3, log.boot_id)
+    
+    assert [e.seq for e in events] == [4, 5]
+
+
+def test_since_requires_resync_for_evicted_gap():
+    log = EventLog(capacity=3)
+    for i in range(6):
+        log.append("alert", {"n": i})
+    
+    assert log.since(1) is None
+    assert [e.seq for e in log.since(3)] == [4, 5, 6]
+
+
+def test_since_requires_resync_for_other_boot():
+    old, new = EventLog(capacity=10), EventLog(capacity=10)
+    for i in range(3):
+        old.append("alert", {"n": i})
+        new.append("alert", {"n": i})
+    
+    # Same sequence number, different server boot
+    assert new.since(1, old.boot_id) is None
+    assert len(new.since(1, new.boot_id)) == 2
+
+
+def test_sse_frame_id_carries_boot_id():
+    log = EventLog(capacity=10)
+    event = log.append("alert", {})
+    
+    assert f"id: {log.boot_id}:1\n" in event.sse_frame
+    assert parse_cursor(f"{log.boot_id}:1") == (log.boot_id, 1)
+
+
+def test_parse_cursor():
+    assert parse_cursor(None) == (None, None)
+    assert parse_cursor("42") == (None, 42)
+    assert parse_cursor("abc:7") == ("abc", 7)
+    assert parse_cursor("abc:x") == (None, None)
+
+
+def test_websocket_resume_from_other_boot_resyncs(client):
+    from app.api.v1.websocket import event_log
+    
+    with client.websocket_connect("/ws?last_seq=1&boot_id=stale") as ws:
+        hello = ws.receive_json()
+        resync = ws.receive_json()
+    
+    assert hello["type"] == "hello"
+    assert hello["data"]["boot_id"] == event_log.boot_id
+    assert resync["type"] == "resync_required"
+    assert resync["data"]["boot_id"] == event_log.boot_id
@@ -0,0 +1,102 @@
+"""
+SSE event stream tests
+"""
+import json
+
+import pytest
+from starlette.requests import Request
+
+from app.api.v1.websocket import broadcast_update, event_log
+from app.config import settings
+
+
+@pytest.fixture
+def polls(monkeypatch):
+    """End each stream after `polls.limit` loop iterations (TestClient reads the whole body)"""
+    class Polls:
+        limit = 1
+        seen = 0
+    
+    async def is_disconnected(self):
+        Polls.seen += 1
+        return Polls.seen > Polls.limit
+    
+    monkeypatch.setattr(Request, "is_disconnected", is_disconnected)
+    monkeypatch.setattr(settings, "WS_HEARTBEAT_INTERVAL", 0.01)
+    return Polls
+
+
+def publish(client, n: int):
+    """Append events on the app's own loop"""
+    for i in range(n):
+        client.portal.call(broadcast_update, "sse_test", {"n": i})
+
+
+def frames(body: str) -> list:
+    """Split a stream body into frames of {field: value}"""
+    parsed = []
+    for block in body.strip().split("\n\n"):
+        frame = {}
+        for line in block.split("\n"):
+            field, _, value = line.partition(": ")
+            frame[field] = value
+        parsed.append(frame)
+    return parsed
+
+
+def test_new_stream_starts_at_the_head_and_keeps_alive(client, polls):
+    publish(client, 2)
+    
+    response = client.get("/api/v1/events/stream")
+    
+    assert response.headers["content-type"].startswith("text/event-stream")
+    retry, hello, keep_alive = frames(response.text)
+    assert retry == {"retry": str(settings.SSE_RETRY_MS)}
+    assert json.loads(hello["data"]) == {
+        "type": "hello",
+        "data": {"boot_id": event_log.boot_id, "last_seq": event_log.last_seq},
+    }
+    # Nothing published after connecting: only a comment frame, no old events
+    assert keep_alive == {"": "keep-alive"}
+
+
+def test_last_event_id_resumes_after_cursor(client, polls):
+    publish(client, 1)
+    cursor = event_log.last_seq
+    publish(client, 2)
+    
+    # The header is newer than the last_seq in the original URL, so it wins
+    response = client.get(
+        "/api/v1/events/stream",
+        params={"last_seq": 0},
+        headers={"Last-Event-ID": f"{event_log.boot_id}:{cursor}"},
+    )
+    
+    events = frames(response.text)[2:4]
+    assert [frame["id"] for frame in events] == [f"{event_log.boot_id}:{cursor + 1}", f"{event_log.boot_id}:{cursor + 2}"]
+    assert [json.loads(frame["data"])["data"]["n"] for frame in events] == [0, 1]
+
+
+def test_cursor_from_another_boot_gets_resync(client, polls):
+    publish(client, 1)
+    
+    response = client.get("/api/v1/events/stream", headers={"Last-Event-ID": "old-boot:1"})
+    
+    resync = json.loads(frames(response.text)[2]["data"])
+    assert resync == {
+        "type": "resync_required",
+        "data": {"boot_id": event_log.boot_id, "last_seq": event_log.last_seq},
+    }
+
+
+def test_resync_continues_from_the_head(client, polls):
+    polls.limit = 2
+    publish(client, 1)
+    
+    response = client.get("/api/v1/events/stream", params={"last_seq": event_log.last_seq + 100})
+    
+    _, hello, resync, keep_alive = frames(response.text)
+    assert json.loads(hello["data"])["type"] == "hello"
+    assert json.loads(resync["data"])["type"] == "resync_required"
+    # The stream carries on from the head instead of resyncing again
+    assert keep_alive == {"": "keep-alive"}
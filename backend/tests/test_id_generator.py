@@ -0,0 +1,61 @@
+"""
+ID generator ordering tests
+"""
+import pytest
+
+from app.config import settings
+from app.services import id_generator
+from app.services.id_generator import NODE_BITS, SEQUENCE_BITS, id_sort_key, new_id
+
+_DECODE = {char: value for value, char in enumerate(id_generator._ALPHABET)}
+
+
+def decode(value: str):
+    number = 0
+    for char in id_sort_key(value):
+        number = number * 32 + _DECODE[char]
+    return number >> (SEQUENCE_BITS + NODE_BITS), (number >> NODE_BITS) & ((1 << SEQUENCE_BITS) - 1)
+
+
+def test_ids_are_unique_and_increasing():
+    ids = [new_id("x") for _ in range(50000)]
+    
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+
+
+def test_sequence_restarts_each_millisecond(monkeypatch):
+    clock = [10_000_000_000_000]
+    monkeypatch.setattr(id_generator, "_now_ms", lambda: clock[0])
+    # Restored afterwards, so later IDs follow the real clock again
+    monkeypatch.setattr(id_generator, "_last_ms", 0)
+    
+    first = [decode(new_id("x")) for _ in range(3)]
+    clock[0] += 1
+    second = decode(new_id("x"))
+    
+    assert first == [(clock[0] - 1, 0), (clock[0] - 1, 1), (clock[0] - 1, 2)]
+    assert second == (clock[0], 0)
+
+
+def test_exhausted_sequence_carries_into_next_millisecond(monkeypatch):
+    now = 20_000_000_000_000
+    monkeypatch.setattr(id_generator, "_now_ms", lambda: now)
+    monkeypatch.setattr(id_generator, "_last_ms", now)
+    monkeypatch.setattr(id_generator, "_sequence", (1 << SEQUENCE_BITS) - 2)
+    
+    ids = [new_id("x") for _ in range(3)]
+    
+    assert [decode(i) for i in ids] == [(now, (1 << SEQUENCE_BITS) - 1), (now + 1, 0), (now + 1, 1)]
+    assert ids == sorted(ids)
+
+
+def test_node_comes_from_the_worker_id():
+    number = 0
+    for char in id_sort_key(new_id("x")):
+        number = number * 32 + _DECODE[char]
+    
+    assert number & ((1 << NODE_BITS) - 1) == settings.WORKER_ID
+    assert id_generator._node_id(1023) == 1023
+    with pytest.raises(ValueError):
+        id_generator._node_id(1024)
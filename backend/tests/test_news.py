@@ -0,0 +1,143 @@
+"""
+News store, near-duplicate index and ingestion tests
+"""
+from datetime import datetime
+
+import pytest
+
+from app.models.news import NewsItem
+from app.services import news_service as news_service_module
+from app.services.news_dedup import NearDuplicateIndex
+from app.services.news_service import NewsService
+from app.services.news_store import NewsStore
+
+
+def make_item(n: int, timestamp: str, severity: str = "info", sme_id: str = "#0001", **fields) -> NewsItem:
+    values = dict(
+        id=f"news_{n:03d}",
+        timestamp=timestamp,
+        sme_id=sme_id,
+        sme_name="SME",
+        exposure="€100K",
+        type="other",
+        severity=severity,
+        title=f"Item {n}",
+        summary="",
+        signals=[],
+        recommendation="",
+    )
+    values.update(fields)
+    return NewsItem(**values)
+
+
+def ids(items):
+    return [item.id for item in items]
+
+
+def test_store_query_newest_first_with_filters():
+    store = NewsStore()
+    for n in range(10):
+        store.add(make_item(n, f"2024-11-{10 + n}T00:00:00Z", severity="critical" if n % 3 == 0 else "info"))
+    
+    assert ids(store.query(limit=3)) == ["news_009", "news_008", "news_007"]
+    assert ids(store.query(since=datetime(2024, 11, 17))) == ["news_009", "news_008"]
+    assert ids(store.query(severity="critical")) == ["news_009", "news_006", "news_003", "news_000"]
+    assert ids(store.query(severity="critical", since=datetime(2024, 11, 14))) == ["news_009", "news_006"]
+
+
+def test_store_remove_after_in_place_change_clears_old_buckets():
+    store = NewsStore()
+    item = make_item(1, "2024-11-10T00:00:00Z", severity="warning")
+    store.add(item)
+    
+    item.severity = "critical"
+    item.timestamp = "2024-11-20T00:00:00Z"
+    store.add(item)
+    
+    assert store.query(severity="warning") == []
+    assert ids(store.query(severity="critical")) == ["news_001"]
+    assert len(store._by_time) == 1
+
+
+def test_near_duplicates_are_found_within_scope_only():
+    index = NearDuplicateIndex(threshold=0.5)
+    text = "CTO departure detected at TechStart Solutions after two senior leaders left the company"
+    index.add("a", index.signature(text), scope="#0142")
+    
+    similar = index.signature("CTO departure detected at TechStart Solutions after two senior leaders left the firm")
+    unrelated = index.signature("Supplier payment delays reported for Urban Fashion over the last quarter")
+    
+    match = index.find(similar, scope="#0142")
+    assert match is not None and match[0] == "a" and match[1] >= 0.5
+    assert index.find(similar, scope="#0287") is None
+    assert index.find(unrelated, scope="#0142") is None
+    
+    index.remove("a")
+    assert index.find(similar, scope="#0142") is None
+
+
+@pytest.fixture
+def service(monkeypatch):
+    broadcasts = []
+    
+    async def record(update_type, data):
+        broadcasts.append((update_type, data))
+    
+    monkeypatch.setattr(news_service_module, "broadcast_update", record)
+    svc = NewsService()
+    svc.broadcasts = broadcasts
+    return svc
+
+
+async def test_merge_upgrades_severity_and_refiles(service):
+    original = service._news.get("news_002")
+    duplicate = make_item(
+        900,
+        "2024-11-16T12:00:00Z",
+        severity="critical",
+        sme_id=original.sme_id,
+        type=original.type,
+        title=original.title,
+        summary=original.summary,
+        signals=[{"source": "Court Records", "detail": "Winding-up petition filed"}],
+    )
+    
+    result = await service.ingest_news_item(duplicate)
+    
+    assert result.merged and result.item.id == "news_002"
+    assert result.item.severity == "critical"
+    assert {"source": "Court Records", "detail": "Winding-up petition filed"} in result.item.signals
+    
+    # Re-filed: gone from the old severity bucket, present in the new one
+    assert "news_002" not in ids(service.get_news_intelligence(severity="warning"))
+    assert "news_002" in ids(service.get_news_intelligence(severity="critical"))
+    assert service.get_news_intelligence(sme_id=original.sme_id) == [result.item]
+    
+    # Re-timestamped so since= pollers see it, and broadcast as an update
+    assert ids(service.get_news_intelligence(since=datetime(2024, 11, 17)))[0] == "news_002"
+    assert service.broadcasts == [("news_updated", result.item.dict())]
+
+
+async def test_distinct_item_is_stored_and_broadcast(service):
+    item = make_item(901, "2024-11-17T09:00:00Z", sme_id="#0142", title="Office lease renewed", summary="Ten year lease signed")
+    
+    result = await service.ingest_news_item(item)
+    
+    assert not result.merged
+    assert service.get_news_intelligence(limit=1) == [item]
+    assert service.broadcasts == [("news_created", item.dict())]
+
+
+async def test_items_without_words_are_never_merged(service):
+    index = NearDuplicateIndex()
+    assert index.signature("") is None
+    assert index.signature("  -- ") is None
+    
+    first = make_item(902, "2024-11-17T09:00:00Z", sme_id="#0142", title="", summary="")
+    second = make_item(903, "2024-11-17T10:00:00Z", sme_id="#0142", title=" ", summary="...")
+    
+    results = [await service.ingest_news_item(item) for item in (first, second)]
+    
+    assert [r.merged for r in results] == [False, False]
+    assert {"news_902", "news_903"} <= set(ids(service.get_news_intelligence(sme_id="#0142")))
+    assert "news_902" not in service._dedup._signatures
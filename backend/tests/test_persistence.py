@@ -0,0 +1,128 @@
+"""
+SQLite group commit and bulk task persistence tests
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.models.task import Task, TaskUpdate
+from app.services import persistence, task_service as task_service_module
+from app.services.persistence import PersistenceError, SQLiteStore
+from app.services.task_service import TaskService
+
+
+def make_task(n: int) -> Task:
+    now = datetime(2026, 1, 1)
+    return Task(
+        id=f"bulk_{n:05d}",
+        title=f"Task {n}",
+        sme_id="#0001",
+        sme_name="SME 1",
+        exposure="€100K",
+        assignee="Jane Doe",
+        priority="low",
+        due_date=(now + timedelta(days=n % 30)).isoformat() + "Z",
+        status="upcoming",
+        description="",
+        source="test",
+        created_at=now.isoformat() + "Z",
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    db = SQLiteStore(str(tmp_path / "test.db"), commit_interval_ms=20, max_batch=1000)
+    yield db
+    db.close()
+
+
+def test_bulk_save_larger_than_max_batch_is_one_transaction(store):
+    rows = [(f"t{i}", "{}") for i in range(2500)]
+    
+    store.save_tasks(rows).result(timeout=5)
+    
+    assert store.commits == 1
+    assert len(store.load_tasks()) == 2500
+
+
+def test_units_are_never_split_across_commits(store, monkeypatch):
+    committed = []
+    apply = store._apply
+    
+    def record(writes):
+        apply(writes)
+        committed.append(len(writes))
+    
+    monkeypatch.setattr(store, "_apply", record)
+    futures = [store.save_tasks([(f"u{u}_{i}", "{}") for i in range(400)]) for u in range(6)]
+    for future in futures:
+        future.result(timeout=5)
+    
+    assert sum(committed) == 2400
+    assert all(size % 400 == 0 and size <= 1000 for size in committed)
+
+
+def test_commit_failure_is_reported_to_the_failing_unit_only(store):
+    good = store.save_tasks([("a", "{}"), ("b", "{}")])
+    bad = store.save_tasks([("c", "{}"), ("d", None)])
+    after = store.save_task("e", "{}")
+    
+    good.result(timeout=5)
+    after.result(timeout=5)
+    with pytest.raises(PersistenceError):
+        bad.result(timeout=5)
+    
+    # The failing unit left nothing behind
+    assert sorted(store.load_tasks()) == ["{}"] * 3
+    assert store.failed_writes == 2
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    async def no_broadcast(update_type, data):
+        pass
+    
+    monkeypatch.setattr(task_service_module, "broadcast_update", no_broadcast)
+    monkeypatch.setattr(persistence.settings, "DATABASE_PATH", str(tmp_path / "tasks.db"))
+    monkeypatch.setattr(persistence, "_store", None)
+    
+    svc = TaskService()
+    svc.open()
+    yield svc
+    persistence.close_store()
+
+
+async def test_bulk_operations_are_durable(service):
+    seeded = len(service.get_all_tasks())
+    tasks = [make_task(n) for n in range(1500)]
+    
+    created, errors = await service.bulk_create_tasks(tasks)
+    assert (len(created), errors) == (1500, [])
+    
+    await service.bulk_update_tasks([TaskUpdate(id="bulk_00000", updates={"assignee": "Ann"})])
+    await service.bulk_complete_tasks(["bulk_00001"])
+    
+    stored = {t.id: t for t in map(Task.model_validate_json, persistence.get_store().load_tasks())}
+    assert len(stored) == seeded + 1500
+    assert stored["bulk_00000"].assignee == "Ann"
+    assert stored["bulk_00001"].status == "completed"
+
+
+async def test_bulk_create_rejects_conflicts_without_writing(service):
+    before = persistence.get_store().writes
+    
+    created, errors = await service.bulk_create_tasks([make_task(1), make_task(1)])
+    
+    assert created == [] and len(errors) == 1
+    assert persistence.get_store().writes == before
+
+
+def test_bulk_api_creates_tasks(client):
+    tasks = [make_task(n).model_dump() for n in range(100, 110)]
+    
+    created = client.post("/api/v1/tasks/bulk", json={"tasks": tasks})
+    again = client.post("/api/v1/tasks/bulk", json={"tasks": tasks[:1]})
+    
+    assert created.status_code == 200 and len(created.json()) == 10
+    assert again.status_code == 422
+    assert client.get("/api/v1/tasks/bulk_00105").status_code == 200
@@ -0,0 +1,111 @@
+"""
+Segmented activity log tests
+"""
+import os
+
+import pytest
+
+from app.services.segment_log import SegmentedLog
+
+
+def fill(log: SegmentedLog, seqs):
+    for seq in seqs:
+        log.append(seq, f"record {seq}")
+
+
+def test_read_across_segments(tmp_path):
+    log = SegmentedLog(str(tmp_path), segment_bytes=200, index_interval=4)
+    fill(log, range(1, 101))
+    
+    assert len(log._segments) > 5
+    assert log.read(37, 5) == [(seq, f"record {seq}") for seq in range(37, 42)]
+    assert [seq for seq, _ in log.read(95, 100)] == list(range(95, 101))
+    assert log.tail(3) == [(seq, f"record {seq}") for seq in (98, 99, 100)]
+    log.close()
+
+
+def test_reads_skip_gaps(tmp_path):
+    log = SegmentedLog(str(tmp_path), segment_bytes=100, index_interval=2)
+    fill(log, range(10, 200, 10))
+    
+    assert [seq for seq, _ in log.read(25, 3)] == [30, 40, 50]
+    assert [seq for seq, _ in log.tail(2)] == [180, 190]
+    log.close()
+
+
+def test_reopen_recovers_torn_tail(tmp_path):
+    log = SegmentedLog(str(tmp_path), segment_bytes=10_000, index_interval=4)
+    fill(log, range(1, 21))
+    log.close()
+    
+    # Crash mid-write: half a record at the end of the newest segment
+    newest = sorted(name for name in os.listdir(tmp_path) if name.endswith(".log"))[-1]
+    with open(tmp_path / newest, "ab") as f:
+        f.write(b"21\tpart")
+    
+    reopened = SegmentedLog(str(tmp_path), segment_bytes=10_000, index_interval=4)
+    assert reopened.last_seq == 20
+    
+    fill(reopened, [21, 22])
+    assert reopened.read(19, 10) == [(seq, f"record {seq}") for seq in (19, 20, 21, 22)]
+    reopened.close()
+
+
+def test_line_without_separator_is_a_torn_tail(tmp_path):
+    log = SegmentedLog(str(tmp_path), segment_bytes=10_000, index_interval=4)
+    fill(log, range(1, 11))
+    log.close()
+    
+    newest = sorted(name for name in os.listdir(tmp_path) if name.endswith(".log"))[-1]
+    with open(tmp_path / newest, "ab") as f:
+        f.write(b"11\n")
+    
+    reopened = SegmentedLog(str(tmp_path), segment_bytes=10_000, index_interval=4)
+    assert reopened.last_seq == 10
+    assert [seq for seq, _ in reopened.read(9, 10)] == [9, 10]
+    reopened.close()
+
+
+def test_append_rejects_old_seq(tmp_path):
+    log = SegmentedLog(str(tmp_path))
+    fill(log, [5])
+    
+    with pytest.raises(ValueError):
+        log.append(5, "again")
+    log.close()
+
+
+def test_fsync_on_roll_and_interval(tmp_path):
+    lazy = SegmentedLog(str(tmp_path / "lazy"), segment_bytes=100, fsync_interval_ms=60_000)
+    fill(lazy, range(1, 31))
+    segments = len(lazy._segments)
+    # One sync each time a full segment is sealed
+    assert lazy.syncs == segments - 1
+    lazy.close()
+    assert lazy.syncs == segments
+    
+    eager = SegmentedLog(str(tmp_path / "eager"), segment_bytes=10_000, fsync_interval_ms=0)
+    fill(eager, range(1, 11))
+    assert eager.syncs == 10
+    eager.close()
+
+
+def test_activity_service_opens_its_log_at_startup(tmp_path, monkeypatch):
+    from app.config import settings
+    from app.services.activity_service import ActivityService
+    
+    directory = tmp_path / "activity_log"
+    monkeypatch.setattr(settings, "ACTIVITY_LOG_DIR", str(directory))
+    monkeypatch.setattr(settings, "ACTIVITY_FSYNC_INTERVAL_MS", 60_000)
+    
+    service = ActivityService()
+    assert not directory.exists()
+    
+    service.open()
+    service.log_activity("info", "hello")
+    # Buffered until the fsync interval or a read, not flushed per append
+    log_files = [directory / name for name in os.listdir(directory) if name.endswith(".log")]
+    assert sum(os.path.getsize(path) for path in log_files) == 0
+    
+    service.close()
+    assert sum(os.path.getsize(path) for path in log_files) > 0
@@ -0,0 +1,121 @@
+"""
+Task status scheduler tests
+"""
+from datetime import datetime, timedelta
+
+from app.models.task import Task
+from app.services.task_scheduler import TaskStatusScheduler, next_boundary, status_for
+from app.services.task_store import TaskStore
+
+DUE = datetime(2026, 5, 10, 15, 30)
+MIDNIGHT = datetime(2026, 5, 10)
+
+
+def make_task(task_id: str, due: datetime, status: str) -> Task:
+    return Task(
+        id=task_id,
+        title="t",
+        sme_id="#0001",
+        sme_name="SME",
+        exposure="€1K",
+        assignee="Jane Doe",
+        priority="low",
+        due_date=due.isoformat() + "Z",
+        status=status,
+        description="",
+        source="test",
+        created_at=MIDNIGHT.isoformat() + "Z",
+    )
+
+
+def test_status_for_utc_day_boundaries():
+    assert status_for(DUE, MIDNIGHT - timedelta(microseconds=1)) == "upcoming"
+    assert status_for(DUE, MIDNIGHT) == "due_today"
+    assert status_for(DUE, MIDNIGHT + timedelta(days=1, microseconds=-1)) == "due_today"
+    assert status_for(DUE, MIDNIGHT + timedelta(days=1)) == "overdue"
+
+
+def test_next_boundary():
+    assert next_boundary(DUE, MIDNIGHT - timedelta(hours=5)) == MIDNIGHT
+    assert next_boundary(DUE, MIDNIGHT) == MIDNIGHT + timedelta(days=1)
+    assert next_boundary(DUE, DUE) == MIDNIGHT + timedelta(days=1)
+    assert next_boundary(DUE, MIDNIGHT + timedelta(days=1)) is None
+
+
+def make_scheduler(*tasks):
+    store = TaskStore()
+    store.add_many(list(tasks))
+    scheduler = TaskStatusScheduler(store)
+    return store, scheduler
+
+
+def test_advance_walks_upcoming_to_overdue():
+    task = make_task("a", DUE, "upcoming")
+    store, scheduler = make_scheduler(task)
+    scheduler.track(task, now=MIDNIGHT - timedelta(days=1))
+    
+    assert scheduler.advance(MIDNIGHT - timedelta(seconds=1)) == []
+    assert scheduler.advance(MIDNIGHT) == [(task, "upcoming")]
+    assert store.get("a").status == "due_today"
+    assert scheduler.advance(MIDNIGHT + timedelta(days=1)) == [(task, "due_today")]
+    assert store.get("a").status == "overdue"
+    
+    # Overdue is final, so nothing is left to track
+    assert len(scheduler) == 0
+
+
+def test_stale_status_is_fixed_on_next_advance():
+    task = make_task("a", DUE, "upcoming")
+    store, scheduler = make_scheduler(task)
+    scheduler.track(task, now=MIDNIGHT + timedelta(days=2))
+    
+    assert scheduler.advance(MIDNIGHT + timedelta(days=2)) == [(task, "upcoming")]
+    assert task.status == "overdue"
+
+
+def test_untracked_entry_is_skipped():
+    task = make_task("a", DUE, "upcoming")
+    store, scheduler = make_scheduler(task)
+    scheduler.track(task, now=MIDNIGHT - timedelta(days=1))
+    scheduler.untrack("a")
+    
+    assert scheduler.advance(MIDNIGHT + timedelta(days=3)) == []
+    assert store.get("a").status == "upcoming"
+
+
+def test_completed_tasks_are_not_tracked():
+    task = make_task("a", DUE, "completed")
+    _, scheduler = make_scheduler(task)
+    scheduler.track(task, now=MIDNIGHT - timedelta(days=1))
+    
+    assert len(scheduler) == 0
+    assert scheduler.advance(MIDNIGHT + timedelta(days=3)) == []
+
+
+def test_unchanged_retrack_does_not_grow_heap():
+    task = make_task("a", DUE, "upcoming")
+    _, scheduler = make_scheduler(task)
+    now = MIDNIGHT - timedelta(days=1)
+    
+    for _ in range(1000):
+        scheduler.track(task, now=now)
+    assert len(scheduler._heap) == 1
+
+
+def test_stale_entries_are_compacted():
+    tasks = [make_task(f"t{i}", DUE + timedelta(days=i % 5), "upcoming") for i in range(10)]
+    store, scheduler = make_scheduler(*tasks)
+    now = MIDNIGHT - timedelta(days=1)
+    
+    # Every edit moves the due date, so each re-track retires an entry
+    for round_ in range(200):
+        for task in tasks:
+            store.update(task.id, {"due_date": (DUE + timedelta(days=round_ % 7)).isoformat() + "Z"})
+            scheduler.track(task, now=now)
+    
+    assert len(scheduler) == 10
+    assert len(scheduler._heap) <= 2 * 10 + 64 + 1
+    
+    # Only live entries fire
+    transitions = scheduler.advance(MIDNIGHT + timedelta(days=30))
+    assert sorted(task.id for task, _ in transitions) == sorted(task.id for task in tasks)
@@ -0,0 +1,119 @@
+"""
+Task store index tests
+"""
+from datetime import datetime, timedelta
+
+from app.models.task import Task
+from app.services.task_store import TaskStore
+
+BASE = datetime(2026, 1, 1)
+
+
+def make_task(n: int, days: int, status: str = "upcoming", assignee: str = "Jane Doe") -> Task:
+    return Task(
+        id=f"t{n:03d}",
+        title=f"Task {n}",
+        sme_id=f"#{n % 3:04d}",
+        sme_name=f"SME {n % 3}",
+        exposure="€100K",
+        assignee=assignee,
+        priority="low",
+        due_date=(BASE + timedelta(days=days)).isoformat() + "Z",
+        status=status,
+        description="",
+        source="test",
+        created_at=BASE.isoformat() + "Z",
+    )
+
+
+def ids(tasks):
+    return [t.id for t in tasks]
+
+
+def test_add_many_replacing_existing_tasks_keeps_indexes_consistent():
+    store = TaskStore()
+    store.add_many([make_task(n, days=n) for n in range(10)])
+    
+    # Move existing tasks around the due order in one batch, plus a new one
+    store.add_many([make_task(8, days=-5), make_task(2, days=20), make_task(10, days=3)])
+    
+    assert len(store) == 11
+    assert ids(store.all()) == ["t008", "t000", "t001", "t003", "t010", "t004", "t005", "t006", "t007", "t009", "t002"]
+    assert len(store._by_due) == 11
+    
+    # Replaced entries can still be removed through the index
+    store.remove("t002")
+    store.remove("t008")
+    assert ids(store.all())[0] == "t000"
+    assert len(store._by_due) == 9
+
+
+def test_add_many_repeated_id_last_wins():
+    store = TaskStore()
+    store.add_many([make_task(1, days=5), make_task(1, days=1, status="overdue")])
+    
+    assert len(store._by_due) == 1
+    tasks, total = store.query(status="overdue")
+    assert (ids(tasks), total) == (["t001"], 1)
+
+
+def test_query_due_range_and_pagination():
+    store = TaskStore()
+    store.add_many([make_task(n, days=n) for n in range(20)])
+    
+    tasks, total = store.query(due_after=BASE + timedelta(days=5), due_before=BASE + timedelta(days=9))
+    assert (ids(tasks), total) == (["t005", "t006", "t007", "t008", "t009"], 5)
+    
+    tasks, total = store.query(due_after=BASE + timedelta(days=5), offset=2, limit=3)
+    assert (ids(tasks), total) == (["t007", "t008", "t009"], 15)
+
+
+def test_query_filters_with_due_range():
+    store = TaskStore()
+    store.add_many([
+        make_task(n, days=n, assignee="Ann" if n % 2 else "Bob")
+        for n in range(20)
+    ])
+    
+    tasks, total = store.query(assignee="Ann", due_before=BASE + timedelta(days=9), limit=2)
+    assert (ids(tasks), total) == (["t001", "t003"], 5)
+    
+    tasks, total = store.query(assignee="Bob", sme_id="#0000", offset=1)
+    assert (ids(tasks), total) == (["t006", "t012", "t018"], 4)
+
+
+def test_update_refiles_task():
+    store = TaskStore()
+    store.add_many([make_task(n, days=n) for n in range(5)])
+    
+    store.update("t000", {"status": "completed", "due_date": (BASE + timedelta(days=10)).isoformat()})
+    
+    assert ids(store.all())[-1] == "t000"
+    assert ids(store.query(status="completed")[0]) == ["t000"]
+    assert store.query(status="upcoming")[1] == 4
+
+
+def test_tasks_api_pagination_sets_total_count(client):
+    everything = client.get("/api/v1/tasks/")
+    page = client.get("/api/v1/tasks/", params={"offset": 1, "limit": 2})
+    upcoming = client.get("/api/v1/tasks/", params={"status": "upcoming", "limit": 1})
+    
+    total = int(everything.headers["X-Total-Count"])
+    assert total == len(everything.json())
+    assert page.headers["X-Total-Count"] == str(total)
+    assert [t["id"] for t in page.json()] == [t["id"] for t in everything.json()[1:3]]
+    assert len(upcoming.json()) == 1
+    assert int(upcoming.headers["X-Total-Count"]) == sum(t["status"] == "upcoming" for t in everything.json())
+
+
+def test_tasks_api_due_range(client):
+    everything = client.get("/api/v1/tasks/").json()
+    cutoff = everything[len(everything) // 2]["due_date"]
+    
+    later = client.get("/api/v1/tasks/", params={"due_after": cutoff})
+    none = client.get("/api/v1/tasks/", params={"due_after": "2999-01-01T00:00:00Z"})
+    
+    # Inclusive bound: tasks tied with the cutoff are returned too
+    assert later.json() == [t for t in everything if t["due_date"] >= cutoff]
+    assert later.headers["X-Total-Count"] == str(len(later.json()))
+    assert (none.json(), none.headers["X-Total-Count"]) == ([], "0")
@@ -1,5 +1,6 @@
 import axios from 'axios';
 import { API_BASE_URL } from '@/utils/constants';
+import { getChatSessionId } from '@/utils/session';
 import type {
   PortfolioMetrics,
   SME,
@@ -52,13 +53,18 @@ export const portfolioAPI = {
 
 // News & Events API
 export const newsAPI = {
-  getPredictedEvents: async (): Promise<PredictedEvent[]> => {
-    const { data } = await api.get('/api/v1/news/predicted-events');
+  getPredictedEvents: async (days?: number): Promise<PredictedEvent[]> => {
+    const { data } = await api.get('/api/v1/news/predicted-events', { params: { days } });
     return data;
   },
 
-  getNewsIntelligence: async (): Promise<NewsItem[]> => {
-    const { data } = await api.get('/api/v1/news/intelligence');
+  getNewsIntelligence: async (params?: {
+    since?: string;
+    severity?: 'critical' | 'warning' | 'info';
+    sme_id?: string;
+    limit?: number;
+  }): Promise<NewsItem[]> => {
+    const { data } = await api.get('/api/v1/news/intelligence', { params });
     return data;
   },
 };
@@ -114,21 +120,70 @@ export const scenariosAPI = {
 
 // Activities API
 export const activitiesAPI = {
-  getActivities: async (): Promise<Activity[]> => {
-    const { data } = await api.get('/api/v1/activities');
+  getActivities: async (since?: number, limit?: number): Promise<Activity[]> => {
+    const { data } = await api.get('/api/v1/activities', { params: { since, limit } });
     return data;
   },
 };
 
 // Chat API
 export const chatAPI = {
-  sendMessage: async (message: string): Promise<ChatMessage> => {
-    const { data } = await api.post('/api/v1/chat/message', { message });
-    return data;
-  },
-
-  getHistory: async (): Promise<ChatMessage[]> => {
-    const { data } = await api.get('/api/v1/chat/history');
+  sendMessage: async (message: string, sessionId = getChatSessionId()): Promise<ChatMessage> => {
+    const { data } = await api.post('/api/v1/chat/message', { message, session_id: sessionId });
+    return data;
+  },
+
+  // Streams the reply over SSE; onDelta fires per chunk, resolves with the final message
+  streamMessage: async (
+    message: string,
+    onDelta: (delta: string) => void,
+    sessionId = getChatSessionId()
+  ): Promise<ChatMessage> => {
+    const response = await fetch(`${API_BASE_URL}/api/v1/chat/stream`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ message, session_id: sessionId }),
+    });
+    if (!response.ok || !response.body) {
+      throw new Error(`Chat stream failed: ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let final: ChatMessage | null = null;
+
+    for (;;) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let boundary = buffer.indexOf('\n\n');
+      while (boundary >= 0) {
+        const frame = buffer.slice(0, boundary);
+        buffer = buffer.slice(boundary + 2);
+        boundary = buffer.indexOf('\n\n');
+
+        if (!frame.startsWith('data: ')) continue;
+        const event = JSON.parse(frame.slice(6));
+        if (event.type === 'message_delta') {
+          onDelta(event.data.delta);
+        } else if (event.type === 'message_end') {
+          final = event.data;
+        }
+      }
+    }
+
+    if (!final) {
+      throw new Error('Chat stream ended without a final message');
+    }
+    return final;
+  },
+
+  getHistory: async (sessionId = getChatSessionId(), before?: string, limit?: number): Promise<ChatMessage[]> => {
+    const { data } = await api.get('/api/v1/chat/history', {
+      params: { session_id: sessionId, before, limit },
+    });
     return data;
   },
 };
@@ -135,6 +135,7 @@ export interface Activity {
   timestamp: string;
   type: 'alert' | 'info' | 'success' | 'warning';
   message: string;
+  seq?: number;
 }
 
 // Chat Types
@@ -1,13 +1,16 @@
-import { WS_URL } from '@/utils/constants';
+import { API_BASE_URL, WS_URL } from '@/utils/constants';
 
 type MessageHandler = (data: any) => void;
 
 class WebSocketService {
   private ws: WebSocket | null = null;
+  private eventSource: EventSource | null = null;
   private reconnectAttempts = 0;
   private maxReconnectAttempts = 5;
   private reconnectDelay = 3000;
   private handlers: Map<string, MessageHandler[]> = new Map();
+  private lastSeq = 0;
+  private bootId: string | null = null;
 
   connect() {
     if (this.ws?.readyState === WebSocket.OPEN) {
@@ -15,21 +18,15 @@ class WebSocketService {
     }
 
     try {
-      this.ws = new WebSocket(WS_URL);
+      // Resume from the last seen event so the server only replays the gap
+      this.ws = new WebSocket(`${WS_URL}${this.resumeQuery()}`);
 
       this.ws.onopen = () => {
         console.log('WebSocket connected');
         this.reconnectAttempts = 0;
       };
 
-      this.ws.onmessage = (event) => {
-        try {
-          const message = JSON.parse(event.data);
-          this.handleMessage(message);
-        } catch (error) {
-          console.error('Failed to parse WebSocket message:', error);
-        }
-      };
+      this.ws.onmessage = (event) => this.handleRaw(event.data);
 
       this.ws.onerror = (error) => {
         console.error('WebSocket error:', error);
@@ -50,6 +47,37 @@ class WebSocketService {
       this.reconnectAttempts++;
       console.log(`Attempting to reconnect... (${this.reconnectAttempts}/${this.maxReconnectAttempts})`);
       setTimeout(() => this.connect(), this.reconnectDelay);
+    } else {
+      this.connectEventSource();
+    }
+  }
+
+  private connectEventSource() {
+    if (this.eventSource) {
+      return;
+    }
+
+    // WebSockets are blocked (e.g. by a proxy); follow the same event stream over SSE.
+    // EventSource reconnects by itself and resumes via Last-Event-ID.
+    console.log('WebSocket unavailable, falling back to Server-Sent Events');
+    // Only resume from a real cursor; a fresh client starts at the live edge, not the whole ring
+    this.eventSource = new EventSource(`${API_BASE_URL}/api/v1/events/stream${this.resumeQuery()}`);
+    this.eventSource.onmessage = (event) => this.handleRaw(event.data);
+  }
+
+  private resumeQuery(): string {
+    // A cursor only means something to the server boot that issued it
+    if (this.lastSeq <= 0 || !this.bootId) {
+      return '';
+    }
+    return `?last_seq=${this.lastSeq}&boot_id=${encodeURIComponent(this.bootId)}`;
+  }
+
+  private handleRaw(raw: string) {
+    try {
+      this.handleMessage(JSON.parse(raw));
+    } catch (error) {
+      console.error('Failed to parse real-time message:', error);
     }
   }
 
@@ -58,6 +86,10 @@ class WebSocketService {
       this.ws.close();
       this.ws = null;
     }
+    if (this.eventSource) {
+      this.eventSource.close();
+      this.eventSource = null;
+    }
   }
 
   send(type: string, data: any) {
@@ -85,7 +117,44 @@ class WebSocketService {
     }
   }
 
-  private handleMessage(message: { type: string; data: any }) {
+  private handleMessage(message: { type: string; data: any; seq?: number; events?: any[] }) {
+    if (message.type === 'batch') {
+      // Events coalesced by the server's flush window, in publish order
+      message.events!.forEach(event => this.handleMessage(event));
+      return;
+    }
+
+    if (message.type === 'hello') {
+      // A different boot ID means the server restarted and its sequence numbers started over
+      if (this.bootId !== null && this.bootId !== message.data.boot_id) {
+        this.lastSeq = 0;
+      }
+      this.bootId = message.data.boot_id;
+      return;
+    }
+
+    if (message.seq !== undefined) {
+      // Drop duplicates delivered both live and by replay
+      if (message.seq <= this.lastSeq) {
+        return;
+      }
+      this.lastSeq = message.seq;
+    }
+
+    if (message.type === 'ping') {
+      // Server heartbeat; replying keeps the connection from being reaped
+      if (this.ws?.readyState === WebSocket.OPEN) {
+        this.send('pong', null);
+      }
+      return;
+    }
+
+    if (message.type === 'resync_required') {
+      // Gap is older than the server's replay buffer; listeners reload via REST
+      this.lastSeq = message.data.last_seq;
+      this.bootId = message.data.boot_id;
+    }
+
     const handlers = this.handlers.get(message.type);
     if (handlers) {
       handlers.forEach(handler => handler(message.data));
@@ -0,0 +1,11 @@
+const CHAT_SESSION_KEY = 'foresight.chatSessionId';
+
+// One chat session per browser profile, so analysts don't share history
+export const getChatSessionId = (): string => {
+  let sessionId = localStorage.getItem(CHAT_SESSION_KEY);
+  if (!sessionId) {
+    sessionId = crypto.randomUUID();
+    localStorage.setItem(CHAT_SESSION_KEY, sessionId);
+  }
+  return sessionId;
+};
@@ -7,17 +7,75 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import all MCP servers
-from mcp_servers.data_sources.linkedin_server import mcp as linkedin_mcp
-from mcp_servers.data_sources.companies_house_server import mcp as companies_house_mcp
-from mcp_servers.data_sources.google_analytics_server import mcp as analytics_mcp
-from mcp_servers.data_sources.news_intelligence_server import mcp as news_mcp
-from mcp_servers.storage.bigquery_server import mcp as bigquery_mcp
-from mcp_servers.storage.vertex_ai_server import mcp as vertex_ai_mcp
+from mcp_servers.data_sources import (
+    linkedin_server,
+    companies_house_server,
+    google_analytics_server,
+    news_intelligence_server,
+)
+from mcp_servers.storage import bigquery_server, vertex_ai_server
+from mcp_servers.shared.rpc import RPCDispatcher, create_rpc_router
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# (name, description, module, tools) for every MCP server exposed over /rpc
+SERVERS = [
+    (
+        "linkedin_server",
+        "Employee data and company activity",
+        linkedin_server,
+        ["get_employee_count", "get_recent_departures", "get_job_postings"],
+    ),
+    (
+        "companies_house_server",
+        "UK company filings and directors",
+        companies_house_server,
+        ["get_company_info", "get_directors", "get_filing_history", "check_insolvency"],
+    ),
+    (
+        "google_analytics_server",
+        "Website traffic and engagement",
+        google_analytics_server,
+        ["get_traffic_metrics", "get_conversion_metrics", "get_traffic_sources"],
+    ),
+    (
+        "news_intelligence_server",
+        "News and sentiment analysis",
+        news_intelligence_server,
+        ["get_sme_news", "get_sentiment_analysis"],
+    ),
+    (
+        "bigquery_server",
+        "Portfolio data warehouse",
+        bigquery_server,
+        [
+            "get_sme_data",
+            "get_portfolio_metrics",
+            "filter_smes_by_criteria",
+            "get_sme_financials",
+            "get_peer_comparison"
+        ],
+    ),
+    (
+        "vertex_ai_server",
+        "ML model inference",
+        vertex_ai_server,
+        [
+            "predict_risk_score",
+            "get_risk_drivers",
+            "predict_default_probability",
+            "batch_score_portfolio",
+            "batch_predict_scenario_impact"
+        ],
+    ),
+]
+
+dispatcher = RPCDispatcher()
+for _name, _, _module, _tools in SERVERS:
+    dispatcher.register(_name, _module, _tools)
+
 # Create main FastAPI app
 app = FastAPI(
     title="Foresight AI MCP Servers",
@@ -34,31 +92,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# JSON-RPC tool calls (single or batch) for the agents
+app.include_router(create_rpc_router(dispatcher))
+
 # Mount all MCP servers
 logger.info("Mounting MCP servers...")
 
 # LinkedIn server
-app.mount("/linkedin", linkedin_mcp.app)
+app.mount("/linkedin", linkedin_server.mcp.app)
 logger.info("✓ LinkedIn MCP Server mounted at /linkedin")
 
 # Companies House server
-app.mount("/companies-house", companies_house_mcp.app)
+app.mount("/companies-house", companies_house_server.mcp.app)
 logger.info("✓ Companies House MCP Server mounted at /companies-house")
 
 # Google Analytics server
-app.mount("/google-analytics", analytics_mcp.app)
+app.mount("/google-analytics", google_analytics_server.mcp.app)
 logger.info("✓ Google Analytics MCP Server mounted at /google-analytics")
 
 # News Intelligence server
-app.mount("/news-intelligence", news_mcp.app)
+app.mount("/news-intelligence", news_intelligence_server.mcp.app)
 logger.info("✓ News Intelligence MCP Server mounted at /news-intelligence")
 
 # BigQuery server
-app.mount("/bigquery", bigquery_mcp.app)
+app.mount("/bigquery", bigquery_server.mcp.app)
 logger.info("✓ BigQuery MCP Server mounted at /bigquery")
 
 # Vertex AI server
-app.mount("/vertex-ai", vertex_ai_mcp.app)
+app.mount("/vertex-ai", vertex_ai_server.mcp.app)
 logger.info("✓ Vertex AI MCP Server mounted at /vertex-ai")
 
 
@@ -90,47 +151,8 @@ async def list_servers():
     """List all available MCP servers"""
     return {
         "servers": [
-            {
-                "name": "linkedin_server",
-                "description": "Employee data and company activity",
-                "tools": ["get_employee_count", "get_recent_departures", "get_job_postings"]
-            },
-            {
-                "name": "companies_house_server",
-                "description": "UK company filings and directors",
-                "tools": ["get_company_info", "get_directors", "get_filing_history", "check_insolvency"]
-            },
-            {
-                "name": "google_analytics_server",
-                "description": "Website traffic and engagement",
-                "tools": ["get_traffic_metrics", "get_conversion_metrics", "get_traffic_sources"]
-            },
-            {
-                "name": "news_intelligence_server",
-                "description": "News and sentiment analysis",
-                "tools": ["get_sme_news", "get_sentiment_analysis"]
-            },
-            {
-                "name": "bigquery_server",
-                "description": "Portfolio data warehouse",
-                "tools": [
-                    "get_sme_data",
-                    "get_portfolio_metrics",
-                    "filter_smes_by_criteria",
-                    "get_sme_financials",
-                    "get_peer_comparison"
-                ]
-            },
-            {
-                "name": "vertex_ai_server",
-                "description": "ML model inference",
-                "tools": [
-                    "predict_risk_score",
-                    "get_risk_drivers",
-                    "predict_default_probability",
-                    "batch_score_portfolio"
-                ]
-            }
+            {"name": name, "description": description, "tools": tools}
+            for name, description, _, tools in SERVERS
         ]
     }
 
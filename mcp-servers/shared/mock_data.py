@@ -15,6 +15,7 @@ class MockDataGenerator:
     
     def __init__(self):
         self.smes = self._generate_smes()
+        self._by_id = {s["id"]: s for s in self.smes}
     
     def _generate_smes(self) -> List[Dict[str, Any]]:
         """Generate mock SME data"""
@@ -113,8 +114,7 @@ class MockDataGenerator:
     
     def get_sme_by_id(self, sme_id: str) -> Dict[str, Any]:
         """Get SME by ID"""
-        sme_id = sme_id.replace("#", "")
-        return next((s for s in self.smes if s["id"] == sme_id), None)
+        return self._by_id.get(sme_id.replace("#", ""))
     
     def get_all_smes(self) -> List[Dict[str, Any]]:
         """Get all SMEs"""
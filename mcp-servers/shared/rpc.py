@@ -0,0 +1,119 @@
+"""
+JSON-RPC 2.0 dispatcher for MCP tools
+Handles single requests and batch arrays over one HTTP endpoint
+"""
+import asyncio
+import inspect
+import json
+import logging
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import APIRouter, Header, Request, Response
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+# Implementation-defined server error range (-32000 to -32099)
+TIMEOUT_ERROR = -32000
+
+
+def _error(request_id: Any, code: int, message: str) -> Dict[str, Any]:
+    """JSON-RPC error response"""
+    return {"jsonrpc": "2.0", "error": {"code": code, "message": message}, "id": request_id}
+
+
+class RPCDispatcher:
+    """
+    Routes "server_name/tool_name" methods to MCP tool functions
+    
+    A batch (JSON array) is executed concurrently with asyncio.gather and
+    answered with one array whose entries carry the request IDs, so the
+    caller pays a single round-trip for many tool calls. With a per-call
+    timeout, a slow tool is answered with a timeout error and the rest of
+    the batch still returns, so one stuck source can't hold up the others.
+    """
+    
+    def __init__(self):
+        self._tools: Dict[str, Callable[..., Awaitable[Any]]] = {}
+    
+    def register(self, server_name: str, module: ModuleType, tools: List[str]):
+        """Expose the named tool functions of an MCP server module"""
+        for tool in tools:
+            self._tools[f"{server_name}/{tool}"] = getattr(module, tool)
+    
+    async def handle(self, payload: Any, timeout: Optional[float] = None) -> Optional[Any]:
+        """Answer a decoded request body (None when nothing needs a reply)"""
+        if isinstance(payload, list):
+            if not payload:
+                return _error(None, INVALID_REQUEST, "Empty batch")
+            responses = await asyncio.gather(*[self._call(request, timeout) for request in payload])
+            # Notifications (no id) get no entry; an all-notification batch gets no body
+            return [response for response in responses if response is not None] or None
+        
+        return await self._call(payload, timeout)
+    
+    async def _call(self, request: Any, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Execute one request object"""
+        if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or not isinstance(request.get("method"), str):
+            return _error(request.get("id") if isinstance(request, dict) else None, INVALID_REQUEST, "Invalid request")
+        
+        request_id = request.get("id")
+        is_notification = "id" not in request
+        
+        tool = self._tools.get(request["method"])
+        if tool is None:
+            return None if is_notification else _error(request_id, METHOD_NOT_FOUND, f"Method not found: {request['method']}")
+        
+        params = request.get("params") or {}
+        try:
+            if isinstance(params, dict):
+                bound = inspect.signature(tool).bind(**params)
+            elif isinstance(params, list):
+                bound = inspect.signature(tool).bind(*params)
+            else:
+                raise TypeError("Params must be an object or array")
+        except TypeError as e:
+            return None if is_notification else _error(request_id, INVALID_PARAMS, str(e))
+        
+        try:
+            result = await asyncio.wait_for(tool(*bound.args, **bound.kwargs), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Tool {request['method']} timed out after {timeout}s")
+            return None if is_notification else _error(request_id, TIMEOUT_ERROR, f"Timed out after {timeout}s")
+        except Exception as e:
+            logger.error(f"Tool {request['method']} failed: {e}")
+            return None if is_notification else _error(request_id, INTERNAL_ERROR, str(e))
+        
+        return None if is_notification else {"jsonrpc": "2.0", "result": result, "id": request_id}
+
+
+def create_rpc_router(dispatcher: RPCDispatcher) -> APIRouter:
+    """Router with the POST /rpc endpoint answered by dispatcher"""
+    router = APIRouter()
+    
+    @router.post("/rpc")
+    async def rpc(request: Request, x_mcp_call_timeout: Optional[float] = Header(None, gt=0)):
+        """
+        JSON-RPC 2.0 endpoint for tool calls (single request or batch array)
+        
+        X-MCP-Call-Timeout (seconds) caps each call; calls that overrun are
+        answered with a timeout error while the rest of a batch completes.
+        """
+        try:
+            payload = json.loads(await request.body())
+        except ValueError:
+            return JSONResponse(_error(None, PARSE_ERROR, "Parse error"))
+        
+        result = await dispatcher.handle(payload, timeout=x_mcp_call_timeout)
+        if result is None:
+            return Response(status_code=204)
+        return JSONResponse(result)
+    
+    return router
@@ -12,6 +12,23 @@ from mcp_servers.shared.mock_data import mock_data
 mcp = FastMCP("Vertex AI ML Server")
 
 
+def _scenario_impact(scenario_parameters: dict) -> int:
+    """Mock risk score impact of a scenario (same for every SME)"""
+    impact = scenario_parameters.get("expected_impact", 0)
+    rate_change = scenario_parameters.get("rate_change", 0)
+    
+    # Interest rate scenarios
+    if rate_change != 0:
+        # Higher rates = higher risk for companies with debt
+        impact = rate_change * 8  # 1% rate = +8 risk points
+    
+    # Regulation scenarios
+    if scenario_parameters.get("regulation_type") == "product_ban":
+        impact = 15  # Significant impact
+    
+    return int(impact)
+
+
 @mcp.tool()
 async def predict_risk_score(
     sme_id: str,
@@ -33,21 +50,7 @@ async def predict_risk_score(
         return {"error": f"SME {sme_id} not found"}
     
     current_score = sme["risk_score"]
-    
-    # Mock scenario impact calculation
-    impact = scenario_parameters.get("expected_impact", 0)
-    rate_change = scenario_parameters.get("rate_change", 0)
-    
-    # Interest rate scenarios
-    if rate_change != 0:
-        # Higher rates = higher risk for companies with debt
-        impact = rate_change * 8  # 1% rate = +8 risk points
-    
-    # Regulation scenarios
-    if scenario_parameters.get("regulation_type") == "product_ban":
-        impact = 15  # Significant impact
-    
-    new_score = min(100, max(0, current_score + int(impact)))
+    new_score = min(100, max(0, current_score + _scenario_impact(scenario_parameters)))
     
     return {
         "sme_id": f"#{sme['id']}",
@@ -219,3 +222,45 @@ async def batch_score_portfolio(sme_ids: List[str]) -> List[dict]:
             })
     
     return results
+
+
+@mcp.tool()
+async def batch_predict_scenario_impact(
+    sme_ids: List[str],
+    scenario_parameters: dict
+) -> dict:
+    """
+    Predict risk scores under a scenario for many SMEs in one call
+    
+    Args:
+        sme_ids: SME identifiers
+        scenario_parameters: Scenario parameters affecting risk
+        
+    Returns:
+        Per-SME current and predicted scores, plus IDs not found
+    """
+    impact = _scenario_impact(scenario_parameters)
+    predictions = []
+    not_found = []
+    
+    for sme_id in sme_ids:
+        sme = mock_data.get_sme_by_id(sme_id)
+        if not sme:
+            not_found.append(sme_id)
+            continue
+        
+        new_score = min(100, max(0, sme["risk_score"] + impact))
+        predictions.append({
+            "sme_id": f"#{sme['id']}",
+            "sme_name": sme["name"],
+            "current_score": sme["risk_score"],
+            "predicted_score": new_score,
+            "change": new_score - sme["risk_score"],
+        })
+    
+    return {
+        "predictions": predictions,
+        "not_found": not_found,
+        "model_version": "risk_score_v3.2",
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
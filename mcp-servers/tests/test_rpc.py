@@ -0,0 +1,102 @@
+"""
+JSON-RPC dispatcher tests
+
+Run from mcp-servers/:
+    python -m pytest tests
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from shared.rpc import INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, TIMEOUT_ERROR, RPCDispatcher
+
+
+async def echo(value):
+    return value
+
+
+async def slow(value, delay=0.1):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def boom():
+    raise RuntimeError("source down")
+
+
+@pytest.fixture
+def dispatcher():
+    rpc = RPCDispatcher()
+    rpc.register("test_server", SimpleNamespace(echo=echo, slow=slow, boom=boom), ["echo", "slow", "boom"])
+    return rpc
+
+
+def request(method, id, **params):
+    return {"jsonrpc": "2.0", "method": f"test_server/{method}", "params": params, "id": id}
+
+
+@pytest.mark.asyncio
+async def test_single_request(dispatcher):
+    assert await dispatcher.handle(request("echo", 1, value="hi")) == {"jsonrpc": "2.0", "result": "hi", "id": 1}
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_calls_concurrently(dispatcher):
+    start = time.perf_counter()
+    responses = await dispatcher.handle([request("slow", i, value=i) for i in range(5)])
+    
+    # Five 0.1s calls in parallel, not back to back
+    assert time.perf_counter() - start < 0.3
+    assert [r["result"] for r in responses] == list(range(5))
+
+
+@pytest.mark.asyncio
+async def test_batch_responses_follow_request_order_by_id(dispatcher):
+    responses = await dispatcher.handle([
+        request("slow", "a", value=1, delay=0.05),
+        request("echo", "b", value=2),
+        request("slow", "c", value=3, delay=0.01),
+    ])
+    
+    assert [(r["id"], r["result"]) for r in responses] == [("a", 1), ("b", 2), ("c", 3)]
+
+
+@pytest.mark.asyncio
+async def test_per_call_timeout_only_fails_the_slow_call(dispatcher):
+    responses = await dispatcher.handle(
+        [request("slow", 1, value="late", delay=1.0), request("echo", 2, value="on time")],
+        timeout=0.05,
+    )
+    
+    assert responses[0]["id"] == 1 and responses[0]["error"]["code"] == TIMEOUT_ERROR
+    assert responses[1] == {"jsonrpc": "2.0", "result": "on time", "id": 2}
+
+
+@pytest.mark.asyncio
+async def test_errors_are_entries_of_the_batch(dispatcher):
+    responses = await dispatcher.handle([
+        request("missing", 1),
+        request("echo", 2),
+        request("boom", 3),
+        {"jsonrpc": "1.0", "method": "test_server/echo", "id": 4},
+        request("echo", 5, value="ok"),
+    ])
+    
+    assert [r["id"] for r in responses] == [1, 2, 3, 4, 5]
+    assert responses[0]["error"]["code"] == METHOD_NOT_FOUND
+    assert responses[1]["error"]["code"] == INVALID_PARAMS
+    assert responses[2]["error"]["message"] == "source down"
+    assert responses[3]["error"]["code"] == INVALID_REQUEST
+    assert responses[4]["result"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_notifications_get_no_response(dispatcher):
+    notification = {"jsonrpc": "2.0", "method": "test_server/echo", "params": {"value": 1}}
+    
+    assert await dispatcher.handle(notification) is None
+    assert await dispatcher.handle([notification, notification]) is None
+    assert [r["id"] for r in await dispatcher.handle([notification, request("echo", 7, value=1)])] == [7]
+    assert (await dispatcher.handle([]))["error"]["code"] == INVALID_REQUEST